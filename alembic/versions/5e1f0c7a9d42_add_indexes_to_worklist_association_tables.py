@@ -0,0 +1,39 @@
+"""Add indexes to worklist association tables
+
+Revision ID: 5e1f0c7a9d42
+Revises: 81002a25e3ae
+Create Date: 2026-10-16 14:02:51.447309
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e1f0c7a9d42"
+down_revision: Union[str, None] = "81002a25e3ae"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (worklist_id, order_id) is already indexed by
+    # uq_orderworklist_worklist_id_order_id
+    op.create_index(
+        "ix_orderworklist_order_id", "orderworklist", ["order_id"], unique=False
+    )
+    op.create_index(
+        "ix_userworklist_user_id_worklist_id",
+        "userworklist",
+        ["user_id", "worklist_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_userworklist_user_id_worklist_id", table_name="userworklist")
+    op.drop_index("ix_orderworklist_order_id", table_name="orderworklist")
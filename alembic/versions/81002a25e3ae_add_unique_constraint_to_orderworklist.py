@@ -0,0 +1,44 @@
+"""Add unique constraint to orderworklist
+
+Revision ID: 81002a25e3ae
+Revises: b4cb592db614
+Create Date: 2026-10-16 10:41:27.905114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "81002a25e3ae"
+down_revision: Union[str, None] = "b4cb592db614"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Remove duplicate memberships, keeping the oldest row of each
+    conn = op.get_bind()
+    conn.execute(
+        sa.text(
+            "DELETE FROM orderworklist WHERE id NOT IN "
+            "(SELECT MIN(id) FROM orderworklist GROUP BY worklist_id, order_id)"
+        )
+    )
+    # Batch mode recreates the table on SQLite, which cannot ALTER constraints
+    with op.batch_alter_table("orderworklist") as batch_op:
+        batch_op.create_unique_constraint(
+            "uq_orderworklist_worklist_id_order_id", ["worklist_id", "order_id"]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("orderworklist") as batch_op:
+        batch_op.drop_constraint(
+            "uq_orderworklist_worklist_id_order_id", type_="unique"
+        )
@@ -0,0 +1,44 @@
+"""Add order mirror reconcile and lock state
+
+Revision ID: 9a4f6c2e8b13
+Revises: e3b9f14c6a27
+Create Date: 2026-10-17 10:21:47.503118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4f6c2e8b13"
+down_revision: Union[str, None] = "e3b9f14c6a27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("restrack_orders_mirror_state") as batch_op:
+        batch_op.add_column(sa.Column("last_order_id", sa.Integer(), nullable=True))
+        batch_op.add_column(
+            sa.Column("last_reconciled_at", sa.DateTime(), nullable=True)
+        )
+        batch_op.add_column(sa.Column("locked_by", sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column("locked_until", sa.DateTime(), nullable=True))
+    # The sync lock is taken by updating this row, so it must exist up front
+    op.execute(
+        "INSERT INTO restrack_orders_mirror_state (id) SELECT 1 WHERE NOT EXISTS "
+        "(SELECT 1 FROM restrack_orders_mirror_state WHERE id = 1)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("restrack_orders_mirror_state") as batch_op:
+        batch_op.drop_column("locked_until")
+        batch_op.drop_column("locked_by")
+        batch_op.drop_column("last_reconciled_at")
+        batch_op.drop_column("last_order_id")
@@ -0,0 +1,67 @@
+"""Add order mirror tables
+
+Revision ID: b4cb592db614
+Revises: 42d974fafb08
+Create Date: 2026-10-16 09:12:04.318220
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b4cb592db614"
+down_revision: Union[str, None] = "42d974fafb08"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "restrack_orders_mirror",
+        sa.Column("order_id", sa.Integer(), nullable=False),
+        sa.Column("visit_id", sa.Integer(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("patient_id", sa.Integer(), nullable=True),
+        sa.Column("proc_id", sa.Integer(), nullable=False),
+        sa.Column("proc_name", sa.String(length=175), nullable=True),
+        sa.Column("order_entered_by", sa.Integer(), nullable=True),
+        sa.Column("order_requested_by", sa.Integer(), nullable=True),
+        sa.Column("event_event_id", sa.Integer(), nullable=True),
+        sa.Column("current_status", sa.Integer(), nullable=True),
+        sa.Column("order_datetime", sa.DateTime(), nullable=True),
+        sa.Column("event_datetime", sa.DateTime(), nullable=True),
+        sa.Column("cancelled", sa.DateTime(), nullable=True),
+        sa.Column("in_progress", sa.DateTime(), nullable=True),
+        sa.Column("partial", sa.DateTime(), nullable=True),
+        sa.Column("complete", sa.DateTime(), nullable=True),
+        sa.Column("supplemental", sa.DateTime(), nullable=True),
+        sa.Column("last_edit_time", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("order_id"),
+    )
+    op.create_index(
+        "ix_restrack_orders_mirror_patient_id",
+        "restrack_orders_mirror",
+        ["patient_id"],
+    )
+    op.create_table(
+        "restrack_orders_mirror_state",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("watermark", sa.DateTime(), nullable=True),
+        sa.Column("last_synced_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("restrack_orders_mirror_state")
+    op.drop_index(
+        "ix_restrack_orders_mirror_patient_id", table_name="restrack_orders_mirror"
+    )
+    op.drop_table("restrack_orders_mirror")
@@ -0,0 +1,51 @@
+"""Add worklist stats table
+
+Revision ID: c7d2a8e41b06
+Revises: 5e1f0c7a9d42
+Create Date: 2026-10-16 15:26:10.582931
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d2a8e41b06"
+down_revision: Union[str, None] = "5e1f0c7a9d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "worklist_stats",
+        sa.Column("worklist_id", sa.Integer(), nullable=False),
+        sa.Column("order_count", sa.Integer(), nullable=False),
+        sa.Column("patient_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["worklist_id"], ["worklist.id"]),
+        sa.PrimaryKeyConstraint("worklist_id"),
+    )
+    # Every worklist gets a row here; new ones get theirs when created.
+    # Patients cannot be counted until orderworklist.patient_id exists, so
+    # patient_count starts at 0 and is counted by d5f8b3a1c902.
+    conn = op.get_bind()
+    conn.execute(
+        sa.text(
+            "INSERT INTO worklist_stats "
+            "(worklist_id, order_count, patient_count, updated_at) "
+            "SELECT worklist.id, COUNT(orderworklist.id), 0, CURRENT_TIMESTAMP "
+            "FROM worklist "
+            "LEFT JOIN orderworklist ON orderworklist.worklist_id = worklist.id "
+            "GROUP BY worklist.id"
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("worklist_stats")
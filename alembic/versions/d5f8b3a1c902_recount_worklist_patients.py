@@ -0,0 +1,38 @@
+"""Recount worklist patients
+
+Revision ID: d5f8b3a1c902
+Revises: 9a4f6c2e8b13
+Create Date: 2026-10-17 14:05:12.318640
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5f8b3a1c902"
+down_revision: Union[str, None] = "9a4f6c2e8b13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # c7d2a8e41b06 seeded patient_count as 0 because orderworklist.patient_id
+    # did not exist yet. Count each worklist's distinct patients now; orders
+    # still without a patient_id are counted by scripts/backfill_order_keys.py,
+    # which refreshes the stats once it has filled them in.
+    op.execute(
+        "UPDATE worklist_stats SET patient_count = ("
+        "SELECT COUNT(DISTINCT orderworklist.patient_id) FROM orderworklist "
+        "WHERE orderworklist.worklist_id = worklist_stats.worklist_id"
+        "), updated_at = CURRENT_TIMESTAMP"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The counts are data, not schema; nothing to undo
+    pass
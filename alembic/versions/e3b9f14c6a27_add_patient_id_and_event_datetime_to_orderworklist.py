@@ -0,0 +1,46 @@
+"""Add patient_id and event_datetime to orderworklist
+
+Revision ID: e3b9f14c6a27
+Revises: c7d2a8e41b06
+Create Date: 2026-10-16 16:48:33.910274
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3b9f14c6a27"
+down_revision: Union[str, None] = "c7d2a8e41b06"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows are filled in by scripts/backfill_order_keys.py
+    op.add_column("orderworklist", sa.Column("patient_id", sa.Integer(), nullable=True))
+    op.add_column(
+        "orderworklist", sa.Column("event_datetime", sa.DateTime(), nullable=True)
+    )
+    op.create_index(
+        "ix_orderworklist_patient_id", "orderworklist", ["patient_id"], unique=False
+    )
+    op.create_index(
+        "ix_orderworklist_worklist_id_patient_id",
+        "orderworklist",
+        ["worklist_id", "patient_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_orderworklist_worklist_id_patient_id", table_name="orderworklist")
+    op.drop_index("ix_orderworklist_patient_id", table_name="orderworklist")
+    with op.batch_alter_table("orderworklist") as batch_op:
+        batch_op.drop_column("event_datetime")
+        batch_op.drop_column("patient_id")
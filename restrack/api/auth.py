@@ -5,6 +5,9 @@ This module provides authentication-related functionality for the ResTrack API:
 - JWT token generation and validation
 - User authentication endpoints
 - Authentication dependencies for other API endpoints
+
+A request is authenticated once: its token is decoded and its user looked up
+into the shared AuthContext, which every later check reuses.
 """
 
 from datetime import timedelta
@@ -14,15 +17,15 @@ from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlmodel import Session
 
 from restrack.auth import (
-    verify_password,
+    verify_password_async,
     create_access_token,
     decode_token,
-    get_token_from_request,
+    get_auth_context,
     ACCESS_TOKEN_EXPIRE_MINUTES,
 )
 from restrack.models.worklist import User, UserSecure
-from restrack.api.core import get_app_db_session
-from restrack.api.routers.users import get_user_by_username
+from restrack.api.core import get_app_db_session, run_in_db_thread
+from restrack.api.routers.users import get_cached_user, peek_cached_user
 
 router = APIRouter(tags=["authentication"])
 
@@ -43,19 +46,43 @@ async def get_current_user_from_token(
     if not token_data:
         return None
 
-    username = token_data.username
+    return await load_user(token_data.username, session)
 
-    if not session:
-        session = next(get_app_db_session())
 
-    # Get user from database
+async def load_user(username: str, session: Session = None):
+    """
+    Get a user by username from the cache, or the database on a miss
+    """
+    # A cache hit needs no worker thread
+    user = peek_cached_user(username)
+    if user is not None:
+        return user
     try:
-        return get_user_by_username(username, session)
+        return await run_in_db_thread(get_cached_user, username, session)
     except HTTPException:
         # Fallback for development
         return User(id=1, username=username, email=f"{username}@example.com")
 
 
+async def get_request_user(request: Request, session: Session = None):
+    """
+    Get the user of a request, looking them up at most once per request
+
+    Args:
+        request (Request): The request, authenticated through its AuthContext.
+        session (Session | None): The session used if the user is not cached.
+
+    Returns:
+        User | None: The user, or None if the request has no valid token.
+    """
+    context = await get_auth_context(request)
+    if not context.user_loaded:
+        if context.claims:
+            context.user = await load_user(context.claims.username, session)
+        context.user_loaded = True
+    return context.user
+
+
 async def get_current_api_user(
     request: Request,
     token: str = Depends(oauth2_scheme),
@@ -64,18 +91,15 @@ async def get_current_api_user(
     """
     Dependency to get the current user for protected API endpoints
     """
-    # If no token from oauth2_scheme, try to get from request
-    if not token:
-        token = await get_token_from_request(request)
-
-    if not token:
+    context = await get_auth_context(request)
+    if not context.token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = await get_current_user_from_token(token, session)
+    user = await get_request_user(request, session)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -95,7 +119,7 @@ async def login(
     Generate a JWT token for authentication
     """
     # Use the database-backed password verification
-    if not verify_password(form_data.username, form_data.password, session):
+    if not await verify_password_async(form_data.username, form_data.password, session):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -117,17 +141,15 @@ async def get_current_user_api(
     token: str = Depends(oauth2_scheme),
 ):
     """Get the currently authenticated user"""
-    if not token:
-        token = await get_token_from_request(request)
-
-    if not token:
+    context = await get_auth_context(request)
+    if not context.token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = await get_current_user_from_token(token)
+    user = await get_request_user(request)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -146,15 +168,11 @@ async def jwt_auth_middleware(request: Request, call_next):
     if request.url.path == "/api/v1/token":
         return await call_next(request)
 
-    # Get token from request
-    token = await get_token_from_request(request)
-
-    # Store user in request state if authenticated
-    if token:
-        user = await get_current_user_from_token(token)
-        if user:
-            # Store user in request state for later use if needed
-            request.state.user = user
+    # Resolve the user once, for the dependencies and handlers that follow
+    user = await get_request_user(request)
+    if user:
+        # Store user in request state for later use if needed
+        request.state.user = user
 
     # Continue processing the request
     return await call_next(request)
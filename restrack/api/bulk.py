@@ -0,0 +1,136 @@
+"""
+Set-based bulk operations for the ResTrack API.
+
+This module provides statement-level alternatives to per-row ORM loops:
+- Inserting many rows while skipping those that already exist
+- Updating every row whose key is in a list with chunked UPDATE statements
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence, Type
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, SQLModel, insert, select, update
+
+from restrack.api.core import IN_CHUNK_SIZE, chunked
+
+# Times a chunk is retried when a concurrent insert claims one of its keys
+# between the existing-key lookup and the INSERT
+INSERT_IGNORE_ATTEMPTS = 3
+
+
+def _rows_per_statement(rows: List[Dict]) -> int:
+    """Rows per multi-VALUES statement that keep bound parameters in bounds."""
+    return max(1, IN_CHUNK_SIZE // max(len(rows[0]), 1))
+
+
+def insert_ignore(
+    session: Session,
+    model: Type[SQLModel],
+    rows: List[Dict],
+    conflict_columns: Sequence[str],
+) -> int:
+    """
+    Insert rows, skipping any that would violate a unique constraint.
+
+    SQLite and PostgreSQL use INSERT ... ON CONFLICT DO NOTHING. Other
+    dialects, SQL Server included, look up the existing keys of each chunk
+    and insert the rest, see _insert_missing. The caller commits.
+
+    Args:
+        session (Session): The database session.
+        model (type): The table model to insert into.
+        rows (list[dict]): Column values for each row.
+        conflict_columns (Sequence[str]): Columns of the unique constraint.
+
+    Returns:
+        int: The number of rows inserted.
+    """
+    if not rows:
+        return 0
+
+    dialect = session.get_bind().dialect.name
+    inserted = 0
+    for chunk in chunked(rows, _rows_per_statement(rows)):
+        if dialect in ("sqlite", "postgresql"):
+            dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+            statement = (
+                dialect_insert(model)
+                .values(chunk)
+                .on_conflict_do_nothing(index_elements=list(conflict_columns))
+            )
+            inserted += session.exec(statement).rowcount
+        else:
+            inserted += _insert_missing(session, model, chunk, conflict_columns)
+    return inserted
+
+
+def _insert_missing(
+    session: Session,
+    model: Type[SQLModel],
+    rows: List[Dict],
+    conflict_columns: Sequence[str],
+) -> int:
+    """
+    Insert the rows whose keys are not in the table yet.
+
+    A concurrent transaction can insert one of the keys after they are read.
+    The INSERT then fails on the unique constraint, so it runs in a SAVEPOINT
+    and the chunk is retried with the keys read again.
+
+    Raises:
+        IntegrityError: If the chunk still conflicts after
+            INSERT_IGNORE_ATTEMPTS attempts.
+    """
+    key_columns = [getattr(model, column) for column in conflict_columns]
+    keys = [tuple(row[column] for column in conflict_columns) for row in rows]
+    # Per-column IN lists, as not every dialect supports tuple IN
+    candidates = select(*key_columns).where(
+        *(column.in_({key[i] for key in keys}) for i, column in enumerate(key_columns))
+    )
+    for attempt in range(1, INSERT_IGNORE_ATTEMPTS + 1):
+        existing = set(tuple(row) for row in session.exec(candidates))
+        new_rows = [row for row, key in zip(rows, keys) if key not in existing]
+        if not new_rows:
+            return 0
+        try:
+            with session.begin_nested():
+                session.exec(insert(model).values(new_rows))
+        except IntegrityError:
+            if attempt == INSERT_IGNORE_ATTEMPTS:
+                raise
+            continue
+        return len(new_rows)
+
+
+def bulk_update(
+    session: Session,
+    model: Type[SQLModel],
+    key_column: str,
+    keys: Iterable[Any],
+    values: Dict[str, Any],
+    conditions: Sequence = (),
+) -> int:
+    """
+    Set columns on every row whose `key_column` is in `keys`.
+
+    Emits one UPDATE ... WHERE key IN (...) per chunk of keys instead of
+    loading and mutating ORM objects. The caller commits.
+
+    Args:
+        session (Session): The database session.
+        model (type): The table model to update.
+        key_column (str): The column matched against `keys`.
+        keys (Iterable): The key values of the rows to update.
+        values (dict): The columns to set and their new values.
+        conditions (Sequence): Extra WHERE clauses applied to every chunk.
+
+    Returns:
+        int: The number of rows updated.
+    """
+    column = getattr(model, key_column)
+    updated = 0
+    for chunk in chunked(dict.fromkeys(keys)):
+        statement = update(model).where(column.in_(chunk), *conditions).values(**values)
+        updated += session.exec(statement).rowcount
+    return updated
@@ -3,16 +3,25 @@ Core components for the ResTrack API.
 
 This module provides the core functionality for the ResTrack API, including:
 - Database session management
+- Running blocking database calls off the event loop
+- Connection pool metrics
 - Database engine configuration
 - Lifespan context manager for startup/shutdown tasks
 - Shared logging configuration
 """
 
+import asyncio
+import functools
 import os
 import logging
+import time
 from contextlib import asynccontextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
 
+import anyio
+import anyio.to_thread
 from fastapi import FastAPI
+from sqlalchemy import Engine, event, text
 from sqlmodel import Session, SQLModel, create_engine
 
 # Configure logging
@@ -24,9 +33,194 @@ DB_RESTRACK = os.getenv("DB_RESTRACK", "sqlite:///restrack.db")
 DB_OMOP = os.getenv("DB_CDM")
 print ("omop db",DB_OMOP)
 
+# Maximum number of bound parameters sent in a single IN (...) clause
+IN_CHUNK_SIZE = int(os.getenv("DB_IN_CHUNK_SIZE", "500"))
+
+# Maximum number of threads running blocking database calls for async handlers
+DB_THREAD_LIMIT = int(os.getenv("DB_THREAD_LIMIT", "16"))
+
+
+
+def create_db_engine(url: str, prefix: str) -> Engine:
+    """
+    Create a database engine with pool settings read from the environment.
+
+    The settings are read from variables named after `prefix`, e.g.
+    DB_CDM_POOL_SIZE for prefix "DB_CDM":
+    - POOL_SIZE, MAX_OVERFLOW: connections kept open and extra connections
+      allowed under load (ignored for SQLite, which SQLAlchemy pools itself)
+    - POOL_RECYCLE: seconds after which a connection is replaced, to stay
+      below the server's idle timeout (-1 disables)
+    - POOL_PRE_PING: test connections on checkout and replace dead ones
+    - QUERY_TIMEOUT: seconds before a query is cancelled (0 disables, pyodbc
+      connections only)
+
+    Args:
+        url (str): The database URL.
+        prefix (str): The environment variable prefix.
+
+    Returns:
+        Engine: The configured engine.
+    """
+    options = {
+        "pool_pre_ping": os.getenv(f"{prefix}_POOL_PRE_PING", "true").lower()
+        in ("1", "true", "yes"),
+        "pool_recycle": int(os.getenv(f"{prefix}_POOL_RECYCLE", "1800")),
+    }
+    if not url.startswith("sqlite"):
+        options["pool_size"] = int(os.getenv(f"{prefix}_POOL_SIZE", "5"))
+        options["max_overflow"] = int(os.getenv(f"{prefix}_MAX_OVERFLOW", "10"))
+    engine = create_engine(url, **options)
+
+    query_timeout = int(os.getenv(f"{prefix}_QUERY_TIMEOUT", "0"))
+    if query_timeout and engine.dialect.driver == "pyodbc":
+
+        def set_query_timeout(dbapi_connection, connection_record):
+            dbapi_connection.timeout = query_timeout
+
+        event.listen(engine, "connect", set_query_timeout)
+    return engine
+
+
 # Create database engines
-local_engine = create_engine(DB_RESTRACK)
-remote_engine = create_engine(DB_OMOP)
+local_engine = create_db_engine(DB_RESTRACK, "DB_RESTRACK")
+remote_engine = create_db_engine(DB_OMOP, "DB_CDM")
+
+# Connections opened per engine when the app starts
+DB_POOL_WARMUP = int(os.getenv("DB_POOL_WARMUP", "1"))
+
+# Cumulative pool events per engine, see pool_metrics()
+_pool_counters: Dict[str, Dict[str, int]] = {}
+
+
+def _count_pool_events(engine: Engine, name: str) -> None:
+    """Count connection checkouts and checkins of an engine's pool."""
+    counters = _pool_counters.setdefault(name, {"checkouts": 0, "checkins": 0})
+
+    def on_checkout(*args):
+        counters["checkouts"] += 1
+
+    def on_checkin(*args):
+        counters["checkins"] += 1
+
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "checkin", on_checkin)
+
+
+_count_pool_events(local_engine, "local")
+_count_pool_events(remote_engine, "remote")
+
+
+def pool_metrics() -> Dict[str, dict]:
+    """
+    Report the connection pool state of both engines.
+
+    Returns:
+        dict: Per engine ("local", "remote"), the pool size, connections
+            checked out and idle in the pool, current overflow, and the total
+            checkouts and checkins since start. Values a pool type does not
+            track are None.
+    """
+    metrics = {}
+    for name, engine in (("local", local_engine), ("remote", remote_engine)):
+        pool = engine.pool
+
+        def read(attribute):
+            method = getattr(pool, attribute, None)
+            return method() if method else None
+
+        metrics[name] = {
+            "pool": type(pool).__name__,
+            "size": read("size"),
+            "checked_out": read("checkedout"),
+            "checked_in": read("checkedin"),
+            "overflow": read("overflow"),
+            **_pool_counters[name],
+        }
+    return metrics
+
+
+def check_engine(engine: Engine) -> dict:
+    """
+    Run a trivial query on an engine and time the round trip.
+
+    Returns:
+        dict: "ok", the round-trip "latency_ms" and, on failure, the "error".
+    """
+    started = time.perf_counter()
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except Exception as e:
+        return {"ok": False, "latency_ms": None, "error": str(e)}
+    latency_ms = round((time.perf_counter() - started) * 1000, 2)
+    return {"ok": True, "latency_ms": latency_ms, "error": None}
+
+
+def warm_up_engine(engine: Engine, connections: int = DB_POOL_WARMUP) -> None:
+    """
+    Open and test `connections` connections so the first requests do not pay
+    for connecting. Failures are logged, as the app can start without the
+    database and connect later.
+    """
+    opened = []
+    try:
+        for _ in range(connections):
+            connection = engine.connect()
+            opened.append(connection)
+            connection.execute(text("SELECT 1"))
+    except Exception as e:
+        logger.error(f"Database warm-up failed for {engine.url!r}: {e}")
+    finally:
+        for connection in opened:
+            connection.close()
+
+
+def chunked(items: Iterable, size: int = IN_CHUNK_SIZE) -> Iterator[List]:
+    """
+    Split an iterable into lists of at most `size` items.
+
+    Used to keep IN (...) clauses below the bound parameter limits of the
+    database drivers (e.g. 999 for older SQLite, 2100 for SQL Server).
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+T = TypeVar("T")
+
+_db_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+async def run_in_db_thread(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking database call in a worker thread and await its result.
+
+    Async handlers must not call SQLModel directly, as a slow query would block
+    the event loop and every other request with it. The calls share a pool of
+    at most DB_THREAD_LIMIT threads, separate from FastAPI's own thread pool.
+
+    Args:
+        func (Callable): The blocking function to call.
+        *args: Positional arguments for `func`.
+        **kwargs: Keyword arguments for `func`.
+
+    Returns:
+        The return value of `func`.
+    """
+    global _db_limiter
+    if _db_limiter is None:
+        # Created lazily, as a limiter must be created inside the event loop
+        _db_limiter = anyio.CapacityLimiter(DB_THREAD_LIMIT)
+    return await anyio.to_thread.run_sync(
+        functools.partial(func, *args, **kwargs), limiter=_db_limiter
+    )
 
 
 def get_app_db_session():
@@ -40,6 +234,11 @@ def get_app_db_session():
 def get_remote_db_session():
     """
     Dependency that provides a database session to the OMOP database.
+
+    The session only checks out a connection when it first runs a query, so
+    requests that never read ORDER hold no remote connection. The connection
+    goes back to the pool when the request finishes. Use it through Depends;
+    calling next() on it directly never closes the session.
     """
     with Session(remote_engine) as session:
         yield session
@@ -49,14 +248,24 @@ def get_remote_db_session():
 async def lifespan(app: FastAPI):
     """
     Context manager for the FastAPI application lifespan.
-    Initializes the database and disposes of the engine on shutdown.
+    Initializes the database, warms up the connection pools, starts the ORDER
+    mirror sync when enabled and disposes of the engines on shutdown.
     """
+    from restrack.api.mirror import ORDER_MIRROR_ENABLED, run_order_mirror_sync
+
+    mirror_task = None
     try:
         SQLModel.metadata.create_all(local_engine)
     except Exception as e:
         logger.error(f"Database initialization error: {e}")
     finally:
+        for engine in (local_engine, remote_engine):
+            await run_in_db_thread(warm_up_engine, engine)
+        if ORDER_MIRROR_ENABLED:
+            mirror_task = asyncio.create_task(run_order_mirror_sync())
         yield
     # Cleanup on shutdown
+    if mirror_task:
+        mirror_task.cancel()
     local_engine.dispose()
     remote_engine.dispose()
@@ -0,0 +1,146 @@
+"""
+Filtering and sorting of worklist orders.
+
+Filters are split by where their columns live, so each is applied in SQL on
+the database holding it:
+- user status, priority (and a coarse event date check) on the local
+  OrderWorkList rows, before any order IDs are sent to the remote database
+- system status, event date range and procedure name on the ORDER query
+
+Pages can be sorted by any of these columns. ORDER columns are sorted by the
+remote query; status and priority are sorted locally.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Type
+
+from fastapi import HTTPException, Query
+from sqlmodel import or_
+
+from restrack.api.pagination import DEFAULT_SORT_FIELD
+from restrack.models.cdm import ORDER_BASE
+from restrack.models.worklist import OrderWorkList
+
+# Sortable columns of ORDER
+REMOTE_SORT_FIELDS = ("event_datetime", "current_status", "proc_name")
+# Sortable columns of OrderWorkList
+LOCAL_SORT_FIELDS = ("status", "priority")
+
+
+@dataclass
+class OrderFilters:
+    """
+    Filters and sort order for a worklist's orders. Unset filters match all.
+
+    Attributes:
+        current_status (list[int] | None): System status codes to include.
+        status (list[str] | None): User statuses to include.
+        priority (list[str] | None): Priorities to include.
+        event_from (datetime | None): Earliest event_datetime, inclusive.
+        event_to (datetime | None): Latest event_datetime, inclusive.
+        proc_name (str | None): Text the procedure name must contain.
+        sort (str): Column to sort by.
+        descending (bool): Whether to sort in descending order.
+    """
+
+    current_status: Optional[List[int]] = None
+    status: Optional[List[str]] = None
+    priority: Optional[List[str]] = None
+    event_from: Optional[datetime] = None
+    event_to: Optional[datetime] = None
+    proc_name: Optional[str] = None
+    sort: str = DEFAULT_SORT_FIELD
+    descending: bool = True
+
+    @property
+    def sorts_locally(self) -> bool:
+        """Whether the sort column is held in the local database."""
+        return self.sort in LOCAL_SORT_FIELDS
+
+    @property
+    def is_default_sort(self) -> bool:
+        return self.sort == DEFAULT_SORT_FIELD and self.descending
+
+    def local_conditions(self) -> list:
+        """WHERE clauses on OrderWorkList."""
+        conditions = []
+        if self.status:
+            conditions.append(OrderWorkList.status.in_(self.status))
+        if self.priority:
+            conditions.append(OrderWorkList.priority.in_(self.priority))
+        # Memberships recorded before event_datetime was stored have none, so
+        # they are kept here and filtered by the remote query
+        if self.event_from:
+            conditions.append(
+                or_(
+                    OrderWorkList.event_datetime == None,  # noqa ruff:e711
+                    OrderWorkList.event_datetime >= self.event_from,
+                )
+            )
+        if self.event_to:
+            conditions.append(
+                or_(
+                    OrderWorkList.event_datetime == None,  # noqa ruff:e711
+                    OrderWorkList.event_datetime <= self.event_to,
+                )
+            )
+        return conditions
+
+    def remote_conditions(self, model: Type[ORDER_BASE]) -> list:
+        """WHERE clauses on ORDER, or ORDER_MIRROR."""
+        conditions = []
+        if self.current_status:
+            conditions.append(model.current_status.in_(self.current_status))
+        if self.event_from:
+            conditions.append(model.event_datetime >= self.event_from)
+        if self.event_to:
+            conditions.append(model.event_datetime <= self.event_to)
+        if self.proc_name:
+            conditions.append(model.proc_name.contains(self.proc_name, autoescape=True))
+        return conditions
+
+
+def order_filters(
+    current_status: Optional[List[int]] = Query(
+        None, description="System status codes to include"
+    ),
+    status: Optional[List[str]] = Query(None, description="User statuses to include"),
+    priority: Optional[List[str]] = Query(None, description="Priorities to include"),
+    event_from: Optional[datetime] = Query(
+        None, description="Earliest event datetime, inclusive"
+    ),
+    event_to: Optional[datetime] = Query(
+        None, description="Latest event datetime, inclusive"
+    ),
+    proc_name: Optional[str] = Query(
+        None, description="Text the procedure name must contain"
+    ),
+    sort: Optional[str] = Query(
+        None,
+        description="Column to sort by, prefixed with - for descending. "
+        "Defaults to -event_datetime.",
+    ),
+) -> OrderFilters:
+    """
+    Dependency reading OrderFilters from the query string.
+
+    Raises:
+        HTTPException: If `sort` names an unsortable column, a 400 error is raised.
+    """
+    filters = OrderFilters(
+        current_status=current_status,
+        status=status,
+        priority=priority,
+        event_from=event_from,
+        event_to=event_to,
+        proc_name=proc_name or None,
+    )
+    if sort:
+        filters.descending = sort.startswith("-")
+        filters.sort = sort.lstrip("-+")
+        if filters.sort not in REMOTE_SORT_FIELDS + LOCAL_SORT_FIELDS:
+            raise HTTPException(
+                status_code=400, detail=f"Cannot sort orders by {filters.sort}"
+            )
+    return filters
@@ -0,0 +1,101 @@
+"""
+Background jobs for the ResTrack API.
+
+This module runs long operations off the request path:
+- Starting a job on a small shared thread pool
+- Tracking each job's state and progress in memory
+- Looking up a job by ID so clients can poll for progress
+
+Job state lives in the process, so it is lost on restart and is not shared
+between workers.
+"""
+
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from restrack.api.core import logger
+
+# Threads available to background jobs
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+# Finished jobs kept for polling before the oldest are discarded
+JOB_HISTORY = int(os.getenv("JOB_HISTORY", "100"))
+
+_executor = ThreadPoolExecutor(
+    max_workers=max(JOB_WORKERS, 1), thread_name_prefix="job"
+)
+_jobs: Dict[str, dict] = {}
+_lock = threading.Lock()
+
+Progress = Callable[[int, Optional[int]], None]
+
+
+def _update(job_id: str, **values) -> None:
+    with _lock:
+        _jobs[job_id].update(values)
+
+
+def _prune() -> None:
+    """Drop the oldest finished jobs beyond JOB_HISTORY. Call with _lock held."""
+    finished = [job for job in _jobs.values() if job["finished_at"] is not None]
+    finished.sort(key=lambda job: job["finished_at"])
+    for job in finished[: max(len(finished) - JOB_HISTORY, 0)]:
+        del _jobs[job["id"]]
+
+
+def start_job(kind: str, target: Callable[[Progress], Any], **details) -> dict:
+    """
+    Run `target(progress)` on the job pool.
+
+    `target` reports progress by calling `progress(done, total)` and its return
+    value becomes the job result.
+
+    Args:
+        kind (str): A short name for the kind of job, e.g. "delete_worklist".
+        target (Callable): The work to run.
+        **details: Extra values stored with the job, e.g. the worklist ID.
+
+    Returns:
+        dict: A snapshot of the new job.
+    """
+    job_id = uuid.uuid4().hex
+    job = {
+        "id": job_id,
+        "kind": kind,
+        "status": "pending",
+        "done": 0,
+        "total": None,
+        "result": None,
+        "error": None,
+        "created_at": datetime.now(),
+        "finished_at": None,
+        **details,
+    }
+    with _lock:
+        _prune()
+        _jobs[job_id] = job
+
+    def progress(done: int, total: Optional[int] = None) -> None:
+        _update(job_id, done=done, total=total)
+
+    def run():
+        _update(job_id, status="running")
+        try:
+            result = target(progress)
+            _update(job_id, status="done", result=result, finished_at=datetime.now())
+        except Exception as e:
+            logger.error(f"Job {job_id} ({kind}) failed: {str(e)}")
+            _update(job_id, status="failed", error=str(e), finished_at=datetime.now())
+
+    _executor.submit(run)
+    return get_job(job_id)
+
+
+def get_job(job_id: str) -> Optional[dict]:
+    """Return a snapshot of a job, or None if it is unknown."""
+    with _lock:
+        job = _jobs.get(job_id)
+        return dict(job) if job else None
@@ -12,6 +12,8 @@ from .auth import router as auth_router, jwt_auth_middleware, get_current_api_us
 from .routers.users import router as users_router
 from .routers.worklists import router as worklists_router
 from .routers.orders import router as orders_router
+from .routers.jobs import router as jobs_router
+from .routers.health import router as health_router
 
 # Create the main FastAPI application
 app = FastAPI(
@@ -29,3 +31,5 @@ app.include_router(auth_router)
 app.include_router(users_router)
 app.include_router(worklists_router)
 app.include_router(orders_router)
+app.include_router(jobs_router)
+app.include_router(health_router)
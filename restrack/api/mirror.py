@@ -0,0 +1,364 @@
+"""
+Local ORDER mirror for the ResTrack API.
+
+This module keeps a copy of the remote ORDER table in the application database:
+- Incremental sync using ORDER.updated_at / ORDER.last_edit_time as a
+  watermark, committed batch by batch so an interrupted sync resumes. Rows
+  with neither timestamp are tracked by order_id instead
+- A periodic reconcile pass removing mirror rows deleted from the remote table
+- A lock on the mirror state row, so only one worker syncs at a time
+- A background loop that runs the sync at a fixed interval
+- Choosing between the mirror and the remote database based on staleness
+"""
+
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import Optional, Set, Tuple, Type
+from uuid import uuid4
+
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, and_, case, delete, func, insert, or_, select, update
+
+from restrack.models.cdm import ORDER, ORDER_BASE, ORDER_MIRROR, ORDER_MIRROR_STATE
+from restrack.api.core import chunked, local_engine, logger, remote_engine
+
+ORDER_MIRROR_ENABLED = os.getenv("ORDER_MIRROR_ENABLED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Seconds between background sync cycles
+ORDER_MIRROR_SYNC_INTERVAL = int(os.getenv("ORDER_MIRROR_SYNC_INTERVAL", "300"))
+# Seconds after the last successful sync beyond which reads go to the remote DB
+ORDER_MIRROR_MAX_STALENESS = int(os.getenv("ORDER_MIRROR_MAX_STALENESS", "900"))
+# Rows pulled from the remote cursor and written to the mirror per batch
+ORDER_MIRROR_BATCH_SIZE = int(os.getenv("ORDER_MIRROR_BATCH_SIZE", "5000"))
+# Seconds between passes removing mirror rows deleted remotely (0 runs one
+# after every sync)
+ORDER_MIRROR_RECONCILE_INTERVAL = int(
+    os.getenv("ORDER_MIRROR_RECONCILE_INTERVAL", "3600")
+)
+# Seconds a sync may go without committing a batch before another worker may
+# take its lock over
+ORDER_MIRROR_LOCK_TIMEOUT = int(os.getenv("ORDER_MIRROR_LOCK_TIMEOUT", "600"))
+
+
+def _changed_at(row) -> Optional[datetime]:
+    """Return the latest change timestamp of a remote ORDER row."""
+    timestamps = [t for t in (row["updated_at"], row["last_edit_time"]) if t]
+    return max(timestamps) if timestamps else None
+
+
+def _remote_changed_at():
+    """The latest change timestamp of a remote ORDER row, as a SQL expression."""
+    return case(
+        (ORDER.last_edit_time > ORDER.updated_at, ORDER.last_edit_time),
+        else_=func.coalesce(ORDER.updated_at, ORDER.last_edit_time),
+    )
+
+
+def _write_batch(local: Session, rows: list) -> None:
+    """Replace the mirror rows for a batch of remote rows."""
+    columns = ORDER_MIRROR.__table__.columns
+    for ids in chunked([row["order_id"] for row in rows]):
+        local.exec(delete(ORDER_MIRROR).where(ORDER_MIRROR.order_id.in_(ids)))
+    # Bound parameters per statement stay below the SQLite limit
+    for batch in chunked(rows, max(1, 900 // len(columns))):
+        local.exec(insert(ORDER_MIRROR).values(batch))
+
+
+def _get_state(local: Session) -> ORDER_MIRROR_STATE:
+    """Return the mirror state row, creating it if needed."""
+    state = local.get(ORDER_MIRROR_STATE, 1)
+    if state is None:
+        local.add(ORDER_MIRROR_STATE(id=1))
+        try:
+            local.commit()
+        except IntegrityError:
+            # Another worker created it first
+            local.rollback()
+        state = local.get(ORDER_MIRROR_STATE, 1)
+    return state
+
+
+def _acquire_lock(local: Session, owner: str) -> bool:
+    """
+    Take the sync lock for `owner` unless another worker holds it.
+
+    The lock is a conditional UPDATE of the state row, so it holds across
+    processes. A lock not renewed within ORDER_MIRROR_LOCK_TIMEOUT is taken
+    over, so a crashed worker cannot block the sync for good.
+    """
+    _get_state(local)
+    now = datetime.now()
+    result = local.exec(
+        update(ORDER_MIRROR_STATE)
+        .where(
+            ORDER_MIRROR_STATE.id == 1,
+            or_(
+                ORDER_MIRROR_STATE.locked_until == None,  # noqa ruff:e711
+                ORDER_MIRROR_STATE.locked_until < now,
+            ),
+        )
+        .values(
+            locked_by=owner,
+            locked_until=now + timedelta(seconds=ORDER_MIRROR_LOCK_TIMEOUT),
+        )
+    )
+    local.commit()
+    return result.rowcount == 1
+
+
+def _renew_lock(local: Session, owner: str) -> None:
+    """
+    Extend the sync lock within the current transaction.
+
+    Raises:
+        RuntimeError: If the lock expired and another worker took it over.
+    """
+    result = local.exec(
+        update(ORDER_MIRROR_STATE)
+        .where(ORDER_MIRROR_STATE.id == 1, ORDER_MIRROR_STATE.locked_by == owner)
+        .values(
+            locked_until=datetime.now() + timedelta(seconds=ORDER_MIRROR_LOCK_TIMEOUT)
+        )
+    )
+    if result.rowcount != 1:
+        raise RuntimeError("Order mirror sync lock was taken over by another worker")
+
+
+def _release_lock(local: Session, owner: str) -> None:
+    """Release the sync lock if `owner` still holds it."""
+    local.rollback()
+    local.exec(
+        update(ORDER_MIRROR_STATE)
+        .where(ORDER_MIRROR_STATE.id == 1, ORDER_MIRROR_STATE.locked_by == owner)
+        .values(locked_by=None, locked_until=None)
+    )
+    local.commit()
+
+
+def sync_order_mirror(full: bool = False) -> Optional[dict]:
+    """
+    Pull ORDER rows changed since the last sync into the local mirror.
+
+    Rows are read oldest change first and each batch is committed with its
+    latest change timestamp as the watermark. Rows with neither timestamp
+    come last, by order_id, and the highest one synced is kept alongside the
+    watermark. The local write lock is only held for one batch at a time, and
+    a sync that is interrupted resumes from the last committed batch.
+
+    When a full sync is requested, or ORDER_MIRROR_RECONCILE_INTERVAL has
+    passed since the last one, mirror rows deleted remotely are removed too.
+
+    Only one worker syncs at a time, see _acquire_lock.
+
+    Args:
+        full (bool): Ignore the watermark and copy the whole remote table.
+
+    Returns:
+        dict | None: The number of rows synced and removed, the new watermark
+            and sync time. None if another worker is already syncing.
+    """
+    owner = uuid4().hex
+    with Session(local_engine) as local:
+        if not _acquire_lock(local, owner):
+            logger.info("Order mirror sync skipped, another worker is syncing")
+            return None
+        try:
+            return _sync(local, owner, full)
+        finally:
+            _release_lock(local, owner)
+
+
+def _sync(local: Session, owner: str, full: bool) -> dict:
+    """The body of sync_order_mirror, run while holding the sync lock."""
+    state = _get_state(local)
+    started_at = datetime.now()
+
+    changed_at = _remote_changed_at()
+    unstamped = changed_at == None  # noqa ruff:e711
+    columns = [ORDER.__table__.c[name] for name in ORDER_MIRROR.__table__.c.keys()]
+    # Ordered so that every row after a batch changed at or after its
+    # watermark, or has a higher order_id among the rows without timestamps
+    statement = select(*columns).order_by(
+        case((unstamped, 1), else_=0), changed_at, ORDER.order_id
+    )
+    if not full and (state.watermark is not None or state.last_order_id is not None):
+        # >= so rows sharing the watermark timestamp are never missed
+        stamped_after = (
+            changed_at >= state.watermark
+            if state.watermark is not None
+            else changed_at != None  # noqa ruff:e711
+        )
+        unstamped_after = (
+            and_(unstamped, ORDER.order_id > state.last_order_id)
+            if state.last_order_id is not None
+            else unstamped
+        )
+        statement = statement.where(or_(stamped_after, unstamped_after))
+
+    synced = 0
+    with Session(remote_engine) as remote:
+        result = remote.exec(
+            statement.execution_options(yield_per=ORDER_MIRROR_BATCH_SIZE)
+        )
+        for partition in result.mappings().partitions():
+            rows = [dict(row) for row in partition]
+            _write_batch(local, rows)
+            stamps = [(_changed_at(row), row["order_id"]) for row in rows]
+            batch_watermark = max(filter(None, (t for t, _ in stamps)), default=None)
+            if batch_watermark is not None:
+                state.watermark = batch_watermark
+            unstamped_ids = [order_id for t, order_id in stamps if t is None]
+            if unstamped_ids:
+                state.last_order_id = max(unstamped_ids)
+            local.add(state)
+            _renew_lock(local, owner)
+            local.commit()
+            synced += len(rows)
+
+    removed = None
+    if full or _reconcile_due(state, started_at):
+        removed = _reconcile(local, owner)
+        state.last_reconciled_at = started_at
+
+    state.last_synced_at = started_at
+    local.add(state)
+    local.commit()
+
+    logger.info(f"Order mirror synced {synced} rows (watermark {state.watermark})")
+    return {
+        "rows": synced,
+        "removed": removed,
+        "watermark": state.watermark,
+        "last_synced_at": started_at,
+    }
+
+
+def _reconcile_due(state: ORDER_MIRROR_STATE, now: datetime) -> bool:
+    """Whether ORDER_MIRROR_RECONCILE_INTERVAL has passed since the last pass."""
+    if state.last_reconciled_at is None:
+        return True
+    age = (now - state.last_reconciled_at).total_seconds()
+    return age >= ORDER_MIRROR_RECONCILE_INTERVAL
+
+
+def _reconcile(local: Session, owner: str) -> int:
+    """
+    Delete mirror rows whose order no longer exists in the remote table.
+
+    Remote order IDs are read in ascending batches. Mirror rows within the
+    range of IDs a batch spans, but missing from it, are deleted and the
+    deletions committed batch by batch.
+
+    Returns:
+        int: The number of mirror rows deleted.
+    """
+    removed = 0
+    low = None
+    with Session(remote_engine) as remote:
+        result = remote.exec(
+            select(ORDER.order_id)
+            .order_by(ORDER.order_id)
+            .execution_options(yield_per=ORDER_MIRROR_BATCH_SIZE)
+        )
+        for remote_ids in result.partitions():
+            high = remote_ids[-1]
+            removed += _delete_missing(local, owner, set(remote_ids), low, high)
+            low = high
+    # Everything beyond the highest remote order_id is gone
+    removed += _delete_missing(local, owner, set(), low, None)
+    logger.info(f"Order mirror reconciled, removed {removed} deleted rows")
+    return removed
+
+
+def _delete_missing(
+    local: Session,
+    owner: str,
+    remote_ids: Set[int],
+    low: Optional[int],
+    high: Optional[int],
+) -> int:
+    """Delete mirror rows in (low, high] that are not in `remote_ids`."""
+    statement = select(ORDER_MIRROR.order_id)
+    if low is not None:
+        statement = statement.where(ORDER_MIRROR.order_id > low)
+    if high is not None:
+        statement = statement.where(ORDER_MIRROR.order_id <= high)
+    missing = [
+        order_id
+        for order_id in local.exec(statement).all()
+        if order_id not in remote_ids
+    ]
+    for ids in chunked(missing):
+        local.exec(delete(ORDER_MIRROR).where(ORDER_MIRROR.order_id.in_(ids)))
+    _renew_lock(local, owner)
+    local.commit()
+    return len(missing)
+
+
+def get_mirror_status(local_session: Session) -> dict:
+    """
+    Describe the state of the mirror.
+
+    Args:
+        local_session (Session): Local database session.
+
+    Returns:
+        dict: Whether the mirror is enabled and fresh, plus its sync state.
+    """
+    state = local_session.get(ORDER_MIRROR_STATE, 1)
+    return {
+        "enabled": ORDER_MIRROR_ENABLED,
+        "fresh": mirror_is_fresh(local_session),
+        "watermark": state.watermark if state else None,
+        "last_synced_at": state.last_synced_at if state else None,
+        "last_reconciled_at": state.last_reconciled_at if state else None,
+        "max_staleness": ORDER_MIRROR_MAX_STALENESS,
+    }
+
+
+def mirror_is_fresh(local_session: Session) -> bool:
+    """Whether the mirror is enabled and was synced within the staleness bound."""
+    if not ORDER_MIRROR_ENABLED:
+        return False
+    try:
+        state = local_session.get(ORDER_MIRROR_STATE, 1)
+    except Exception as e:
+        logger.error(f"Error reading order mirror state: {str(e)}")
+        return False
+    if state is None or state.last_synced_at is None:
+        return False
+    age = (datetime.now() - state.last_synced_at).total_seconds()
+    return age <= ORDER_MIRROR_MAX_STALENESS
+
+
+def order_source(
+    local_session: Session, remote_session: Session
+) -> Tuple[Type[ORDER_BASE], Session]:
+    """
+    Choose where ORDER rows are read from.
+
+    Args:
+        local_session (Session): Local database session.
+        remote_session (Session): Remote (OMOP) database session.
+
+    Returns:
+        tuple: (model, session) - ORDER_MIRROR with the local session when the
+            mirror is fresh, otherwise ORDER with the remote session.
+    """
+    if mirror_is_fresh(local_session):
+        return ORDER_MIRROR, local_session
+    return ORDER, remote_session
+
+
+async def run_order_mirror_sync():
+    """Run sync_order_mirror every ORDER_MIRROR_SYNC_INTERVAL seconds."""
+    while True:
+        try:
+            await asyncio.to_thread(sync_order_mirror)
+        except Exception as e:
+            logger.error(f"Order mirror sync failed: {str(e)}")
+        await asyncio.sleep(ORDER_MIRROR_SYNC_INTERVAL)
@@ -0,0 +1,179 @@
+"""
+Keyset pagination for the ResTrack API.
+
+Orders are paged on (sort column, order_id), newest first on event_datetime by
+default, with orders that have no value in the sort column last. A page is
+addressed by an opaque cursor holding the sort key of the last order on the
+previous page.
+
+Views grouping orders by patient page on (patient_id, sort column, order_id)
+instead, highest patient ID first, so each patient's orders are contiguous
+across pages.
+
+Text columns are ordered and compared on their lower-cased values, both in
+SQL and when chunk results are merged in Python. SQL Server's default
+collation ignores case while Python's string order does not, so comparing the
+raw values lets a page spanning several chunks skip or repeat orders.
+"""
+
+import base64
+import json
+import os
+from datetime import datetime
+from typing import Any, Optional, Tuple, Type
+
+from fastapi import HTTPException
+from sqlmodel import and_, case, func, or_
+
+from restrack.models.cdm import ORDER_BASE
+
+ORDERS_PAGE_SIZE = int(os.getenv("ORDERS_PAGE_SIZE", "200"))
+ORDERS_MAX_PAGE_SIZE = int(os.getenv("ORDERS_MAX_PAGE_SIZE", "1000"))
+
+# The default page order
+DEFAULT_SORT_FIELD = "event_datetime"
+# Cursor values of these fields are datetimes, sent as ISO strings
+DATETIME_FIELDS = {"event_datetime"}
+# Text fields, compared on their lower-cased values
+TEXT_FIELDS = {"proc_name"}
+
+# (sort value, order_id), or (patient_id, sort value, order_id) by patient
+Cursor = Tuple[Any, ...]
+
+
+def page_size(limit: Optional[int]) -> int:
+    """Return the requested page size, defaulted and capped."""
+    if not limit:
+        return ORDERS_PAGE_SIZE
+    return max(1, min(limit, ORDERS_MAX_PAGE_SIZE))
+
+
+def encode_cursor(*key: Any) -> str:
+    """Build the cursor pointing just after the order with this sort key."""
+    key = [value.isoformat() if isinstance(value, datetime) else value for value in key]
+    payload = json.dumps(key)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(
+    cursor: Optional[str], field: str = DEFAULT_SORT_FIELD, by_patient: bool = False
+) -> Optional[Cursor]:
+    """
+    Parse a cursor produced by encode_cursor for a page sorted on `field`, and
+    grouped by patient if `by_patient` is set.
+
+    Raises:
+        HTTPException: If the cursor is malformed, a 400 error is raised.
+    """
+    if not cursor:
+        return None
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor))
+        patient_id, value, order_id = key if by_patient else [None, *key]
+        if value is not None and field in DATETIME_FIELDS:
+            value = datetime.fromisoformat(value)
+        if not by_patient:
+            return (value, int(order_id))
+        if patient_id is not None:
+            patient_id = int(patient_id)
+        return (patient_id, value, int(order_id))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _sort_column(model: Type[ORDER_BASE], field: str):
+    """The column expression pages are ordered and compared on."""
+    column = getattr(model, field)
+    return func.lower(column) if field in TEXT_FIELDS else column
+
+
+def _sort_value(value: Any, field: str) -> Any:
+    """A sort column value as _sort_column compares it, for sorting in Python."""
+    return value.lower() if value is not None and field in TEXT_FIELDS else value
+
+
+def keyset_order_by(
+    model: Type[ORDER_BASE],
+    field: str = DEFAULT_SORT_FIELD,
+    descending: bool = True,
+    by_patient: bool = False,
+):
+    """ORDER BY clauses for the page order, NULLs last and portable across
+    databases' NULL orderings."""
+    column = _sort_column(model, field)
+    if descending:
+        clauses = (
+            case((column == None, 1), else_=0),  # noqa ruff:e711
+            column.desc(),
+            model.order_id.desc(),
+        )
+    else:
+        clauses = (
+            case((column == None, 1), else_=0),  # noqa ruff:e711
+            column.asc(),
+            model.order_id.asc(),
+        )
+    if by_patient:
+        return (
+            case((model.patient_id == None, 1), else_=0),  # noqa ruff:e711
+            model.patient_id.desc(),
+            *clauses,
+        )
+    return clauses
+
+
+def keyset_after(
+    model: Type[ORDER_BASE],
+    cursor: Cursor,
+    field: str = DEFAULT_SORT_FIELD,
+    descending: bool = True,
+    by_patient: bool = False,
+):
+    """WHERE clause selecting the orders that sort after `cursor`."""
+    if by_patient:
+        patient_id, *cursor = cursor
+        within_patient = keyset_after(model, cursor, field, descending)
+        if patient_id is None:
+            return and_(model.patient_id == None, within_patient)  # noqa ruff:e711
+        return or_(
+            model.patient_id < patient_id,
+            and_(model.patient_id == patient_id, within_patient),
+            model.patient_id == None,  # noqa ruff:e711
+        )
+
+    column = _sort_column(model, field)
+    value, order_id = cursor
+    beyond_id = model.order_id < order_id if descending else model.order_id > order_id
+    if value is None:
+        return and_(column == None, beyond_id)  # noqa ruff:e711
+    value = _sort_value(value, field)
+    beyond_value = column < value if descending else column > value
+    return or_(
+        beyond_value,
+        and_(column == value, beyond_id),
+        column == None,  # noqa ruff:e711
+    )
+
+
+def keyset_sort(
+    orders: list,
+    field: str = DEFAULT_SORT_FIELD,
+    descending: bool = True,
+    by_patient: bool = False,
+) -> None:
+    """Sort orders in place to match keyset_order_by, e.g. after merging chunks."""
+
+    def key(order):
+        value = _sort_value(getattr(order, field), field)
+        present = value is not None
+        # NULLs sort last either way and only compare with each other
+        nulls_last = present if descending else not present
+        return (nulls_last, value if present else 0, order.order_id)
+
+    orders.sort(key=key, reverse=descending)
+    if by_patient:
+        # Stable, so each patient's orders keep the order above
+        orders.sort(
+            key=lambda order: (order.patient_id is not None, order.patient_id or 0),
+            reverse=True,
+        )
@@ -0,0 +1,63 @@
+"""
+Column projection for ORDER queries.
+
+Selecting whole ORDER entities loads all 19 columns and builds a tracked
+SQLModel instance per row. Callers that only display a few columns select
+just those instead and get plain Row tuples, which support the same attribute
+access (row.order_id) but are not tracked by the session.
+"""
+
+from typing import List, Optional, Sequence, Type, Union
+
+from fastapi import HTTPException
+
+from restrack.models.cdm import ORDER_BASE
+
+# Columns every projection includes, as paging sorts and builds cursors on them
+ORDER_KEY_FIELDS = ("order_id", "event_datetime")
+
+# Columns shown by the web orders table
+ORDER_TABLE_FIELDS = (
+    "order_id",
+    "patient_id",
+    "event_datetime",
+    "proc_name",
+    "current_status",
+    "in_progress",
+    "partial",
+    "complete",
+)
+
+
+def parse_fields(fields: Union[str, Sequence[str], None]) -> Optional[List[str]]:
+    """
+    Parse a `fields` selection into ORDER column names.
+
+    Args:
+        fields (str | Sequence[str] | None): Comma-separated names, as given to
+            the API's `fields=` parameter, or a sequence of names. None, "" or
+            "*" select whole entities.
+
+    Returns:
+        list[str] | None: The column names, key columns first, or None for
+            whole entities.
+
+    Raises:
+        HTTPException: If a name is not an ORDER column, a 400 error is raised.
+    """
+    if isinstance(fields, str):
+        fields = [name.strip() for name in fields.split(",") if name.strip()]
+    if not fields or "*" in fields:
+        return None
+
+    unknown = [name for name in fields if name not in ORDER_BASE.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown order fields: {', '.join(unknown)}"
+        )
+    return list(dict.fromkeys([*ORDER_KEY_FIELDS, *fields]))
+
+
+def order_columns(model: Type[ORDER_BASE], fields: Sequence[str]) -> list:
+    """The columns of `model` named by `fields`, for select(*columns)."""
+    return [getattr(model, name) for name in fields]
@@ -0,0 +1,234 @@
+"""
+Remote fetch layer for the ResTrack API.
+
+This module provides batched access to ORDER rows in the OMOP database:
+- Splitting large order ID lists into fixed-size chunks
+- Running the chunks concurrently over a bounded pool of remote connections
+- Merging the chunk results back together in request order
+- Failing the request with a 504 when the remote database is too slow
+
+When the local ORDER mirror is fresh the same functions read ORDER_MIRROR
+through the local session instead, one chunk after another.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type
+
+from fastapi import HTTPException
+from sqlmodel import Session, distinct, select
+
+from restrack.models.cdm import ORDER, ORDER_BASE
+from restrack.api.core import chunked, logger, remote_engine
+from restrack.api.projection import order_columns
+
+# Number of order IDs sent to the remote database per statement. SQL Server
+# allows at most 2100 bound parameters per statement.
+REMOTE_FETCH_CHUNK_SIZE = int(os.getenv("REMOTE_FETCH_CHUNK_SIZE", "1000"))
+
+# Maximum number of chunks fetched concurrently, i.e. the number of remote
+# connections the fetch layer holds at any one time.
+REMOTE_FETCH_PARALLELISM = int(os.getenv("REMOTE_FETCH_PARALLELISM", "4"))
+
+# Seconds a remote fetch may take before the request fails with a 504 (0 waits
+# indefinitely). A timed-out query still holds its connection until it
+# returns; DB_CDM_QUERY_TIMEOUT has the server cancel it.
+REMOTE_FETCH_TIMEOUT = float(os.getenv("REMOTE_FETCH_TIMEOUT", "0"))
+
+_executor = ThreadPoolExecutor(
+    max_workers=max(REMOTE_FETCH_PARALLELISM, 1), thread_name_prefix="remote-fetch"
+)
+
+
+def _padded_chunks(order_ids: Iterable[int]) -> List[List[int]]:
+    """
+    Split order IDs into chunks of exactly REMOTE_FETCH_CHUNK_SIZE items.
+
+    The last chunk is padded by repeating its final ID so that every statement
+    has the same number of parameters and the remote server can reuse a single
+    cached plan.
+    """
+    chunks = list(chunked(dict.fromkeys(order_ids), REMOTE_FETCH_CHUNK_SIZE))
+    if len(chunks) > 1:
+        last = chunks[-1]
+        last.extend([last[-1]] * (REMOTE_FETCH_CHUNK_SIZE - len(last)))
+    return chunks
+
+
+def _run_chunks(
+    fetch_chunk,
+    chunks: List[List[int]],
+    session: Optional[Session],
+    model: Type[ORDER_BASE],
+):
+    """
+    Run `fetch_chunk(session, chunk)` for every chunk and return the results in
+    chunk order.
+
+    A single chunk runs on the supplied session (if any). Multiple remote
+    chunks run on the shared executor, each with its own short-lived remote
+    session. Chunks against the local mirror run in turn on the supplied session.
+
+    With REMOTE_FETCH_TIMEOUT set, every remote chunk runs on the executor so
+    the wait can be bounded.
+
+    Raises:
+        HTTPException: 504 if the remote chunks take longer than
+            REMOTE_FETCH_TIMEOUT.
+    """
+    if model is not ORDER:
+        return [fetch_chunk(session, chunk) for chunk in chunks]
+
+    def run(chunk):
+        with Session(remote_engine) as chunk_session:
+            return fetch_chunk(chunk_session, chunk)
+
+    if REMOTE_FETCH_TIMEOUT > 0:
+        futures = [_executor.submit(run, chunk) for chunk in chunks]
+        _, pending = wait(futures, timeout=REMOTE_FETCH_TIMEOUT)
+        if pending:
+            for future in pending:
+                future.cancel()
+            logger.error(
+                f"Remote fetch of {len(chunks)} chunk(s) timed out after "
+                f"{REMOTE_FETCH_TIMEOUT}s"
+            )
+            raise HTTPException(
+                status_code=504, detail="Remote database query timed out"
+            )
+        return [future.result() for future in futures]
+
+    if len(chunks) == 1 and session is not None:
+        return [fetch_chunk(session, chunks[0])]
+
+    if len(chunks) == 1:
+        return [run(chunks[0])]
+
+    return list(_executor.map(run, chunks))
+
+
+def fetch_orders(
+    order_ids: Iterable[int],
+    session: Optional[Session] = None,
+    model: Type[ORDER_BASE] = ORDER,
+    conditions: Sequence = (),
+    order_by: Sequence = (),
+    limit: Optional[int] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> List[ORDER_BASE]:
+    """
+    Fetch the non-cancelled ORDER rows for the given order IDs.
+
+    Args:
+        order_ids (Iterable[int]): The order IDs to fetch.
+        session (Session | None): Remote session used when the IDs fit in a
+            single chunk. Larger requests open their own sessions.
+        model (type): ORDER, or ORDER_MIRROR to read the local mirror through
+            `session`.
+        conditions (Sequence): Extra WHERE clauses applied to every chunk.
+        order_by (Sequence): ORDER BY clauses applied to every chunk.
+        limit (int | None): Maximum rows fetched per chunk. Callers needing a
+            global limit sort the merged result and truncate it.
+        fields (Sequence[str] | None): Columns to select, see
+            restrack.api.projection.parse_fields. None selects whole entities.
+
+    Returns:
+        List[ORDER]: The matching orders, merged in chunk order. With `fields`,
+            untracked Row tuples holding just those columns.
+    """
+    chunks = _padded_chunks(order_ids)
+    if not chunks:
+        return []
+    selected = order_columns(model, fields) if fields else [model]
+
+    def fetch_chunk(remote: Session, chunk: List[int]) -> List[ORDER_BASE]:
+        statement = (
+            select(*selected)
+            .where(
+                model.order_id.in_(chunk),
+                model.cancelled == None,  # noqa ruff:e711
+                *conditions,
+            )
+            .order_by(*order_by)
+            .limit(limit)
+        )
+        return remote.exec(statement).all()
+
+    results = []
+    for rows in _run_chunks(fetch_chunk, chunks, session, model):
+        results.extend(rows)
+    return results
+
+
+def fetch_patient_ids(
+    order_ids: Iterable[int],
+    session: Optional[Session] = None,
+    model: Type[ORDER_BASE] = ORDER,
+) -> Set[int]:
+    """
+    Fetch the distinct patient IDs of the non-cancelled orders given.
+
+    Args:
+        order_ids (Iterable[int]): The order IDs to look up.
+        session (Session | None): Remote session used when the IDs fit in a
+            single chunk. Larger requests open their own sessions.
+        model (type): ORDER, or ORDER_MIRROR to read the local mirror through
+            `session`.
+
+    Returns:
+        set[int]: The distinct patient IDs.
+    """
+    chunks = _padded_chunks(order_ids)
+    if not chunks:
+        return set()
+
+    def fetch_chunk(remote: Session, chunk: List[int]) -> List[int]:
+        statement = select(distinct(model.patient_id)).where(
+            model.order_id.in_(chunk),
+            model.cancelled == None,  # noqa ruff:e711
+        )
+        return remote.exec(statement).all()
+
+    patient_ids = set()
+    for rows in _run_chunks(fetch_chunk, chunks, session, model):
+        patient_ids.update(rows)
+    patient_ids.discard(None)
+    return patient_ids
+
+
+def fetch_order_keys(
+    order_ids: Iterable[int],
+    session: Optional[Session] = None,
+    model: Type[ORDER_BASE] = ORDER,
+) -> Dict[int, Tuple[Optional[int], Optional[datetime]]]:
+    """
+    Fetch the patient ID and event datetime of each order given, including
+    cancelled orders.
+
+    Args:
+        order_ids (Iterable[int]): The order IDs to look up.
+        session (Session | None): Remote session used when the IDs fit in a
+            single chunk. Larger requests open their own sessions.
+        model (type): ORDER, or ORDER_MIRROR to read the local mirror through
+            `session`.
+
+    Returns:
+        dict[int, tuple]: (patient_id, event_datetime) by order ID. Unknown
+            orders are left out.
+    """
+    chunks = _padded_chunks(order_ids)
+    if not chunks:
+        return {}
+
+    def fetch_chunk(remote: Session, chunk: List[int]) -> List:
+        statement = select(
+            model.order_id, model.patient_id, model.event_datetime
+        ).where(model.order_id.in_(chunk))
+        return remote.exec(statement).all()
+
+    keys = {}
+    for rows in _run_chunks(fetch_chunk, chunks, session, model):
+        for order_id, patient_id, event_datetime in rows:
+            keys[order_id] = (patient_id, event_datetime)
+    return keys
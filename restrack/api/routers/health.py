@@ -0,0 +1,61 @@
+"""
+Health module for the ResTrack API.
+
+This module reports the state of the service's database connections and
+in-process caches.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from restrack.api.core import check_engine, local_engine, pool_metrics, remote_engine
+from restrack.api.routers.users import user_cache_stats
+from restrack.auth import token_cache
+
+router = APIRouter(tags=["health"], prefix="/health")
+
+
+@router.get("/pool")
+def get_pool_metrics():
+    """
+    Retrieve connection pool metrics for the local and remote databases.
+
+    Returns:
+        dict: Per engine, the pool size, checked-out and idle connections,
+            overflow, and total checkouts and checkins since start.
+    """
+    return pool_metrics()
+
+
+@router.get("/db")
+def get_db_health():
+    """
+    Check both databases with a round-trip query and report their pools.
+
+    Returns:
+        dict: Per engine ("local", "remote"), whether the query succeeded, its
+            latency in milliseconds, any error and the pool metrics. The
+            response is a 503 if either database is unreachable.
+    """
+    pools = pool_metrics()
+    engines = {"local": local_engine, "remote": remote_engine}
+    checks = {
+        name: {**check_engine(engine), "pool": pools[name]}
+        for name, engine in engines.items()
+    }
+    healthy = all(check["ok"] for check in checks.values())
+    return JSONResponse(
+        status_code=200 if healthy else 503,
+        content={"status": "ok" if healthy else "unavailable", "databases": checks},
+    )
+
+
+@router.get("/cache")
+def get_cache_stats():
+    """
+    Retrieve the size and hit/miss counters of the in-process caches.
+
+    Returns:
+        dict: Stats of the decoded token cache and the user cache.
+    """
+    return {"tokens": token_cache.stats(), "users": user_cache_stats()}
@@ -0,0 +1,32 @@
+"""
+Job status module for the ResTrack API.
+
+This module lets clients poll the progress of background jobs started by
+other endpoints, such as deleting a large worklist.
+"""
+
+from fastapi import APIRouter, HTTPException
+
+from restrack.api.jobs import get_job
+
+router = APIRouter(tags=["jobs"], prefix="/jobs")
+
+
+@router.get("/{job_id}")
+def get_job_status(job_id: str):
+    """
+    Retrieve the state and progress of a background job.
+
+    Args:
+        job_id (str): The ID returned when the job was started.
+
+    Returns:
+        dict: The job's status, progress (done / total), result and error.
+
+    Raises:
+        HTTPException: If the job is unknown, a 404 error is raised.
+    """
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
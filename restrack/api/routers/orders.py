@@ -5,115 +5,476 @@ This module provides order-related functionality for the ResTrack API:
 - Retrieving orders for worklists and patients
 - Adding and removing orders from worklists
 - Commenting and annotating orders
+- Applying batches of order operations in one transaction
 """
 
 import json
-from typing import List, Tuple
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, and_, select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import bindparam
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, and_, delete, func, select, update
 
-from restrack.models.worklist import OrderWorkList
-from restrack.models.cdm import ORDER
-from restrack.api.core import get_app_db_session, get_remote_db_session, logger
+from restrack.models.worklist import (
+    AddOrdersResponse,
+    CopyOrdersResponse,
+    OrderBatchRequest,
+    OrderBatchResponse,
+    OrderBatchResult,
+    OrderWorkList,
+    UpdateOrdersResponse,
+)
+from restrack.api.bulk import bulk_update, insert_ignore
+from restrack.api.core import (
+    chunked,
+    get_app_db_session,
+    get_remote_db_session,
+    local_engine,
+    logger,
+    remote_engine,
+)
+from restrack.api.mirror import get_mirror_status, order_source, sync_order_mirror
+from restrack.api.filters import OrderFilters, order_filters
+from restrack.api.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    keyset_order_by,
+    keyset_sort,
+    page_size,
+)
+from restrack.api.remote import (
+    REMOTE_FETCH_CHUNK_SIZE,
+    fetch_order_keys,
+    fetch_orders,
+)
+from restrack.api.projection import order_columns, parse_fields
+from restrack.api.stats import (
+    adjust_worklist_stats,
+    count_worklist_patients,
+    refresh_worklist_stats,
+)
 
 router = APIRouter(tags=["orders"])
 
+# Rows fetched from the order cursor at a time when streaming
+STREAM_BATCH_SIZE = 500
+
 
 @router.get(
     path="/worklist_orders/{worklist_id}",
-    response_model=Tuple[List[ORDER], List[Tuple[int, str, str, str]]],
+    response_model=Tuple[
+        List[Dict[str, Any]],
+        List[Tuple[int, str, str, str]],
+        Optional[str],
+    ],
 )
 def get_worklist_orders(
     worklist_id: int,
     local_session: Session = Depends(get_app_db_session),
     remote_session: Session = Depends(get_remote_db_session),
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    filters: OrderFilters = Depends(order_filters),
 ):
     """
-    Fetches orders associated with a specific worklist.
+    Fetches one page of orders associated with a specific worklist.
 
     Args:
         worklist_id (int): The ID of the worklist.
         local_session (Session): The database session dependency.
         remote_session (Session): The remote database session dependency.
+        limit (int | None): Page size, capped at ORDERS_MAX_PAGE_SIZE.
+        cursor (str | None): Cursor returned with the previous page.
+        fields (str | None): Comma-separated ORDER columns to return. All
+            columns are returned when omitted.
+        filters (OrderFilters): Filters and sort order from the query string.
 
     Returns:
-        tuple: A tuple containing (order_list, status_list).
+        tuple: A tuple containing (order_list, status_list, next_cursor).
+            next_cursor is None on the last page.
     """
+    fields = parse_fields(fields)
     with local_session as local:
-        statement = select(
-            OrderWorkList.order_id, OrderWorkList.status, OrderWorkList.user_note, OrderWorkList.priority
-        ).where(OrderWorkList.worklist_id == worklist_id)
+        order_ids_and_status = get_worklist_order_statuses(worklist_id, local, filters)
+        orders, statuses, next_cursor = fetch_worklist_page(
+            order_ids_and_status,
+            local,
+            remote_session,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
+            filters=filters,
+        )
+    return (_as_records(orders, fields), statuses, next_cursor)
+
+
+def _as_records(orders: list, fields: Optional[List[str]]) -> list:
+    """Turn ORDER entities or projected Row tuples into dicts for the response."""
+    if not fields:
+        return [order.model_dump() for order in orders]
+    return [row._asdict() for row in orders]
+
+
+def get_worklist_order_statuses(
+    worklist_id: int, local_session: Session, filters: Optional[OrderFilters] = None
+) -> list:
+    """
+    Fetch the (order_id, status, user_note, priority) rows of a worklist.
+
+    This is the local half of get_worklist_orders. The local part of `filters`
+    is applied here, so only matching order IDs are sent to the remote query.
+    """
+    statement = select(
+        OrderWorkList.order_id,
+        OrderWorkList.status,
+        OrderWorkList.user_note,
+        OrderWorkList.priority,
+    ).where(
+        OrderWorkList.worklist_id == worklist_id,
+        *(filters.local_conditions() if filters else ()),
+    )
+    return local_session.exec(statement).fetchall()
+
 
-    order_ids_and_status = local.exec(statement).fetchall()
-    order_ids = []
-    for order in order_ids_and_status:
-        order_ids.append(order[0])
+def fetch_worklist_page(
+    order_ids_and_status: list,
+    local_session: Session,
+    remote_session: Session,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    filters: Optional[OrderFilters] = None,
+    by_patient: bool = False,
+):
+    """
+    Fetch one page of ORDER rows for a worklist's orders.
+
+    This is the remote half of get_worklist_orders.
+
+    Args:
+        order_ids_and_status (list): Rows from get_worklist_order_statuses.
+        local_session (Session): Local session, used to read the mirror.
+        remote_session (Session): Remote (OMOP) database session.
+        limit (int | None): Page size, capped at ORDERS_MAX_PAGE_SIZE.
+        cursor (str | None): Cursor returned with the previous page.
+        fields (Sequence[str] | None): Columns to select, from parse_fields.
+            None selects whole ORDER entities.
+        filters (OrderFilters | None): Remote filters and the sort order. The
+            local filters must already be applied to `order_ids_and_status`.
+        by_patient (bool): Page by patient first, for views grouping the
+            orders by patient. Ignored when sorting by a local column.
+
+    Returns:
+        tuple: A tuple containing (order_list, status_list, next_cursor).
+    """
+    filters = filters or OrderFilters()
+    by_patient = by_patient and not filters.sorts_locally
+    size = page_size(limit)
+    after = decode_cursor(cursor, filters.sort, by_patient)
 
-    if not order_ids:
-        return ([], [])
+    if not order_ids_and_status:
+        return ([], [], None)
+    if fields and not filters.sorts_locally:
+        # The page is sorted and its cursor built on the sort column
+        sort_fields = [filters.sort, "patient_id"] if by_patient else [filters.sort]
+        fields = list(dict.fromkeys([*fields, *sort_fields]))
 
     try:
-        with remote_session as remote:
-            statement = select(ORDER).where(
-                ORDER.order_id.in_(order_ids),
-                ORDER.cancelled == None,  # noqa ruff:e711
+        model, source_session = order_source(local_session, remote_session)
+        if filters.sorts_locally:
+            results, next_cursor = _fetch_locally_sorted_page(
+                order_ids_and_status, source_session, model, size, after, fields, filters
+            )
+        else:
+            conditions = filters.remote_conditions(model)
+            if after:
+                conditions.append(
+                    keyset_after(
+                        model, after, filters.sort, filters.descending, by_patient
+                    )
+                )
+            # Every chunk returns its own first page; the merged result is
+            # sorted again and truncated to the global page
+            results = fetch_orders(
+                [row[0] for row in order_ids_and_status],
+                session=source_session,
+                model=model,
+                conditions=conditions,
+                order_by=keyset_order_by(
+                    model, filters.sort, filters.descending, by_patient
+                ),
+                limit=size + 1,
+                fields=fields,
+            )
+            keyset_sort(results, filters.sort, filters.descending, by_patient)
+            results, next_cursor = _split_page(
+                results, size, lambda order: getattr(order, filters.sort), by_patient
             )
-            result = remote.exec(statement)
-            results = []
-            for row in result:
-                results.append(row)
-
-            return (results, order_ids_and_status)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching orders: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+    page_ids = {order.order_id for order in results}
+    page_status = [row for row in order_ids_and_status if row[0] in page_ids]
+    return (results, page_status, next_cursor)
+
+
+def _fetch_locally_sorted_page(
+    order_ids_and_status: list,
+    source_session: Session,
+    model,
+    size: int,
+    after,
+    fields: Optional[Sequence[str]],
+    filters: OrderFilters,
+):
+    """
+    Fetch a page sorted by a local column (status or priority).
+
+    The worklist rows are sorted locally, then ORDER rows are fetched for the
+    IDs following the cursor, a chunk at a time, until the page is full. The
+    remote filters may drop IDs, so several chunks may be needed.
+
+    Returns:
+        tuple: (page, next_cursor).
+    """
+    column = 1 if filters.sort == "status" else 3
+
+    def sort_key(value, order_id):
+        # Empty values sort last either way
+        value = value or ""
+        return (bool(value) if filters.descending else not value, value, order_id)
+
+    rows = sorted(
+        order_ids_and_status,
+        key=lambda row: sort_key(row[column], row[0]),
+        reverse=filters.descending,
+    )
+    if after:
+        after_key = sort_key(*after)
+        if filters.descending:
+            rows = [row for row in rows if sort_key(row[column], row[0]) < after_key]
+        else:
+            rows = [row for row in rows if sort_key(row[column], row[0]) > after_key]
+
+    values = {row[0]: row[column] for row in rows}
+    conditions = filters.remote_conditions(model)
+    results = []
+    for order_ids in chunked((row[0] for row in rows), REMOTE_FETCH_CHUNK_SIZE):
+        fetched = fetch_orders(
+            order_ids,
+            session=source_session,
+            model=model,
+            conditions=conditions,
+            fields=fields,
+        )
+        by_id = {order.order_id: order for order in fetched}
+        results.extend(by_id[order_id] for order_id in order_ids if order_id in by_id)
+        if len(results) > size:
+            break
+
+    return _split_page(results, size, lambda order: values[order.order_id])
+
+
+@router.get(
+    path="/worklist_orders/{worklist_id}/stream",
+    response_class=StreamingResponse,
+)
+def stream_worklist_orders(
+    worklist_id: int, filters: OrderFilters = Depends(order_filters)
+):
+    """
+    Streams the orders of a worklist as newline-delimited JSON.
+
+    Each line is one order joined with its status, user_note and priority in
+    the worklist. Orders are read in batches of REMOTE_FETCH_CHUNK_SIZE and
+    written as rows arrive, so memory use does not grow with the worklist.
+
+    Args:
+        worklist_id (int): The ID of the worklist.
+        filters (OrderFilters): Filters from the query string. Streamed orders
+            are not sorted, so `sort` is ignored.
+
+    Returns:
+        StreamingResponse: An application/x-ndjson response.
+    """
+    return StreamingResponse(
+        _iter_worklist_orders(worklist_id, filters), media_type="application/x-ndjson"
+    )
+
+
+def _iter_worklist_orders(
+    worklist_id: int, filters: Optional[OrderFilters] = None
+) -> Iterator[str]:
+    """Yield one NDJSON line per order in the worklist."""
+    # The sessions belong to the generator, which outlives the request handler
+    with Session(local_engine) as local, Session(remote_engine) as remote:
+        model, source = order_source(local, remote)
+        columns = model.__table__.c
+        filters = filters or OrderFilters()
+        local_conditions = filters.local_conditions()
+        remote_conditions = filters.remote_conditions(model)
+        last_order_id = None
+        while True:
+            # Short keyset queries rather than one long-lived local cursor
+            statement = (
+                select(
+                    OrderWorkList.order_id,
+                    OrderWorkList.status,
+                    OrderWorkList.user_note,
+                    OrderWorkList.priority,
+                )
+                .where(OrderWorkList.worklist_id == worklist_id, *local_conditions)
+                .order_by(OrderWorkList.order_id)
+                .limit(REMOTE_FETCH_CHUNK_SIZE)
+            )
+            if last_order_id is not None:
+                statement = statement.where(OrderWorkList.order_id > last_order_id)
+            statuses = {row[0]: row for row in local.exec(statement).all()}
+            if not statuses:
+                break
+            last_order_id = max(statuses)
+
+            statement = (
+                select(*columns)
+                .where(
+                    columns.order_id.in_(list(statuses)),
+                    columns.cancelled == None,  # noqa ruff:e711
+                    *remote_conditions,
+                )
+                .execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+            for row in source.exec(statement).mappings():
+                record = dict(row)
+                _, record["status"], record["user_note"], record["priority"] = (
+                    statuses[row["order_id"]]
+                )
+                record["worklist_id"] = worklist_id
+                yield json.dumps(record, default=_json_default) + "\n"
+
+
+def _json_default(value):
+    """Serialise the datetime columns of ORDER rows."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
 @router.get(
     path="/orders_for_patient/{patient_id}",
-    response_model=Tuple[List[ORDER], List[Tuple[int, str, str]]],
+    response_model=Tuple[
+        List[Dict[str, Any]],
+        List[Tuple[int, int, Optional[str], Optional[str]]],
+        Optional[str],
+    ],
 )
 def get_patient_orders(
     patient_id: int,
     local_session: Session = Depends(get_app_db_session),
     remote_session: Session = Depends(get_remote_db_session),
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
 ):
     """
-    Fetches all orders for a specific patient.
+    Fetches one page of orders for a specific patient.
 
     Args:
         patient_id (int): The ID of the patient.
         local_session (Session): The database session dependency.
         remote_session (Session): The remote database session dependency.
+        limit (int | None): Page size, capped at ORDERS_MAX_PAGE_SIZE.
+        cursor (str | None): Cursor returned with the previous page.
+        fields (str | None): Comma-separated ORDER columns to return. All
+            columns are returned when omitted.
 
     Returns:
-        tuple: A tuple containing (order_list, status_list).
+        tuple: A tuple containing (order_list, status_list, next_cursor). The
+            status list holds one (order_id, worklist_id, status, user_note)
+            entry for every worklist membership of the returned orders.
+            next_cursor is None on the last page.
     """
+    fields = parse_fields(fields)
+    orders, statuses, next_cursor = fetch_patient_orders(
+        patient_id,
+        local_session,
+        remote_session,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+    )
+    return (_as_records(orders, fields), statuses, next_cursor)
+
+
+def fetch_patient_orders(
+    patient_id: int,
+    local_session: Session,
+    remote_session: Session,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+):
+    """
+    Fetch one page of ORDER rows for a patient, with their worklist statuses.
+
+    This is the body of get_patient_orders, returning projected rows as Row
+    tuples rather than dicts.
+
+    Args:
+        patient_id (int): The ID of the patient.
+        local_session (Session): Local session, also used to read the mirror.
+        remote_session (Session): Remote (OMOP) database session.
+        limit (int | None): Page size, capped at ORDERS_MAX_PAGE_SIZE.
+        cursor (str | None): Cursor returned with the previous page.
+        fields (Sequence[str] | None): Columns to select, from parse_fields.
+            None selects whole ORDER entities.
+
+    Returns:
+        tuple: A tuple containing (order_list, status_list, next_cursor).
+
+    Raises:
+        HTTPException: 404 if the patient has no orders, 500 on database errors.
+    """
+    size = page_size(limit)
+    after = decode_cursor(cursor)
+
     try:
-        with remote_session as remote:
-            # First check if patient exists by counting matching records
-            patient_check = select(ORDER.patient_id).where(
-                ORDER.patient_id == patient_id
-            )
-            patient_exists = remote.exec(patient_check).first()
+        model, source_session = order_source(local_session, remote_session)
+        with source_session as remote:
+            if after is None:
+                # First check if patient exists by counting matching records
+                patient_check = select(model.patient_id).where(
+                    model.patient_id == patient_id
+                )
+                patient_exists = remote.exec(patient_check).first()
 
-            if not patient_exists:
-                raise HTTPException(status_code=404, detail="Patient not found")
+                if not patient_exists:
+                    raise HTTPException(status_code=404, detail="Patient not found")
 
+            selected = order_columns(model, fields) if fields else [model]
             statement = (
-                select(ORDER)
-                .where(ORDER.patient_id == patient_id, ORDER.cancelled == None)  # noqa ruff:e711
-                .order_by(ORDER.event_datetime.desc())
+                select(*selected)
+                .where(model.patient_id == patient_id, model.cancelled == None)  # noqa ruff:e711
+                .order_by(*keyset_order_by(model))
+                .limit(size + 1)
             )
+            if after:
+                statement = statement.where(keyset_after(model, after))
             result = remote.exec(statement)
             results = []
             for row in result:
                 results.append(row)
 
             # Only check for no investigations after confirming patient exists
-            if len(results) == 0:
+            if len(results) == 0 and after is None:
                 raise HTTPException(
                     status_code=404,
                     detail="There are no investigations recorded for this patient",
@@ -125,66 +486,139 @@ def get_patient_orders(
         logger.error(f"Error fetching orders: {str(e)}")
         raise HTTPException(status_code=500, detail=f"External server error: {str(e)}")
 
+    results, next_cursor = _split_page(
+        results, size, lambda order: order.event_datetime
+    )
+
     try:
         with local_session as local:
+            # Look up worklist memberships in batches rather than once per order
             order_ids_and_status = []
-            if results:
-                for result in results:
-                    order_id = result.order_id
-                    statement = select(
-                        OrderWorkList.order_id,
-                        OrderWorkList.status,
-                        OrderWorkList.user_note,
-                    ).where(OrderWorkList.order_id == order_id)
-                    status = local.exec(statement).first()
-
-                    if status:
-                        order_ids_and_status.append(status)
+            for order_ids in chunked(result.order_id for result in results):
+                statement = order_memberships_statement(order_ids)
+                order_ids_and_status.extend(local.exec(statement).all())
     except Exception as e:
         logger.error(f"Error fetching order statuses: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-    return (results, order_ids_and_status)
+    return (results, order_ids_and_status, next_cursor)
+
+
+def order_memberships_statement(order_ids: List[int]):
+    """SELECT the worklist memberships, status and note of the given orders."""
+    return (
+        select(
+            OrderWorkList.order_id,
+            OrderWorkList.worklist_id,
+            OrderWorkList.status,
+            OrderWorkList.user_note,
+        )
+        .where(OrderWorkList.order_id.in_(order_ids))
+        .order_by(OrderWorkList.order_id, OrderWorkList.worklist_id)
+    )
+
+
+def _split_page(
+    results: list,
+    size: int,
+    sort_value: Callable[[Any], Any],
+    by_patient: bool = False,
+) -> Tuple[list, Optional[str]]:
+    """
+    Trim a result fetched with `size + 1` rows to one page.
+
+    Args:
+        results (list): The sorted rows.
+        size (int): The page size.
+        sort_value (Callable): Returns the sort column value of a row, for the
+            cursor.
+        by_patient (bool): Whether the rows are paged by patient first.
+
+    Returns:
+        tuple: (page, next_cursor) - next_cursor is None on the last page.
+    """
+    if len(results) <= size:
+        return (results, None)
+    page = results[:size]
+    last = page[-1]
+    key = (sort_value(last), last.order_id)
+    if by_patient:
+        key = (last.patient_id, *key)
+    return (page, encode_cursor(*key))
+
+
+@router.get("/orders_mirror/status")
+def order_mirror_status(local_session: Session = Depends(get_app_db_session)):
+    """
+    Reports the state of the local ORDER mirror.
+
+    Args:
+        local_session (Session): The database session dependency.
+
+    Returns:
+        dict: Whether the mirror is enabled and fresh, plus its sync state.
+    """
+    with local_session as session:
+        return get_mirror_status(session)
+
+
+@router.post("/orders_mirror/refresh")
+def refresh_order_mirror(full: bool = False):
+    """
+    Forces a sync of the local ORDER mirror from the remote database.
+
+    Args:
+        full (bool): Copy the whole remote table instead of changed rows only.
+
+    Returns:
+        dict: The number of rows synced and removed, the new watermark and
+            sync time.
+
+    Raises:
+        HTTPException: 409 if a sync is already running.
+    """
+    try:
+        result = sync_order_mirror(full=full)
+    except Exception as e:
+        logger.error(f"Error refreshing order mirror: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to refresh order mirror: {str(e)}"
+        )
+    if result is None:
+        raise HTTPException(
+            status_code=409, detail="An order mirror sync is already running"
+        )
+    return result
 
 
-@router.put(path="/add_to_worklist/{orders_to_add}", response_model=bool)
-async def add_to_worklist(
+@router.put(path="/add_to_worklist/{orders_to_add}", response_model=AddOrdersResponse)
+def add_to_worklist(
     orders_to_add: str, local_session: Session = Depends(get_app_db_session)
 ):
     """
-    Adds orders to a worklist.
+    Adds orders to a worklist, skipping orders already in it.
 
     Args:
         orders_to_add (str): JSON string containing worklist_id and order_ids.
         local_session (Session): The database session dependency.
 
     Returns:
-        bool: True if successful.
+        AddOrdersResponse: How many orders were added and how many were already present.
     """
     orders_to_add = json.loads(orders_to_add)
     worklist_id = orders_to_add["worklist_id"]
-    order_ids = orders_to_add["order_ids"]
+    order_ids = list(dict.fromkeys(orders_to_add["order_ids"]))
 
     try:
-        for order_id in order_ids:
-            # Check if order already exists in worklist
-            statement = select(OrderWorkList).where(
-                and_(
-                    OrderWorkList.order_id == order_id,
-                    OrderWorkList.worklist_id == worklist_id,
-                )
-            )
-            existing = local_session.exec(statement).first()
-            if not existing:
-                local_session.add(
-                    OrderWorkList(order_id=order_id, worklist_id=worklist_id)
-                )
+        added = add_orders(local_session, worklist_id, order_ids)
         local_session.commit()
-        return True
+        return AddOrdersResponse(added=added, already_present=len(order_ids) - added)
     except Exception as e:
         local_session.rollback()
         logger.error(f"Error adding orders to worklist: {str(e)}")
-        return False
+        raise HTTPException(
+            status_code=500, detail=f"Failed to add orders to worklist: {str(e)}"
+        )
 
 
 @router.delete(
@@ -219,11 +653,21 @@ def delete_order_from_worklist(
         for order in orders_to_delete:
             session.delete(order)
 
+        session.flush()
+        # Every one of these patients had an order in the worklist before
+        patient_ids = {order.patient_id for order in orders_to_delete} - {None}
+        adjust_worklist_stats(
+            session,
+            orders_for_removal["worklist_id"],
+            -len(orders_to_delete),
+            patient_ids,
+            len(patient_ids),
+        )
         session.commit()
         return orders_to_delete[0] if orders_to_delete else None
 
 
-@router.put("/comment/{orders_to_comment}")
+@router.put("/comment/{orders_to_comment}", response_model=UpdateOrdersResponse)
 def comment_orders(
     orders_to_comment: str, local_session: Session = Depends(get_app_db_session)
 ):
@@ -235,22 +679,17 @@ def comment_orders(
         local_session (Session): The database session dependency.
 
     Returns:
-        bool: True if successful.
+        UpdateOrdersResponse: The number of worklist rows updated.
     """
     comment = json.loads(orders_to_comment)
     with local_session as session:
         try:
-            for order_id in comment["order_ids"]:
-                statement = select(OrderWorkList).where(
-                    OrderWorkList.order_id == order_id
-                )
-                # Update status in all worklists for consistency
-                orders = session.exec(statement).all()
-                if orders:
-                    for order in orders:
-                        order.status = comment["action"]
+            # Update status in all worklists for consistency
+            updated = update_orders(
+                session, comment["order_ids"], status=comment["action"]
+            )
             session.commit()
-            return True
+            return UpdateOrdersResponse(updated=updated)
 
         except Exception as e:
             session.rollback()
@@ -259,7 +698,9 @@ def comment_orders(
             )
 
 
-@router.put("/update_priority/{orders_to_update}")
+@router.put(
+    "/update_priority/{orders_to_update}", response_model=UpdateOrdersResponse
+)
 def update_order_priority(
     orders_to_update: str, local_session: Session = Depends(get_app_db_session)
 ):
@@ -271,22 +712,17 @@ def update_order_priority(
         local_session (Session): The database session dependency.
 
     Returns:
-        bool: True if successful.
+        UpdateOrdersResponse: The number of worklist rows updated.
     """
     priority_data = json.loads(orders_to_update)
     with local_session as session:
         try:
-            for order_id in priority_data["order_ids"]:
-                statement = select(OrderWorkList).where(
-                    OrderWorkList.order_id == order_id
-                )
-                # Update priority in all worklists for consistency
-                orders = session.exec(statement).all()
-                if orders:
-                    for order in orders:
-                        order.priority = priority_data["priority"]
+            # Update priority in all worklists for consistency
+            updated = update_orders(
+                session, priority_data["order_ids"], priority=priority_data["priority"]
+            )
             session.commit()
-            return True
+            return UpdateOrdersResponse(updated=updated)
 
         except Exception as e:
             session.rollback()
@@ -295,7 +731,7 @@ def update_order_priority(
             )
 
 
-@router.post("/annotate/{note_to_add}")
+@router.post("/annotate/{note_to_add}", response_model=UpdateOrdersResponse)
 def annotate_orders(
     note_to_add: str, local_session: Session = Depends(get_app_db_session)
 ):
@@ -307,24 +743,19 @@ def annotate_orders(
         local_session (Session): The database session dependency.
 
     Returns:
-        bool: True if successful.
+        UpdateOrdersResponse: The number of worklist rows updated.
     """
     note = json.loads(note_to_add)
     with local_session as session:
         try:
-            for order_id in note["order_ids"]:
-                statement = select(OrderWorkList).where(
-                    and_(
-                        OrderWorkList.order_id == order_id,
-                        OrderWorkList.worklist_id == note["worklist_id"],
-                    )
-                )
-                orders = session.exec(statement).all()
-                if orders:
-                    for order in orders:
-                        order.user_note = note["note_text"]
+            updated = update_orders(
+                session,
+                note["order_ids"],
+                worklist_id=note["worklist_id"],
+                user_note=note["note_text"],
+            )
             session.commit()
-            return True
+            return UpdateOrdersResponse(updated=updated)
 
         except Exception as e:
             session.rollback()
@@ -333,8 +764,8 @@ def annotate_orders(
             )
 
 
-@router.put(path="/copy_to_worklist/{orders_to_copy}", response_model=bool)
-async def copy_orders_to_worklist(
+@router.put(path="/copy_to_worklist/{orders_to_copy}", response_model=CopyOrdersResponse)
+def copy_orders_to_worklist(
     orders_to_copy: str, local_session: Session = Depends(get_app_db_session)
 ):
     """
@@ -345,64 +776,332 @@ async def copy_orders_to_worklist(
         local_session (Session): The database session dependency.
 
     Returns:
-        bool: True if successful.
+        CopyOrdersResponse: How many orders were added, how many were already
+            present, and how many took their metadata from the source worklist.
     """
     copy_data = json.loads(orders_to_copy)
-    source_worklist_id = copy_data["source_worklist_id"]
-    target_worklist_id = copy_data["target_worklist_id"]
-    order_ids = copy_data["order_ids"]
+    order_ids = list(dict.fromkeys(copy_data["order_ids"]))
 
     try:
-        for order_id in order_ids:
-            # Get the source order data with its status, note, and priority
-            source_statement = select(OrderWorkList).where(
-                and_(
-                    OrderWorkList.order_id == order_id,
-                    OrderWorkList.worklist_id == source_worklist_id,
-                )
-            )
-            source_order = local_session.exec(source_statement).first()
-            
-            if not source_order:
-                # If order doesn't exist in source worklist, add it with defaults
-                source_status = ""
-                source_priority = ""
-                source_note = ""
-            else:
-                source_status = source_order.status or ""
-                source_priority = source_order.priority or ""
-                source_note = source_order.user_note or ""
-            
-            # Check if order already exists in target worklist
-            target_statement = select(OrderWorkList).where(
-                and_(
-                    OrderWorkList.order_id == order_id,
-                    OrderWorkList.worklist_id == target_worklist_id,
-                )
-            )
-            existing = local_session.exec(target_statement).first()
-            
-            if not existing:
-                # Add new order with preserved metadata
-                local_session.add(
-                    OrderWorkList(
-                        order_id=order_id, 
-                        worklist_id=target_worklist_id,
-                        status=source_status,
-                        priority=source_priority,
-                        user_note=source_note
-                    )
-                )
-            else:
-                # Update existing order with preserved metadata
-                existing.status = source_status
-                existing.priority = source_priority
-                existing.user_note = source_note
-                local_session.add(existing)
-                
+        added, copied = copy_orders(
+            local_session,
+            copy_data["source_worklist_id"],
+            copy_data["target_worklist_id"],
+            order_ids,
+        )
         local_session.commit()
-        return True
+        return CopyOrdersResponse(
+            added=added, already_present=len(order_ids) - added, copied=copied
+        )
     except Exception as e:
         local_session.rollback()
         logger.error(f"Error copying orders to worklist: {str(e)}")
-        return False
+        raise HTTPException(
+            status_code=500, detail=f"Failed to copy orders to worklist: {str(e)}"
+        )
+
+
+@router.post(path="/orders/batch", response_model=OrderBatchResponse)
+def apply_order_batch(
+    batch: OrderBatchRequest, local_session: Session = Depends(get_app_db_session)
+):
+    """
+    Applies a list of order operations in a single transaction.
+
+    Each operation is one of "add", "remove", "status", "priority", "note" or
+    "copy", with the same fields as the corresponding single-purpose endpoint.
+    If any operation fails, none of them are applied.
+
+    Args:
+        batch (OrderBatchRequest): The operations to apply, in order.
+        local_session (Session): The database session dependency.
+
+    Returns:
+        OrderBatchResponse: One result per operation with the affected row count.
+    """
+    results = []
+    with local_session as session:
+        index, operation = 0, None
+        try:
+            for index, operation in enumerate(batch.operations):
+                results.append(_apply_operation(session, operation))
+            operation = None
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error applying order batch: {str(e)}")
+            failed = f"Operation {index} ({operation.op})" if operation else "Batch"
+            raise HTTPException(
+                status_code=500, detail=f"{failed} failed: {str(e)}"
+            )
+    return OrderBatchResponse(results=results)
+
+
+def _apply_operation(session: Session, operation) -> OrderBatchResult:
+    """Apply one batch operation without committing."""
+    order_ids = list(dict.fromkeys(operation.order_ids))
+
+    if operation.op == "add":
+        added = add_orders(session, operation.worklist_id, order_ids)
+        return OrderBatchResult(
+            op=operation.op, affected=added, already_present=len(order_ids) - added
+        )
+    if operation.op == "remove":
+        affected = remove_orders(session, operation.worklist_id, order_ids)
+    elif operation.op == "status":
+        affected = update_orders(session, order_ids, status=operation.action)
+    elif operation.op == "priority":
+        affected = update_orders(session, order_ids, priority=operation.priority)
+    elif operation.op == "note":
+        affected = update_orders(
+            session,
+            order_ids,
+            worklist_id=operation.worklist_id,
+            user_note=operation.note_text,
+        )
+    else:
+        added, copied = copy_orders(
+            session,
+            operation.source_worklist_id,
+            operation.target_worklist_id,
+            order_ids,
+        )
+        return OrderBatchResult(
+            op=operation.op,
+            affected=copied,
+            added=added,
+            already_present=len(order_ids) - added,
+        )
+    return OrderBatchResult(op=operation.op, affected=affected)
+
+
+def add_orders(session: Session, worklist_id: int, order_ids: List[int]) -> int:
+    """
+    Add orders to a worklist, skipping those already in it, and adjust the
+    worklist's stored counts. The caller commits.
+
+    Each row records the order's patient_id and event_datetime.
+
+    Returns:
+        int: The number of orders added.
+    """
+    keys = order_keys(session, order_ids)
+    rows = [
+        {
+            "order_id": order_id,
+            "worklist_id": worklist_id,
+            "status": "",
+            "priority": "",
+            "user_note": "",
+            "patient_id": keys.get(order_id, (None, None))[0],
+            "event_datetime": keys.get(order_id, (None, None))[1],
+        }
+        for order_id in order_ids
+    ]
+    patient_ids = [row["patient_id"] for row in rows]
+    patients_before = count_worklist_patients(session, worklist_id, patient_ids)
+    added = insert_ignore(session, OrderWorkList, rows, ["worklist_id", "order_id"])
+    adjust_worklist_stats(session, worklist_id, added, patient_ids, patients_before)
+    return added
+
+
+def order_keys(
+    session: Session, order_ids: List[int]
+) -> Dict[int, Tuple[Optional[int], Optional[datetime]]]:
+    """
+    Look up the patient_id and event_datetime of orders.
+
+    Orders already in any worklist are read from OrderWorkList. The rest are
+    read from the mirror when it is fresh, otherwise from the remote database.
+    If that lookup fails, those orders are left out, to be filled in later by
+    backfill_order_keys.
+
+    Returns:
+        dict[int, tuple]: (patient_id, event_datetime) by order ID.
+    """
+    keys = {}
+    for chunk in chunked(list(dict.fromkeys(order_ids))):
+        rows = session.exec(
+            select(
+                OrderWorkList.order_id,
+                OrderWorkList.patient_id,
+                OrderWorkList.event_datetime,
+            )
+            .where(
+                OrderWorkList.order_id.in_(chunk),
+                OrderWorkList.patient_id != None,  # noqa ruff:e711
+            )
+            .distinct()
+        )
+        for order_id, patient_id, event_datetime in rows:
+            keys[order_id] = (patient_id, event_datetime)
+
+    missing = [order_id for order_id in order_ids if order_id not in keys]
+    if missing:
+        try:
+            model, source = order_source(session, None)
+            keys.update(fetch_order_keys(missing, session=source, model=model))
+        except Exception as e:
+            logger.error(f"Error looking up patients of added orders: {str(e)}")
+    return keys
+
+
+def backfill_order_keys(session: Session, batch_size: int = 5000) -> int:
+    """
+    Fill in patient_id and event_datetime on OrderWorkList rows that lack
+    them, then refresh the stats of every worklist. Commits after each batch.
+
+    Args:
+        session (Session): Local database session.
+        batch_size (int): Orders looked up and updated per transaction.
+
+    Returns:
+        int: The number of distinct orders filled in.
+    """
+    order_ids = session.exec(
+        select(OrderWorkList.order_id)
+        .where(OrderWorkList.patient_id == None)  # noqa ruff:e711
+        .distinct()
+    ).all()
+    model, source = order_source(session, None)
+
+    # One statement executed for many parameter sets
+    table = OrderWorkList.__table__
+    statement = (
+        update(table)
+        .where(table.c.order_id == bindparam("key_order_id"))
+        .values(
+            patient_id=bindparam("key_patient_id"),
+            event_datetime=bindparam("key_event_datetime"),
+        )
+    )
+
+    updated = 0
+    for batch in chunked(order_ids, batch_size):
+        keys = fetch_order_keys(batch, session=source, model=model)
+        params = [
+            {
+                "key_order_id": order_id,
+                "key_patient_id": patient_id,
+                "key_event_datetime": event_datetime,
+            }
+            for order_id, (patient_id, event_datetime) in keys.items()
+        ]
+        if params:
+            session.connection().execute(statement, params)
+        session.commit()
+        updated += len(params)
+        logger.info(f"Backfilled {updated} of {len(order_ids)} orders")
+
+    worklist_ids = session.exec(select(OrderWorkList.worklist_id).distinct()).all()
+    refresh_worklist_stats(session, worklist_ids)
+    session.commit()
+    return updated
+
+
+def remove_orders(session: Session, worklist_id: int, order_ids: List[int]) -> int:
+    """
+    Remove orders from a worklist and adjust the worklist's stored counts.
+    The caller commits.
+
+    Returns:
+        int: The number of orders removed.
+    """
+    patient_ids = set()
+    for chunk in chunked(order_ids):
+        patient_ids.update(
+            session.exec(
+                select(OrderWorkList.patient_id).where(
+                    OrderWorkList.worklist_id == worklist_id,
+                    OrderWorkList.order_id.in_(chunk),
+                )
+            )
+        )
+    patient_ids.discard(None)
+
+    removed = 0
+    for chunk in chunked(order_ids):
+        statement = delete(OrderWorkList).where(
+            OrderWorkList.worklist_id == worklist_id,
+            OrderWorkList.order_id.in_(chunk),
+        )
+        removed += session.exec(statement).rowcount
+    # Every one of these patients had an order in the worklist before
+    adjust_worklist_stats(session, worklist_id, -removed, patient_ids, len(patient_ids))
+    return removed
+
+
+def update_orders(
+    session: Session,
+    order_ids: List[int],
+    worklist_id: Optional[int] = None,
+    **values,
+) -> int:
+    """
+    Set columns of OrderWorkList rows for the given orders. The caller commits.
+
+    Args:
+        session (Session): The database session.
+        order_ids (List[int]): The orders to update.
+        worklist_id (int | None): Restrict the update to one worklist. When
+            None the orders are updated in every worklist that contains them.
+        **values: The columns to set.
+
+    Returns:
+        int: The number of rows updated.
+    """
+    conditions = ()
+    if worklist_id is not None:
+        conditions = (OrderWorkList.worklist_id == worklist_id,)
+    return bulk_update(
+        session, OrderWorkList, "order_id", order_ids, values, conditions
+    )
+
+
+def copy_orders(
+    session: Session,
+    source_worklist_id: int,
+    target_worklist_id: int,
+    order_ids: List[int],
+) -> Tuple[int, int]:
+    """
+    Copy orders to a worklist with the status, priority and note they have in
+    the source worklist. Orders missing from the source are added with empty
+    values; orders already in the target keep theirs. The caller commits.
+
+    Each chunk of orders is copied with two statements: an INSERT of the
+    orders missing from the target, then an UPDATE that takes the metadata
+    from the matching source rows.
+
+    Returns:
+        tuple[int, int]: The number of orders added to the target, and the
+            number of target rows given the metadata of a source row.
+    """
+    order_ids = list(dict.fromkeys(order_ids))
+    source = aliased(OrderWorkList)
+    in_source = and_(
+        source.worklist_id == source_worklist_id,
+        source.order_id == OrderWorkList.order_id,
+    )
+
+    def source_value(column: str):
+        value = select(getattr(source, column)).where(in_source).scalar_subquery()
+        return func.coalesce(value, "")
+
+    added = add_orders(session, target_worklist_id, order_ids)
+    copied = bulk_update(
+        session,
+        OrderWorkList,
+        "order_id",
+        order_ids,
+        {
+            "status": source_value("status"),
+            "priority": source_value("priority"),
+            "user_note": source_value("user_note"),
+        },
+        (
+            OrderWorkList.worklist_id == target_worklist_id,
+            select(source.id).where(in_source).exists(),
+        ),
+    )
+    return added, copied
@@ -4,16 +4,78 @@ User management module for the ResTrack API.
 This module provides user-related functionality for the ResTrack API:
 - User creation, retrieval, update, and deletion
 - User lookup by username
+- A short-lived cache of users looked up during authentication
 """
 
+import os
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlmodel import Session, delete, select
 
-from restrack.models.worklist import User, UserSecure
-from restrack.api.core import get_app_db_session, logger
+from restrack.cache import TTLCache
+from restrack.models.worklist import User, UserSecure, UserWorkList
+from restrack.api.core import get_app_db_session, local_engine, logger
 
 router = APIRouter(tags=["users"], prefix="/users")
 
+# Seconds a looked-up user is reused for authentication (0 disables)
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
+# Maximum number of users cached
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "1024"))
+
+_user_cache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+
+
+def get_cached_user(username: str, session: Optional[Session] = None) -> User:
+    """
+    Retrieve a user by username, reusing a recent lookup when there is one.
+
+    Used to authenticate requests, so a user is not queried on every request.
+    The cached copy is detached from any session and must not be modified;
+    use get_user_by_username to load a user for changes. Users are removed
+    from the cache when they are updated or deleted, or their password
+    changes.
+
+    Args:
+        username (str): The username of the user to retrieve.
+        session (Session | None): The session used on a cache miss. A new
+            session is opened if none is given.
+
+    Returns:
+        User: The user.
+
+    Raises:
+        HTTPException: If the user is not found, a 404 error is raised.
+    """
+    user = peek_cached_user(username)
+    if user is not None:
+        return user
+    if session is None:
+        with Session(local_engine) as own_session:
+            user = get_user_by_username(username, own_session)
+    else:
+        user = get_user_by_username(username, session)
+    user = User.model_validate(user)
+    _user_cache.set(username, user)
+    return user
+
+
+def peek_cached_user(username: str) -> Optional[User]:
+    """Return the cached user without querying, or None on a miss."""
+    return _user_cache.get(username)
+
+
+def user_cache_stats() -> dict:
+    """Return the size and hit/miss counters of the user cache."""
+    return _user_cache.stats()
+
+
+def invalidate_cached_user(*usernames: str) -> None:
+    """Remove users from the authentication cache after they change."""
+    for username in usernames:
+        _user_cache.pop(username)
+
 
 @router.get("/", response_model=list[UserSecure])
 def get_all_users(local_session: Session = Depends(get_app_db_session)):
@@ -120,19 +182,21 @@ def update_user(
         db_user = session.get(User, user_id)
         if not db_user:
             raise HTTPException(status_code=404, detail="User not found")
+        previous_username = db_user.username
         user_data = user.dict(exclude_unset=True)
         for key, value in user_data.items():
             setattr(db_user, key, value)
         session.add(db_user)
         session.commit()
         session.refresh(db_user)
+        invalidate_cached_user(previous_username, db_user.username)
         return db_user
 
 
 @router.delete("/{user_id}", response_model=User)
 def delete_user(user_id: int, local_session: Session = Depends(get_app_db_session)):
     """
-    Delete a user by ID.
+    Delete a user by ID, together with their worklist subscriptions.
 
     Args:
         user_id (int): The ID of the user to delete.
@@ -148,6 +212,8 @@ def delete_user(user_id: int, local_session: Session = Depends(get_app_db_sessio
         user = session.get(User, user_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
+        session.exec(delete(UserWorkList).where(UserWorkList.user_id == user_id))
         session.delete(user)
         session.commit()
+        invalidate_cached_user(user.username)
         return user
@@ -8,17 +8,42 @@ This module provides worklist-related functionality for the ResTrack API:
 """
 
 import json
-from typing import List, Tuple
-
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, and_, distinct, func, select
+import os
+from typing import Dict, List, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import aliased
+from sqlmodel import (
+    Session,
+    and_,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+)
 
 from restrack.models.worklist import User, WorkList, UserWorkList, OrderWorkList
-from restrack.models.cdm import ORDER
-from restrack.api.core import get_app_db_session, get_remote_db_session, logger
+from restrack.api.core import (
+    get_app_db_session,
+    local_engine,
+    logger,
+)
+from restrack.api.jobs import start_job
+from restrack.api.stats import (
+    adjust_worklist_stats,
+    count_worklist_patients,
+    create_worklist_stats,
+    delete_worklist_stats,
+    read_worklists_stats,
+)
 
 router = APIRouter(tags=["worklists"], prefix="/worklists")
 
+# Orders removed per transaction when a worklist is deleted in the background
+WORKLIST_DELETE_BATCH_SIZE = int(os.getenv("WORKLIST_DELETE_BATCH_SIZE", "5000"))
+
 
 @router.post("/", response_model=WorkList)
 def create_worklist(
@@ -59,6 +84,7 @@ def create_worklist(
             session.add(
                 UserWorkList(user_id=worklist.created_by, worklist_id=worklist.id)
             )
+            create_worklist_stats(session, worklist.id)
             session.commit()
 
             return worklist
@@ -137,6 +163,15 @@ def update_worklist(
         return db_worklist
 
 
+def user_worklists_statement(user_id: int):
+    """SELECT the worklists a user is subscribed to."""
+    return (
+        select(WorkList)
+        .join(UserWorkList, UserWorkList.worklist_id == WorkList.id)
+        .where(UserWorkList.user_id == user_id)
+    )
+
+
 @router.get("/user/{user_id}", response_model=List[WorkList])
 def get_user_worklists(
     user_id: int, local_session: Session = Depends(get_app_db_session)
@@ -159,14 +194,7 @@ def get_user_worklists(
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
-        # Get worklists using a join operation
-        statement = (
-            select(WorkList)
-            .join(UserWorkList, UserWorkList.worklist_id == WorkList.id)
-            .where(UserWorkList.user_id == user_id)
-        )
-
-        worklists = local_session.exec(statement).all()
+        worklists = local_session.exec(user_worklists_statement(user_id)).all()
         logger.debug(f"Found {len(worklists)} worklists for user {user_id}")
 
         return worklists
@@ -286,44 +314,56 @@ def get_all_worklists(local_session: Session):
 
 @router.delete("/{worklist_to_delete}")
 def delete_worklist(
-    worklist_to_delete: int, local_session: Session = Depends(get_app_db_session)
+    worklist_to_delete: int,
+    background: bool = False,
+    local_session: Session = Depends(get_app_db_session),
 ):
     """
     COMPLETELY DELETE A WORKLIST FROM THE DATABASE
 
+    Subscriptions, orders and the worklist itself are removed with one DELETE
+    statement each. With `background=true` the orders are instead removed in
+    batches by a background job whose progress can be polled at /jobs/{job_id}.
+
     Args:
         worklist_to_delete (int): ID of the worklist to delete.
+        background (bool): Run the delete as a background job.
         local_session (Session): The database session dependency.
 
     Returns:
-        dict: Status message.
+        dict: Status message, plus the job ID when run in the background.
     """
     with local_session as session:
-        try:
-            # First delete all user associations
-            statement = select(UserWorkList).where(
-                UserWorkList.worklist_id == worklist_to_delete
+        if not session.get(WorkList, worklist_to_delete):
+            raise HTTPException(status_code=404, detail="Worklist not found")
+
+        if background:
+            job = start_job(
+                "delete_worklist",
+                lambda progress: _delete_worklist_in_batches(
+                    worklist_to_delete, progress
+                ),
+                worklist_id=worklist_to_delete,
             )
-            user_entries = session.exec(statement).all()
-            for entry in user_entries:
-                session.delete(entry)
+            return {
+                "status": "accepted",
+                "message": f"Deleting worklist {worklist_to_delete}",
+                "job_id": job["id"],
+            }
 
-            # Then delete all order associations
-            statement = select(OrderWorkList).where(
-                OrderWorkList.worklist_id == worklist_to_delete
+        try:
+            session.exec(
+                delete(UserWorkList).where(
+                    UserWorkList.worklist_id == worklist_to_delete
+                )
             )
-            order_entries = session.exec(statement).all()
-            for entry in order_entries:
-                session.delete(entry)
-
-            # Finally delete the worklist itself
-            statement = select(WorkList).where(WorkList.id == worklist_to_delete)
-            worklist = session.exec(statement).first()
-
-            if not worklist:
-                raise HTTPException(status_code=404, detail="Worklist not found")
-
-            session.delete(worklist)
+            session.exec(
+                delete(OrderWorkList).where(
+                    OrderWorkList.worklist_id == worklist_to_delete
+                )
+            )
+            delete_worklist_stats(session, worklist_to_delete)
+            session.exec(delete(WorkList).where(WorkList.id == worklist_to_delete))
             session.commit()
 
             return {
@@ -331,8 +371,6 @@ def delete_worklist(
                 "message": f"Worklist {worklist_to_delete} deleted",
             }
 
-        except HTTPException:
-            raise
         except Exception as e:
             session.rollback()
             raise HTTPException(
@@ -340,6 +378,43 @@ def delete_worklist(
             )
 
 
+def _delete_worklist_in_batches(worklist_id: int, progress) -> dict:
+    """
+    Delete a worklist, committing its orders in batches of
+    WORKLIST_DELETE_BATCH_SIZE so no single transaction holds the write lock
+    for long. Subscriptions go first so the worklist disappears from users'
+    lists straight away.
+    """
+    with Session(local_engine) as session:
+        session.exec(delete(UserWorkList).where(UserWorkList.worklist_id == worklist_id))
+        session.commit()
+
+        total = session.exec(
+            select(func.count()).where(OrderWorkList.worklist_id == worklist_id)
+        ).one()
+        deleted = 0
+        progress(deleted, total)
+        while True:
+            batch = (
+                select(OrderWorkList.id)
+                .where(OrderWorkList.worklist_id == worklist_id)
+                .limit(WORKLIST_DELETE_BATCH_SIZE)
+            )
+            removed = session.exec(
+                delete(OrderWorkList).where(OrderWorkList.id.in_(batch))
+            ).rowcount
+            session.commit()
+            if not removed:
+                break
+            deleted += removed
+            progress(deleted, total)
+
+        delete_worklist_stats(session, worklist_id)
+        session.exec(delete(WorkList).where(WorkList.id == worklist_id))
+        session.commit()
+        return {"orders_deleted": deleted}
+
+
 @router.delete("/unsubscribe/{unsubscribe_worklist}", response_model=UserWorkList)
 def unsubscribe_worklist(
     unsubscribe_worklist: str, local_session: Session = Depends(get_app_db_session)
@@ -444,7 +519,7 @@ def subscribe_to_worklist(
 
 
 @router.post("/copy/{worklist_to_copy}")
-async def copy_worklist(
+def copy_worklist(
     worklist_to_copy: str, local_session: Session = Depends(get_app_db_session)
 ):
     """
@@ -458,42 +533,54 @@ async def copy_worklist(
         bool: True if successful.
     """
     worklists = json.loads(worklist_to_copy)
+    target_worklist_id = worklists["current_worklist"]
+    source = aliased(OrderWorkList)
+    target = aliased(OrderWorkList)
     try:
-        # Get order IDs with all metadata from local database
-        with local_session as session:
-            statement = select(
-                OrderWorkList.order_id, 
-                OrderWorkList.status, 
-                OrderWorkList.priority, 
-                OrderWorkList.user_note
-            ).where(
-                OrderWorkList.worklist_id == worklists["worklist_to_copy_from"]
-            )
-            order_data = session.exec(statement).fetchall()
-
-        if not order_data:
-            return True  # Nothing to copy
-
-        for order_row in order_data:
-            order_id, status, priority, user_note = order_row
-            # Check if order already exists in worklist
-            statement = select(OrderWorkList).where(
-                and_(
-                    OrderWorkList.order_id == order_id,
-                    OrderWorkList.worklist_id == worklists["current_worklist"],
-                )
-            )
-            existing = local_session.exec(statement).first()
-            if not existing:
-                local_session.add(
-                    OrderWorkList(
-                        order_id=order_id,
-                        worklist_id=worklists["current_worklist"],
-                        status=status or "",
-                        priority=priority or "",
-                        user_note=user_note or ""
-                    )
-                )
+        # Copy in a single INSERT ... SELECT so the database does the work and
+        # the write lock is held only for that statement
+        already_in_target = select(target.id).where(
+            target.worklist_id == target_worklist_id,
+            target.order_id == source.order_id,
+        )
+        rows = select(
+            source.order_id,
+            literal(target_worklist_id),
+            func.coalesce(source.status, ""),
+            func.coalesce(source.priority, ""),
+            func.coalesce(source.user_note, ""),
+            source.patient_id,
+            source.event_datetime,
+        ).where(
+            source.worklist_id == worklists["worklist_to_copy_from"],
+            ~exists(already_in_target),
+        )
+        statement = insert(OrderWorkList).from_select(
+            [
+                "order_id",
+                "worklist_id",
+                "status",
+                "priority",
+                "user_note",
+                "patient_id",
+                "event_datetime",
+            ],
+            rows,
+        )
+        source_patients = select(source.patient_id).where(
+            source.worklist_id == worklists["worklist_to_copy_from"]
+        )
+        patients_before = count_worklist_patients(
+            local_session, target_worklist_id, source_patients
+        )
+        added = local_session.exec(statement).rowcount
+        adjust_worklist_stats(
+            local_session,
+            target_worklist_id,
+            added,
+            source_patients,
+            patients_before,
+        )
         local_session.commit()
         return True
 
@@ -503,11 +590,28 @@ async def copy_worklist(
         raise HTTPException(status_code=500, detail=f"Error copying worklist: {str(e)}")
 
 
+@router.get("/stats/", response_model=Dict[int, Tuple[int, int]])
+def get_worklists_stats_api(
+    worklist_ids: List[int] = Query(...),
+    local_session: Session = Depends(get_app_db_session),
+):
+    """
+    API endpoint to retrieve statistics for many worklists in one request.
+
+    Args:
+        worklist_ids (List[int]): The IDs of the worklists, e.g.
+            ?worklist_ids=1&worklist_ids=2.
+        local_session (Session): The database session dependency.
+
+    Returns:
+        dict[int, tuple[int, int]]: (order_count, patient_count) by worklist ID.
+    """
+    return get_worklists_stats(worklist_ids, local_session)
+
+
 @router.get("/stats/{worklist_id}", response_model=Tuple[int, int])
 def get_worklist_stats_api(
-    worklist_id: int,
-    local_session: Session = Depends(get_app_db_session),
-    remote_session: Session = Depends(get_remote_db_session),
+    worklist_id: int, local_session: Session = Depends(get_app_db_session)
 ):
     """
     API endpoint to retrieve statistics for a worklist.
@@ -515,74 +619,50 @@ def get_worklist_stats_api(
     Args:
         worklist_id (int): The ID of the worklist.
         local_session (Session): The database session dependency.
-        remote_session (Session): The remote database session dependency.
 
     Returns:
         tuple[int, int]: A tuple containing (order_count, patient_count).
     """
-    return get_worklist_stats(worklist_id, local_session, remote_session)
+    return get_worklist_stats(worklist_id, local_session)
 
 
-def get_worklist_stats(
-    worklist_id: int, local_session: Session, remote_session: Session
-):
+def get_worklist_stats(worklist_id: int, local_session: Session):
     """
     Get statistics for a worklist - number of orders and patients.
 
+    The counts are read from the worklist_stats table, which the endpoints
+    that change a worklist's orders keep up to date.
+
     Args:
         worklist_id (int): The ID of the worklist to get statistics for.
         local_session (Session): Local database session.
-        remote_session (Session): Remote (OMOP) database session.
 
     Returns:
         tuple[int, int]: A tuple containing (order_count, patient_count).
     """
-    try:
-        logger.debug(f"Getting stats for worklist ID: {worklist_id}")
-
-        # Get order count directly from OrderWorkList table
-        with local_session as local:
-            order_count_query = select(distinct(OrderWorkList.order_id)).where(
-                OrderWorkList.worklist_id == worklist_id
-            )
-            order_ids = local.exec(order_count_query).all()
-            order_count = len(order_ids)
-
-            logger.debug(f"Found {order_count} orders for worklist {worklist_id}")
-
-            if order_count == 0:
-                logger.debug(f"No orders found for worklist {worklist_id}")
-                return (0, 0)
-
-        # Get unique patient count from the orders table in the remote DB
-        try:
-            with remote_session as remote:
-                patient_count_query = select(
-                    func.count(distinct(ORDER.patient_id))
-                ).where(
-                    ORDER.order_id.in_(order_ids),
-                    ORDER.cancelled == None,  # noqa ruff:e711
-                )
+    return get_worklists_stats([worklist_id], local_session)[worklist_id]
 
-                patient_count = remote.exec(patient_count_query).one()
 
-                logger.debug(
-                    f"Found {patient_count} patients for worklist {worklist_id}"
-                )
+def get_worklists_stats(
+    worklist_ids: List[int], local_session: Session
+) -> Dict[int, Tuple[int, int]]:
+    """
+    Get statistics for many worklists - number of orders and patients.
 
-                if patient_count == 0:
-                    logger.debug(f"No patients found for worklist {worklist_id}")
-                    return (0, 0)
+    The counts are read from the worklist_stats table in one query, without
+    writing. Only the local database is used.
 
-            return (order_count, patient_count)
+    Args:
+        worklist_ids (List[int]): The IDs of the worklists.
+        local_session (Session): Local database session.
 
-        except Exception as e:
-            logger.error(
-                f"Error getting patient count, falling back to order count: {str(e)}"
-            )
-            # If remote DB is not accessible, return the order count as a fallback
-            return (order_count, 1)  # Default to 1 patient as fallback
+    Returns:
+        dict[int, tuple[int, int]]: (order_count, patient_count) by worklist ID.
+    """
+    try:
+        with local_session as local:
+            return read_worklists_stats(local, worklist_ids)
 
     except Exception as e:
         logger.error(f"Error fetching worklist stats: {str(e)}")
-        return (0, 0)
+        return {worklist_id: (0, 0) for worklist_id in worklist_ids}
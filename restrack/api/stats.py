@@ -0,0 +1,165 @@
+"""
+Worklist statistics for the ResTrack API.
+
+This module maintains the worklist_stats table:
+- Adjusting a worklist's order and patient counts inside the transaction
+  that added or removed its orders
+- Recomputing the counts of worklists from scratch, e.g. after a backfill
+- Creating a new worklist's counts
+- Reading the stored counts of many worklists at once
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, Tuple, Union
+
+from sqlalchemy import Select
+from sqlmodel import Session, delete, distinct, func, select, update
+
+from restrack.models.worklist import OrderWorkList, WorkListStats
+from restrack.api.core import chunked
+
+
+def refresh_worklist_stats(session: Session, worklist_ids: Iterable[int]) -> None:
+    """
+    Recompute the stored counts of the given worklists. The caller commits.
+
+    Changes to a worklist's orders use adjust_worklist_stats instead; this is
+    for changes that touch the counts of many rows at once, such as
+    backfilling patient IDs. Both counts come from one grouped query on the
+    local session, so they include uncommitted changes. Patients are counted
+    from OrderWorkList.patient_id, so orders whose patient is not yet known
+    are not counted as patients.
+
+    Args:
+        session (Session): The local session holding the changes.
+        worklist_ids (Iterable[int]): The worklists whose orders changed.
+    """
+    worklist_ids = list(dict.fromkeys(worklist_ids))
+    counts = {}
+    for chunk in chunked(worklist_ids):
+        rows = session.exec(
+            select(
+                OrderWorkList.worklist_id,
+                func.count(OrderWorkList.id),
+                func.count(distinct(OrderWorkList.patient_id)),
+            )
+            .where(OrderWorkList.worklist_id.in_(chunk))
+            .group_by(OrderWorkList.worklist_id)
+        )
+        for worklist_id, order_count, patient_count in rows:
+            counts[worklist_id] = (order_count, patient_count)
+
+    for worklist_id in worklist_ids:
+        stats = session.get(WorkListStats, worklist_id) or WorkListStats(
+            worklist_id=worklist_id
+        )
+        stats.order_count, stats.patient_count = counts.get(worklist_id, (0, 0))
+        stats.updated_at = datetime.now()
+        session.add(stats)
+    session.flush()
+
+
+def count_worklist_patients(
+    session: Session, worklist_id: int, patient_ids: Union[Iterable[int], Select]
+) -> int:
+    """
+    Count how many of the given patients have an order in a worklist.
+
+    Uses the (worklist_id, patient_id) index, so only the given patients'
+    rows are read, not the whole worklist.
+
+    Args:
+        session (Session): The local session.
+        worklist_id (int): The worklist to look in.
+        patient_ids (Iterable[int] | Select): The patients, or a SELECT of
+            patient IDs used as a subquery.
+    """
+    if isinstance(patient_ids, Select):
+        chunks = [patient_ids]
+    else:
+        chunks = chunked([p for p in dict.fromkeys(patient_ids) if p is not None])
+
+    count = 0
+    for chunk in chunks:
+        count += session.exec(
+            select(func.count(distinct(OrderWorkList.patient_id))).where(
+                OrderWorkList.worklist_id == worklist_id,
+                OrderWorkList.patient_id.in_(chunk),
+            )
+        ).one()
+    return count
+
+
+def adjust_worklist_stats(
+    session: Session,
+    worklist_id: int,
+    order_delta: int,
+    patient_ids: Union[Iterable[int], Select] = (),
+    patients_before: int = 0,
+) -> None:
+    """
+    Apply a change in a worklist's orders to its stored counts. The caller
+    commits.
+
+    order_count moves by `order_delta`, the rowcount of the INSERT or DELETE.
+    patient_count only moves for patients that gained their first order or
+    lost their last one, found by counting the affected patients again.
+
+    Args:
+        session (Session): The local session holding the change.
+        worklist_id (int): The worklist whose orders changed.
+        order_delta (int): Orders added (positive) or removed (negative).
+        patient_ids (Iterable[int] | Select): The patients of the added or
+            removed orders.
+        patients_before (int): count_worklist_patients of `patient_ids`
+            before the change.
+    """
+    if not order_delta:
+        return
+
+    patients_after = count_worklist_patients(session, worklist_id, patient_ids)
+    updated = session.exec(
+        update(WorkListStats)
+        .where(WorkListStats.worklist_id == worklist_id)
+        .values(
+            order_count=WorkListStats.order_count + order_delta,
+            patient_count=WorkListStats.patient_count
+            + (patients_after - patients_before),
+            updated_at=datetime.now(),
+        )
+    ).rowcount
+    if not updated:
+        # No stored counts to adjust yet
+        refresh_worklist_stats(session, [worklist_id])
+
+
+def create_worklist_stats(session: Session, worklist_id: int) -> None:
+    """Store zero counts for a new worklist. The caller commits."""
+    session.add(WorkListStats(worklist_id=worklist_id, updated_at=datetime.now()))
+
+
+def delete_worklist_stats(session: Session, worklist_id: int) -> None:
+    """Remove the stored counts of a deleted worklist. The caller commits."""
+    session.exec(delete(WorkListStats).where(WorkListStats.worklist_id == worklist_id))
+
+
+def read_worklists_stats(
+    session: Session, worklist_ids: Iterable[int]
+) -> Dict[int, Tuple[int, int]]:
+    """
+    Return the stored (order_count, patient_count) of each worklist.
+
+    Read-only: every worklist gets its row when it is created, or from the
+    migration that added the table, so a worklist without one does not exist
+    and is reported as (0, 0).
+    """
+    worklist_ids = list(dict.fromkeys(worklist_ids))
+    stats = {worklist_id: (0, 0) for worklist_id in worklist_ids}
+    for chunk in chunked(worklist_ids):
+        rows = session.exec(
+            select(WorkListStats).where(WorkListStats.worklist_id.in_(chunk))
+        )
+        stats.update(
+            {row.worklist_id: (row.order_count, row.patient_count) for row in rows}
+        )
+    return stats
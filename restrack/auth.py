@@ -3,24 +3,61 @@ Common JWT Authentication utilities for ResTrack
 
 This module provides shared authentication functionality for both web and API components.
 Uses database-backed user credentials with secure password hashing.
+
+Passwords are hashed with PASSWORD_HASH_SCHEME (bcrypt by default). Hashes
+from the legacy unsalted SHA256 scheme are still accepted and are replaced
+with the current scheme on the user's next successful login. Hashing is slow
+by design, so async handlers use the *_async variants, which run it on a
+dedicated thread pool.
 """
 
-import hashlib
+import asyncio
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 import jwt
 from fastapi import Request
+from passlib.context import CryptContext
 from pydantic import BaseModel
 from sqlmodel import Session, select
 
+from restrack.api.core import logger, run_in_db_thread
+from restrack.cache import TTLCache
 from restrack.models.worklist import User
 
 # JWT Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "REPLACE_WITH_STRONG_SECRET_KEY")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_EXPIRE_MINUTES", "30"))
+# Maximum number of decoded tokens kept, each until it expires (0 disables)
+TOKEN_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", "4096"))
+
+# Scheme used for new password hashes
+PASSWORD_HASH_SCHEME = os.getenv("PASSWORD_HASH_SCHEME", "bcrypt")
+# bcrypt cost factor: each step doubles the time to hash or verify
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Threads hashing and verifying passwords for async handlers
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+
+# Recognised password hash schemes. The first is used for new hashes; the
+# others are deprecated and rehashed on login. hex_sha256 is the legacy
+# unsalted SHA256 hex digest.
+password_context = CryptContext(
+    schemes=list(dict.fromkeys([PASSWORD_HASH_SCHEME, "bcrypt", "hex_sha256"])),
+    deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
+)
+
+_password_executor = ThreadPoolExecutor(
+    max_workers=max(PASSWORD_HASH_WORKERS, 1), thread_name_prefix="password"
+)
+
+# Verified claims by raw token, so a token's signature is checked once
+token_cache = TTLCache(maxsize=TOKEN_CACHE_SIZE, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60)
 
 
 class TokenData(BaseModel):
@@ -30,31 +67,114 @@ class TokenData(BaseModel):
     expires: datetime
 
 
+@dataclass
+class AuthContext:
+    """
+    Authentication state of a single request.
+
+    Resolved once per request and kept in `request.state.auth`. The mounted
+    API shares the ASGI scope of the web app, so both see the same context.
+
+    Attributes:
+        token (str | None): The JWT from the header or cookie.
+        claims (TokenData | None): The decoded token, None if missing or invalid.
+        user (User | None): The user, once looked up.
+        user_loaded (bool): Whether the user lookup has run.
+    """
+
+    token: Optional[str] = None
+    claims: Optional[TokenData] = None
+    user: Optional[User] = None
+    user_loaded: bool = False
+
+
 def hash_password(password: str) -> str:
     """
-    Hash a password using SHA256.
+    Hash a password with the current scheme.
     """
-    return hashlib.sha256(password.encode()).hexdigest()
+    return password_context.hash(password)
 
 
 def verify_password(username: str, password: str, session: Session) -> bool:
     """
     Verify password against database user record
+
+    A password stored with a deprecated scheme is rehashed with the current
+    scheme and saved when it verifies.
     """
     try:
-        statement = select(User).where(User.username == username)
-        user = session.exec(statement).first()
-
-        if not user:
-            return False
-
-        hashed_password = hash_password(password)
-        return user.password == hashed_password
+        user = _get_password_user(username, session)
+        valid, new_hash = _check_password(password, user.password if user else None)
+        if valid and new_hash:
+            _save_password_hash(user, new_hash, session)
+        return valid
     except Exception as e:
         print(f"Password verification error: {e}")
         return False
 
 
+def _get_password_user(username: str, session: Session) -> Optional[User]:
+    """Look up the user whose password is being checked."""
+    statement = select(User).where(User.username == username)
+    return session.exec(statement).first()
+
+
+def _check_password(
+    password: str, stored_hash: Optional[str]
+) -> Tuple[bool, Optional[str]]:
+    """
+    Check a password against a stored hash, without touching the database.
+
+    Returns:
+        tuple: (valid, new_hash) - new_hash is set when the stored hash uses a
+            deprecated scheme and should be replaced.
+    """
+    if stored_hash is None:
+        # Take as long as a real check, so usernames cannot be probed
+        password_context.dummy_verify()
+        return False, None
+    return password_context.verify_and_update(password, stored_hash)
+
+
+def _save_password_hash(user: User, new_hash: str, session: Session) -> None:
+    """Store a rehashed password."""
+    user.password = new_hash
+    session.add(user)
+    session.commit()
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password on the password thread pool.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, hash_password, password)
+
+
+async def verify_password_async(username: str, password: str, session: Session) -> bool:
+    """
+    Verify a password without blocking the event loop.
+
+    The user lookup and any rehash write run on the database threads, and
+    only the hash check runs on the password thread pool.
+    """
+    try:
+        user = await run_in_db_thread(_get_password_user, username, session)
+        loop = asyncio.get_running_loop()
+        valid, new_hash = await loop.run_in_executor(
+            _password_executor,
+            _check_password,
+            password,
+            user.password if user else None,
+        )
+        if valid and new_hash:
+            await run_in_db_thread(_save_password_hash, user, new_hash, session)
+        return valid
+    except Exception:
+        logger.exception("Password verification error")
+        return False
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """
     Create JWT access token
@@ -73,7 +193,17 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 def decode_token(token: str):
     """
     Decode and validate JWT token
+
+    Valid tokens are cached until they expire, so repeated requests with the
+    same token skip signature verification.
     """
+    token_data = token_cache.get(token)
+    if token_data is not None:
+        if datetime.utcnow() > token_data.expires:
+            token_cache.pop(token)
+            return None
+        return token_data
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
@@ -89,6 +219,7 @@ def decode_token(token: str):
         if datetime.utcnow() > token_data.expires:
             return None
 
+        token_cache.set(token, token_data, ttl=expiry - time.time())
         return token_data
     except Exception:  # Catch all JWT exceptions
         return None
@@ -126,6 +257,19 @@ async def get_token_from_request(request: Request) -> Optional[str]:
     return token
 
 
+async def get_auth_context(request: Request) -> AuthContext:
+    """
+    Get the authentication context of a request, decoding its token on first use.
+    """
+    context = getattr(request.state, "auth", None)
+    if context is None:
+        token = await get_token_from_request(request)
+        claims = decode_token(token) if token else None
+        context = AuthContext(token=token, claims=claims)
+        request.state.auth = context
+    return context
+
+
 async def get_current_username(
     token: Optional[str] = None, request: Optional[Request] = None
 ):
@@ -133,7 +277,8 @@ async def get_current_username(
     Get username from JWT token
     """
     if not token and request:
-        token = await get_token_from_request(request)
+        context = await get_auth_context(request)
+        return context.claims.username if context.claims else None
 
     if not token:
         return None
@@ -0,0 +1,95 @@
+"""
+In-process caching for ResTrack.
+
+This module provides a small, thread-safe cache with a time to live and a
+bounded size, shared by the web and API components. Entries live in the
+process, so each worker has its own cache and changes made by another worker
+are only seen once the entry expires.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    A bounded mapping whose entries expire `ttl` seconds after being set.
+
+    When full, the least recently used entry is evicted.
+
+    Attributes:
+        maxsize (int): The maximum number of entries kept.
+        ttl (float): Seconds an entry stays valid. 0 disables the cache.
+        hits (int): Lookups that found a valid entry.
+        misses (int): Lookups that found no entry or an expired one.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for `key`, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key, self._MISSING)
+            if entry is self._MISSING:
+                self.misses += 1
+                return default
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store `value` under `key`, evicting the oldest entry if full.
+
+        `ttl` shortens the lifetime of this entry, e.g. to a token's expiry. It
+        never extends it beyond the cache's own ttl.
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove `key` and return its value, or `default` if it was missing."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return entry[1] if entry else default
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return the size, bounds and hit/miss counters of the cache."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
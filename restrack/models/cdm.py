@@ -3,6 +3,7 @@
 from datetime import date, datetime
 from typing import Optional
 from pydantic import ConfigDict
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 from pydantic import BaseModel
 
@@ -562,9 +563,7 @@ class CONCEPT(SQLModel, table=True):
 #     invalid_reason: Optional[str] = Field(max_length=1)
 
 
-class ORDER(SQLModel, table=True):
-    __table_args__ = {"schema": "alan"}
-    __tablename__ = "restrack_orders"
+class ORDER_BASE(SQLModel):
     order_id: int = Field(default=None, primary_key=True)
     visit_id: int
     event_id: int
@@ -586,6 +585,31 @@ class ORDER(SQLModel, table=True):
     updated_at: Optional[datetime]
 
 
+class ORDER(ORDER_BASE, table=True):
+    __table_args__ = {"schema": "alan"}
+    __tablename__ = "restrack_orders"
+
+
+# Local copy of ORDER kept in the application database by restrack.api.mirror
+class ORDER_MIRROR(ORDER_BASE, table=True):
+    __tablename__ = "restrack_orders_mirror"
+    __table_args__ = (Index("ix_restrack_orders_mirror_patient_id", "patient_id"),)
+
+
+# Progress of the ORDER_MIRROR sync job (single row)
+class ORDER_MIRROR_STATE(SQLModel, table=True):
+    __tablename__ = "restrack_orders_mirror_state"
+    id: int = Field(default=1, primary_key=True)
+    watermark: Optional[datetime] = None
+    # Highest order_id synced among rows with neither change timestamp
+    last_order_id: Optional[int] = None
+    last_synced_at: Optional[datetime] = None
+    last_reconciled_at: Optional[datetime] = None
+    # Sync lock shared by all workers, see restrack.api.mirror
+    locked_by: Optional[str] = Field(default=None, max_length=64)
+    locked_until: Optional[datetime] = None
+
+
 class Order(BaseModel):
     order_id: int
     visit_id: int
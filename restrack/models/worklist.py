@@ -1,9 +1,11 @@
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, List, Literal, Optional, Union
 from enum import Enum
 
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, SQLModel
 from pydantic import BaseModel
+from pydantic import Field as PydanticField
 
 
 class WorkListRole(str, Enum):
@@ -71,6 +73,10 @@ class WorkList(SQLModel, table=True):
 
 
 class UserWorkList(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_userworklist_user_id_worklist_id", "user_id", "worklist_id"),
+    )
+
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id")
     worklist_id: int = Field(foreign_key="worklist.id")
@@ -78,12 +84,46 @@ class UserWorkList(SQLModel, table=True):
 
 
 class OrderWorkList(SQLModel, table=True):
+    __table_args__ = (
+        UniqueConstraint(
+            "worklist_id", "order_id", name="uq_orderworklist_worklist_id_order_id"
+        ),
+        Index("ix_orderworklist_worklist_id_patient_id", "worklist_id", "patient_id"),
+    )
+
+    # (worklist_id, order_id) lookups use the unique constraint's index
     id: int | None = Field(default=None, primary_key=True)
-    order_id: int
+    order_id: int = Field(index=True)
     worklist_id: int = Field(foreign_key="worklist.id")
     status: str | None = Field(default="")
     priority: str | None = Field(default="")
     user_note: str | None = Field(default="")
+    # Copied from the ORDER row when the order is added, so patient-level
+    # questions can be answered without the remote database
+    patient_id: int | None = Field(default=None, index=True)
+    event_datetime: datetime | None = Field(default=None)
+
+
+class WorkListStats(SQLModel, table=True):
+    """
+    Order and patient counts for a worklist, adjusted in the same transaction
+    as the orders that are added, removed or copied.
+
+    Attributes:
+        worklist_id (int): The ID of the worklist.
+        order_count (int): The number of orders in the worklist.
+        patient_count (int): The number of distinct patients with an order in
+            the worklist, cancelled orders included. Orders whose patient_id
+            is not yet known are not counted.
+        updated_at (datetime | None): When the counts were last changed.
+    """
+
+    __tablename__ = "worklist_stats"
+
+    worklist_id: int = Field(primary_key=True, foreign_key="worklist.id")
+    order_count: int = Field(default=0)
+    patient_count: int = Field(default=0)
+    updated_at: datetime | None = Field(default=None)
 
 
 def create_db_and_tables(engine):
@@ -108,3 +148,88 @@ class OrderResponse(BaseModel):
     in_progress: Optional[datetime]
     partial: Optional[datetime]
     complete: Optional[datetime]
+
+
+class AddOrdersResponse(BaseModel):
+    added: int
+    already_present: int
+
+
+class CopyOrdersResponse(BaseModel):
+    added: int
+    already_present: int
+    copied: int
+
+
+class UpdateOrdersResponse(BaseModel):
+    updated: int
+
+
+class OrderBatchResult(BaseModel):
+    op: str
+    affected: int
+    added: Optional[int] = None
+    already_present: Optional[int] = None
+
+
+class OrderBatchResponse(BaseModel):
+    results: List[OrderBatchResult]
+
+
+# Pydantic Request Models
+# Operations accepted by the /orders/batch endpoint, selected by "op"
+
+
+class AddOrdersOperation(BaseModel):
+    op: Literal["add"]
+    worklist_id: int
+    order_ids: List[int]
+
+
+class RemoveOrdersOperation(BaseModel):
+    op: Literal["remove"]
+    worklist_id: int
+    order_ids: List[int]
+
+
+class OrderStatusOperation(BaseModel):
+    op: Literal["status"]
+    action: str
+    order_ids: List[int]
+
+
+class OrderPriorityOperation(BaseModel):
+    op: Literal["priority"]
+    priority: str
+    order_ids: List[int]
+
+
+class OrderNoteOperation(BaseModel):
+    op: Literal["note"]
+    note_text: str
+    worklist_id: int
+    order_ids: List[int]
+
+
+class CopyOrdersOperation(BaseModel):
+    op: Literal["copy"]
+    source_worklist_id: int
+    target_worklist_id: int
+    order_ids: List[int]
+
+
+OrderBatchOperation = Annotated[
+    Union[
+        AddOrdersOperation,
+        RemoveOrdersOperation,
+        OrderStatusOperation,
+        OrderPriorityOperation,
+        OrderNoteOperation,
+        CopyOrdersOperation,
+    ],
+    PydanticField(discriminator="op"),
+]
+
+
+class OrderBatchRequest(BaseModel):
+    operations: List[OrderBatchOperation]
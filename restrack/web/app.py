@@ -2,10 +2,11 @@
 Web application main module - FastAPI app with htmx frontend
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
-from itertools import groupby
 from typing import Optional
+from urllib.parse import urlencode
 import re
 
 import uvicorn
@@ -14,35 +15,62 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from sqlmodel import Session
-
-from restrack.api.core import get_app_db_session, get_remote_db_session
+from starlette.concurrency import run_in_threadpool
+
+from restrack.api.core import (
+    get_app_db_session,
+    get_remote_db_session,
+    lifespan,
+    local_engine,
+    run_in_db_thread,
+)
+from restrack.api.auth import get_request_user
 from restrack.api.main import (
     app as api_app,
 )
-from restrack.api.routers.orders import get_patient_orders, get_worklist_orders
+from restrack.api.filters import OrderFilters, order_filters
+from restrack.api.pagination import decode_cursor
+from restrack.api.projection import ORDER_TABLE_FIELDS
+from restrack.api.routers.orders import (
+    fetch_patient_orders,
+    fetch_worklist_page,
+    get_worklist_order_statuses,
+)
 from restrack.api.routers.users import create_user as api_create_user
 from restrack.api.routers.users import get_user_by_username, get_all_users, delete_user as api_delete_user
+from restrack.api.routers.users import invalidate_cached_user
 from restrack.api.routers.worklists import create_worklist as api_create_worklist
 from restrack.api.routers.worklists import (
     get_all_worklists,
     get_user_worklists,
     get_worklist_stats,
+    get_worklists_stats,
 )
 from restrack.auth import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     create_access_token,
     get_current_username,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
 )
 from restrack.models.worklist import User, WorkList
-from restrack.web.utils import get_status_class, get_status_description
+from restrack.web.utils import (
+    ServerTiming,
+    build_order_rows,
+    group_order_rows,
+    sort_order_rows,
+)
 
 # Create the main app
-app = FastAPI(title="ResTrack Web", description="Results Tracking Portal")
+# Mounted apps do not run their own lifespan, so the web app runs the API's.
+# Handlers here are async, so all database calls go through run_in_db_thread.
+app = FastAPI(
+    title="ResTrack Web", description="Results Tracking Portal", lifespan=lifespan
+)
 
 
-# Middleware to enforce authentication globally except for login/logout
+# Middleware to enforce authentication globally except for login/logout.
+# The decoded token is kept in request.state.auth for the mounted API as well.
 @app.middleware("http")
 async def enforce_auth_middleware(request: Request, call_next):
     public_paths = ["/login", "/logout", "/static", "/favicon.ico"]
@@ -75,7 +103,7 @@ async def get_current_user(
         return None
 
     try:
-        return get_user_by_username(username, session)
+        return await get_request_user(request, session)
     except Exception:
         # Fallback for development
         return User(id=1, username=username, email=f"{username}@example.com")
@@ -112,7 +140,7 @@ async def login(
 ):
     """Process login form"""
     # Verify user credentials using database-backed authentication
-    if not verify_password(username, password, session):
+    if not await verify_password_async(username, password, session):
         return templates.TemplateResponse(
             "login.html",
             {
@@ -123,7 +151,7 @@ async def login(
         )
 
     # Check if user must change password
-    user = get_user_by_username(username, session)
+    user = await run_in_db_thread(get_user_by_username, username, session)
     if getattr(user, "must_change_password", False):
         # Set token so user is authenticated for password change
         access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -187,16 +215,16 @@ async def worklist_selector(
 ):
     """Get worklist selector component"""
 
-    worklists = get_user_worklists(current_user.id, session)
+    worklists = await run_in_db_thread(get_user_worklists, current_user.id, session)
 
-    # Get stats for each worklist
-    remote_session = next(get_remote_db_session())
+    # Get stats for all worklists at once
+    stats = await run_in_db_thread(
+        get_worklists_stats, [worklist.id for worklist in worklists], session
+    )
     worklists_with_stats = []
 
     for worklist in worklists:
-        order_count, patient_count = get_worklist_stats(
-            worklist.id, session, remote_session
-        )
+        order_count, patient_count = stats[worklist.id]
         worklist_dict = {
             "id": worklist.id,
             "name": worklist.name,
@@ -220,7 +248,7 @@ async def worklist_selector_fast(
 ):
     """Get worklist selector component without stats for fast loading"""
 
-    worklists = get_user_worklists(current_user.id, session)
+    worklists = await run_in_db_thread(get_user_worklists, current_user.id, session)
 
     # Return worklists without stats for immediate display
     worklists_without_stats = []
@@ -249,129 +277,161 @@ async def worklist_selector_fast(
 async def worklist_orders(
     worklist_id: int,
     request: Request,
+    cursor: Optional[str] = None,
+    filters: OrderFilters = Depends(order_filters),
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_app_db_session),
+    remote_session: Session = Depends(get_remote_db_session),
 ):
-    """Get orders for a worklist"""
+    """Get one page of orders for a worklist, filtered and sorted in the queries"""
 
-    try:
-        remote_session = next(get_remote_db_session())
-        orders_data = get_worklist_orders(worklist_id, session, remote_session)
-        orders, order_statuses = orders_data
-
-        # Combine orders with their statuses
-        order_dict = {order.order_id: order for order in orders}  # noqa ruff:f841
-        status_dict = {
-            status[0]: {"status": status[1], "note": status[2], "priority": status[3]}
-            for status in order_statuses
-        }
+    timing = ServerTiming()
+    # Grouping by patient would undo a requested sort order
+    group = filters.is_default_sort
 
-        combined_orders = []
-        for order in orders:
-            # Add system status info
-            system_status = None
-            system_status_text = None
-            system_status_class = None
-
-            if order.current_status is not None:
-                system_status = order.current_status
-                system_status_text = get_status_description(order.current_status)
-                system_status_class = get_status_class(order.current_status)
-
-            order_info = {
-                "order": order,
-                "status": status_dict.get(
-                    order.order_id, {"status": None, "note": None}
-                ),
-                "system_status": system_status,
-                "system_status_text": system_status_text,
-                "system_status_class": system_status_class,
-            }
-            combined_orders.append(order_info)
-
-        # Sort orders by patient_id and date (descending) for grouping
-        combined_orders.sort(key=lambda x: (x["order"].patient_id, x["order"].event_datetime or datetime.min), reverse=True)
-
-        # Group orders by patient_id
-        grouped_orders = {}
-        for patient_id, group in groupby(
-            combined_orders, key=lambda x: x["order"].patient_id
-        ):
-            # Convert group to list and ensure it maintains the date sorting within the group
-            grouped_orders[patient_id] = sorted(
-                list(group),
-                key=lambda x: x["order"].event_datetime or datetime.min,
-                reverse=True
+    async def load_orders():
+        async with timing.stage("local"):
+            order_ids_and_status = await run_in_db_thread(
+                get_worklist_order_statuses, worklist_id, session, filters
+            )
+        async with timing.stage("remote"):
+            return await run_in_db_thread(
+                fetch_worklist_page,
+                order_ids_and_status,
+                session,
+                remote_session,
+                limit=None,
+                cursor=cursor,
+                fields=ORDER_TABLE_FIELDS,
+                filters=filters,
+                by_patient=group,
             )
 
-        return templates.TemplateResponse(
-            "components/orders_table.html",
-            {
-                "request": request,
-                "orders": combined_orders,
-                "grouped_orders": grouped_orders,
-                "worklist_id": worklist_id,
-            },
+    async def load_copy_targets():
+        # Only the first page renders the copy-to selector
+        if cursor:
+            return None
+        async with timing.stage("copy_targets"):
+            return await run_in_db_thread(_get_copy_targets)
+
+    try:
+        # The orders and the copy-to selector data are independent
+        orders_data, copy_worklists = await asyncio.gather(
+            load_orders(), load_copy_targets()
+        )
+        orders, order_statuses, next_cursor = orders_data
+
+        async with timing.stage("shape"):
+            combined_orders, grouped_orders = await run_in_threadpool(
+                _shape_worklist_orders,
+                orders,
+                order_statuses,
+                group=group,
+            )
+
+        # A patient's orders can run on from the previous page, under the
+        # header already rendered there
+        continues_group = bool(
+            cursor
+            and grouped_orders
+            and next(iter(grouped_orders))
+            == decode_cursor(cursor, filters.sort, by_patient=True)[0]
         )
+
+        next_url = None
+        if next_cursor:
+            # Later pages keep the filters and sort of this one
+            params = [
+                (key, value)
+                for key, value in request.query_params.multi_items()
+                if key != "cursor"
+            ]
+            next_url = f"/worklists/{worklist_id}/orders?" + urlencode(
+                [*params, ("cursor", next_cursor)]
+            )
+
+        # Further pages only render their rows, appended by the table's scroll trigger
+        async with timing.stage("render"):
+            response = await run_in_threadpool(
+                templates.TemplateResponse,
+                "components/orders_rows.html" if cursor else "components/orders_table.html",
+                {
+                    "request": request,
+                    "orders": combined_orders,
+                    "grouped_orders": grouped_orders,
+                    "continues_group": continues_group,
+                    "worklist_id": worklist_id,
+                    "next_url": next_url,
+                    "copy_worklists": copy_worklists,
+                },
+            )
+        return timing.apply(response)
     except Exception as e:
         return f"<div class='alert alert-danger'>Error loading orders: {str(e)}</div>"
 
 
+def _get_copy_targets():
+    """Worklists offered by the copy-to selector, read on a session of their own
+    so it can run alongside the orders queries."""
+    with Session(local_engine) as copy_session:
+        return get_all_worklists(copy_session)
+
+
+def _shape_worklist_orders(orders, order_statuses, group=True):
+    """Combine a page of orders with their statuses and, unless `group` is
+    False, group them by patient."""
+    statuses = {
+        order_id: (status, note, priority)
+        for order_id, status, note, priority in order_statuses
+    }
+    rows = build_order_rows(orders, statuses)
+    grouped_orders = group_order_rows(rows) if group else None
+    return rows, grouped_orders
+
+
 @app.get("/orders/patient")
 async def patient_orders(
     patient_id: int,
     request: Request,
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_app_db_session),
+    remote_session: Session = Depends(get_remote_db_session),
 ):
-    """Get orders for a patient"""
+    """Get one page of orders for a patient"""
 
     try:
-        remote_session = next(get_remote_db_session())
-        orders_data = get_patient_orders(patient_id, session, remote_session)
-        orders, order_statuses = orders_data
-
-        # Combine orders with their statuses
-        status_dict = {
-            status[0]: {"status": status[1], "note": status[2]}
-            for status in order_statuses
-        }
-
-        combined_orders = []
-        for order in orders:
-            # Add system status info
-            system_status = None
-            system_status_text = None
-            system_status_class = None
-
-            if order.current_status is not None:
-                system_status = order.current_status
-                system_status_text = get_status_description(order.current_status)
-                system_status_class = get_status_class(order.current_status)
-
-            order_info = {
-                "order": order,
-                "status": status_dict.get(
-                    order.order_id, {"status": None, "note": None}
-                ),
-                "system_status": system_status,
-                "system_status_text": system_status_text,
-                "system_status_class": system_status_class,
-            }
-            combined_orders.append(order_info)
-            
-        # Sort orders by date descending
-        combined_orders.sort(
-            key=lambda x: x["order"].event_datetime or datetime.min,
-            reverse=True
+        orders_data = await run_in_db_thread(
+            fetch_patient_orders,
+            patient_id,
+            session,
+            remote_session,
+            limit=None,
+            cursor=cursor,
+            fields=ORDER_TABLE_FIELDS,
         )
+        orders, order_statuses, next_cursor = orders_data
+
+        # Combine orders with their statuses, showing the first worklist
+        # membership when an order belongs to several worklists
+        statuses = {}
+        for status in order_statuses:
+            statuses.setdefault(status[0], (status[2], status[3], None))
 
+        combined_orders = sort_order_rows(build_order_rows(orders, statuses))
+
+        next_url = None
+        if next_cursor:
+            next_url = f"/orders/patient?patient_id={patient_id}&cursor={next_cursor}"
+
+        # Further pages only render their rows, appended by the table's scroll trigger
         return templates.TemplateResponse(
-            "components/orders_table.html",
+            "components/orders_rows.html" if cursor else "components/orders_table.html",
             {
                 "request": request,
                 "orders": combined_orders,
                 "is_patient_search": True,
+                "next_url": next_url,
             },
         )
     except HTTPException as e:
@@ -394,7 +454,7 @@ async def create_worklist(
         worklist = WorkList(
             name=name, description=description, created_by=current_user.id
         )
-        api_create_worklist(worklist, session)
+        await run_in_db_thread(api_create_worklist, worklist, session)
         return f"<div class='alert alert-success'>Worklist '{name}' created successfully!</div>"
     except HTTPException as e:
         return f"<div class='alert alert-danger'>{e.detail}</div>"
@@ -415,8 +475,11 @@ async def subscription_manager(
         logger = logging.getLogger(__name__)
         logger.debug(f"Loading subscription manager for user ID: {current_user.id}")
 
-        all_worklists = get_all_worklists(session)
-        user_worklists = {w.id for w in get_user_worklists(current_user.id, session)}
+        all_worklists = await run_in_db_thread(get_all_worklists, session)
+        subscribed = await run_in_db_thread(
+            get_user_worklists, current_user.id, session
+        )
+        user_worklists = {w.id for w in subscribed}
         # Annotate each worklist with subscription status
         worklists_with_status = []
         for w in all_worklists:
@@ -454,7 +517,7 @@ async def copy_manager(
         logger = logging.getLogger(__name__)
         logger.debug("Loading copy manager")
 
-        all_worklists = get_all_worklists(session)
+        all_worklists = await run_in_db_thread(get_all_worklists, session)
         logger.debug(f"Found {len(all_worklists)} total worklists")
 
         return templates.TemplateResponse(
@@ -478,7 +541,7 @@ async def delete_manager(
     if current_user.username != "admin":
         return "<div class='alert alert-danger'>Access denied</div>"
 
-    all_worklists = get_all_worklists(session)
+    all_worklists = await run_in_db_thread(get_all_worklists, session)
     return templates.TemplateResponse(
         "components/delete_manager.html",
         {"request": request, "worklists": all_worklists, "user": current_user},
@@ -495,7 +558,7 @@ async def delete_user_manager(
     if current_user.username != "admin":
         return "<div class='alert alert-danger'>Access denied</div>"
 
-    all_users = get_all_users(session)
+    all_users = await run_in_db_thread(get_all_users, session)
     return templates.TemplateResponse(
         "components/delete_user_manager.html",
         {"request": request, "users": all_users, "user": current_user},
@@ -533,14 +596,14 @@ async def create_user(
         return "<div class='alert alert-danger'>Passwords do not match.</div>"
 
     try:
-        hashed_password = hash_password(password)
+        hashed_password = await hash_password_async(password)
         user = User(
             username=username,
             email=email,
             password=hashed_password,
             must_change_password=True,
         )
-        created_user = api_create_user(user, session)
+        created_user = await run_in_db_thread(api_create_user, user, session)
         return f"<div class='alert alert-success'>User '{created_user.username}' created successfully!</div>"
     except HTTPException as e:
         return f"<div class='alert alert-danger'>{e.detail}</div>"
@@ -548,6 +611,26 @@ async def create_user(
         return f"<div class='alert alert-danger'>Error creating user: {str(e)}</div>"
 
 
+@app.get("/worklists/stats")
+async def worklists_stats(
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_app_db_session),
+):
+    """Get stats for all of the current user's worklists"""
+    worklists = await run_in_db_thread(get_user_worklists, current_user.id, session)
+    stats = await run_in_db_thread(
+        get_worklists_stats, [worklist.id for worklist in worklists], session
+    )
+    return [
+        {
+            "worklist_id": worklist_id,
+            "order_count": order_count,
+            "patient_count": patient_count,
+        }
+        for worklist_id, (order_count, patient_count) in stats.items()
+    ]
+
+
 @app.get("/worklists/{worklist_id}/stats")
 async def worklist_stats(
     worklist_id: int,
@@ -556,9 +639,8 @@ async def worklist_stats(
 ):
     """Get stats for a specific worklist"""
     try:
-        remote_session = next(get_remote_db_session())
-        order_count, patient_count = get_worklist_stats(
-            worklist_id, session, remote_session
+        order_count, patient_count = await run_in_db_thread(
+            get_worklist_stats, worklist_id, session
         )
         return {
             "worklist_id": worklist_id,
@@ -598,7 +680,7 @@ async def change_password(
         return RedirectResponse(url="/login", status_code=302)
 
     # Check old password
-    if not verify_password(current_user.username, old_password, session):
+    if not await verify_password_async(current_user.username, old_password, session):
         return templates.TemplateResponse(
             "change_password.html",
             {
@@ -633,12 +715,16 @@ async def change_password(
         )
 
     # Update password and must_change_password flag
-    try:
+    def update_password(hashed_password):
         db_user = get_user_by_username(current_user.username, session)
-        db_user.password = hash_password(new_password)
+        db_user.password = hashed_password
         db_user.must_change_password = False
         session.add(db_user)
         session.commit()
+        invalidate_cached_user(db_user.username)
+
+    try:
+        await run_in_db_thread(update_password, await hash_password_async(new_password))
         return RedirectResponse(url="/", status_code=302)
     except Exception as e:
         return templates.TemplateResponse(
@@ -660,8 +746,8 @@ async def copy_to_worklist_selector(
     """Get copy-to-worklist selector component"""
     try:
         # Get all worklists except the current one
-        worklists = get_all_worklists(session)
-        
+        worklists = await run_in_db_thread(get_all_worklists, session)
+
         return templates.TemplateResponse(
             "components/copy_to_worklist.html",
             {
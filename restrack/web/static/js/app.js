@@ -108,6 +108,9 @@ function initializeTableCheckboxes() {
     console.log('Found', checkboxes.length, 'order checkboxes');
     
     checkboxes.forEach(checkbox => {
+        // Rows from earlier pages are already bound when more rows are appended
+        if (checkbox.dataset.bound) return;
+        checkbox.dataset.bound = 'true';
         checkbox.addEventListener('change', function () {
             const orderId = parseInt(this.value);
             const row = this.closest('tr');
@@ -129,7 +132,8 @@ function initializeTableCheckboxes() {
 
     // Select all checkbox
     const selectAllCheckbox = document.getElementById('select-all');
-    if (selectAllCheckbox) {
+    if (selectAllCheckbox && !selectAllCheckbox.dataset.bound) {
+        selectAllCheckbox.dataset.bound = 'true';
         selectAllCheckbox.addEventListener('change', function () {
             const checkboxes = document.querySelectorAll('.order-checkbox');
             checkboxes.forEach(checkbox => {
@@ -212,6 +216,22 @@ function updateActionButtons() {
     });
 }
 
+// Apply order operations in one request. Resolves to one result per operation.
+function postOrderBatch(operations) {
+    return fetch('/api/v1/orders/batch', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ operations: operations })
+    })
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`Order batch failed (${response.status})`);
+            }
+            return response.json();
+        })
+        .then(batch => batch.results);
+}
+
 // Add selected orders to current worklist
 function addSelectedToWorklist() {
     if (!currentWorklistId) {
@@ -226,24 +246,22 @@ function addSelectedToWorklist() {
 
     const orderIds = Array.from(selectedOrders);
 
-    fetch('/api/v1/add_to_worklist/' + encodeURIComponent(JSON.stringify({
+    postOrderBatch([{
+        op: 'add',
         worklist_id: currentWorklistId,
         order_ids: orderIds
-    })), {
-        method: 'PUT'
-    })
-        .then(response => response.json())
-        .then(success => {
-            if (success) {
-                showToast(`Added ${orderIds.length} orders to worklist`, 'success');
-                selectedOrders.clear();
-                updateAddToWorklistButton();
-                // Refresh current worklist if it's selected
-                if (currentWorklistId) {
-                    htmx.ajax('GET', `/worklists/${currentWorklistId}/orders`, { target: '#orders-table' });
-                }
-            } else {
-                showToast('Failed to add orders to worklist', 'danger');
+    }])
+        .then(([result]) => {
+            let message = `Added ${result.affected} orders to worklist`;
+            if (result.already_present > 0) {
+                message += ` (${result.already_present} already present)`;
+            }
+            showToast(message, 'success');
+            selectedOrders.clear();
+            updateAddToWorklistButton();
+            // Refresh current worklist if it's selected
+            if (currentWorklistId) {
+                htmx.ajax('GET', `/worklists/${currentWorklistId}/orders`, { target: '#orders-table' });
             }
         })
         .catch(error => {
@@ -262,24 +280,21 @@ function updateOrderStatus() {
         return;
     }
 
-    const orderIds = Array.from(selectedOrders); fetch('/api/v1/comment/' + encodeURIComponent(JSON.stringify({
+    const orderIds = Array.from(selectedOrders);
+
+    postOrderBatch([{
+        op: 'status',
         action: selectedStatus,
         order_ids: orderIds
-    })), {
-        method: 'PUT'
-    })
-        .then(response => {
-            if (response.ok) {
-                showToast(`Updated status for ${orderIds.length} orders`, 'success');
-                statusSelect.value = '';
-                selectedOrders.clear();
-                updateActionButtons();
-                // Refresh current worklist
-                if (currentWorklistId) {
-                    htmx.ajax('GET', `/worklists/${currentWorklistId}/orders`, { target: '#orders-table' });
-                }
-            } else {
-                showToast('Failed to update order status', 'danger');
+    }])
+        .then(() => {
+            showToast(`Updated status for ${orderIds.length} orders`, 'success');
+            statusSelect.value = '';
+            selectedOrders.clear();
+            updateActionButtons();
+            // Refresh current worklist
+            if (currentWorklistId) {
+                htmx.ajax('GET', `/worklists/${currentWorklistId}/orders`, { target: '#orders-table' });
             }
         })
         .catch(error => {
@@ -300,24 +315,19 @@ function updateOrderPriority() {
 
     const orderIds = Array.from(selectedOrders);
 
-    fetch('/api/v1/update_priority/' + encodeURIComponent(JSON.stringify({
+    postOrderBatch([{
+        op: 'priority',
         priority: selectedPriority,
         order_ids: orderIds
-    })), {
-        method: 'PUT'
-    })
-        .then(response => {
-            if (response.ok) {
-                showToast(`Updated priority for ${orderIds.length} orders`, 'success');
-                prioritySelect.value = '';
-                selectedOrders.clear();
-                updateActionButtons();
-                // Refresh current worklist
-                if (currentWorklistId) {
-                    htmx.ajax('GET', `/worklists/${currentWorklistId}/orders`, { target: '#orders-table' });
-                }
-            } else {
-                showToast('Failed to update order priority', 'danger');
+    }])
+        .then(() => {
+            showToast(`Updated priority for ${orderIds.length} orders`, 'success');
+            prioritySelect.value = '';
+            selectedOrders.clear();
+            updateActionButtons();
+            // Refresh current worklist
+            if (currentWorklistId) {
+                htmx.ajax('GET', `/worklists/${currentWorklistId}/orders`, { target: '#orders-table' });
             }
         })
         .catch(error => {
@@ -338,25 +348,20 @@ function addNote() {
 
     const orderIds = Array.from(selectedOrders);
 
-    fetch('/api/v1/annotate/' + encodeURIComponent(JSON.stringify({
+    postOrderBatch([{
+        op: 'note',
         note_text: noteText,
         order_ids: orderIds,
         worklist_id: currentWorklistId
-    })), {
-        method: 'POST'
-    })
-        .then(response => {
-            if (response.ok) {
-                showToast(`Added note to ${orderIds.length} orders`, 'success');
-                noteInput.value = '';
-                selectedOrders.clear();
-                updateActionButtons();
-                // Refresh current worklist
-                if (currentWorklistId) {
-                    htmx.ajax('GET', `/worklists/${currentWorklistId}/orders`, { target: '#orders-table' });
-                }
-            } else {
-                showToast('Failed to add note', 'danger');
+    }])
+        .then(() => {
+            showToast(`Added note to ${orderIds.length} orders`, 'success');
+            noteInput.value = '';
+            selectedOrders.clear();
+            updateActionButtons();
+            // Refresh current worklist
+            if (currentWorklistId) {
+                htmx.ajax('GET', `/worklists/${currentWorklistId}/orders`, { target: '#orders-table' });
             }
         })
         .catch(error => {
@@ -378,22 +383,17 @@ function removeFromWorklist() {
 
     const orderIds = Array.from(selectedOrders);
 
-    fetch('/api/v1/remove_from_worklist/' + encodeURIComponent(JSON.stringify({
+    postOrderBatch([{
+        op: 'remove',
         worklist_id: currentWorklistId,
         order_ids: orderIds
-    })), {
-        method: 'DELETE'
-    })
-        .then(response => {
-            if (response.ok) {
-                showToast(`Removed ${orderIds.length} orders from worklist`, 'success');
-                selectedOrders.clear();
-                updateActionButtons();
-                // Refresh current worklist
-                htmx.ajax('GET', `/worklists/${currentWorklistId}/orders`, { target: '#orders-table' });
-            } else {
-                showToast('Failed to remove orders', 'danger');
-            }
+    }])
+        .then(() => {
+            showToast(`Removed ${orderIds.length} orders from worklist`, 'success');
+            selectedOrders.clear();
+            updateActionButtons();
+            // Refresh current worklist
+            htmx.ajax('GET', `/worklists/${currentWorklistId}/orders`, { target: '#orders-table' });
         })
         .catch(error => {
             console.error('Error:', error);
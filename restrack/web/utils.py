@@ -3,8 +3,44 @@ Utility functions for the web application
 """
 
 import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
 import httpx
-from fastapi import Request
+from fastapi import Request, Response
+
+
+STATUS_DESCRIPTIONS = {
+    1: "waiting for review",
+    10: "no show",
+    11: "supplemental",
+    2: "data not collected",
+    3: "scheduled",
+    4: "in progress",
+    5: "partial",
+    6: "complete",
+    7: "cancelled",
+    8: "resolved",
+    9: "entered",
+    -1: "NA",
+}
+
+STATUS_CLASSES = {
+    1: "secondary",  # waiting for review
+    2: "warning",  # data not collected
+    3: "info",  # scheduled
+    4: "primary",  # in progress
+    5: "warning",  # partial
+    6: "success",  # complete
+    7: "danger",  # cancelled
+    8: "dark",  # resolved (changed from success to dark/black)
+    9: "info",  # entered
+    10: "danger",  # no show
+    11: "danger",  # supplemental
+    -1: "secondary",  # NA
+}
 
 
 def get_status_description(status_code: int) -> str:
@@ -17,22 +53,7 @@ def get_status_description(status_code: int) -> str:
     Returns:
         The textual description of the status
     """
-    status_map = {
-        1: "waiting for review",
-        10: "no show",
-        11: "supplemental",
-        2: "data not collected",
-        3: "scheduled",
-        4: "in progress",
-        5: "partial",
-        6: "complete",
-        7: "cancelled",
-        8: "resolved",
-        9: "entered",
-        -1: "NA",
-    }
-
-    return status_map.get(status_code, "unknown")
+    return STATUS_DESCRIPTIONS.get(status_code, "unknown")
 
 
 def get_status_class(status_code: int) -> str:
@@ -45,22 +66,7 @@ def get_status_class(status_code: int) -> str:
     Returns:
         A Bootstrap class name for styling
     """
-    status_classes = {
-        1: "secondary",  # waiting for review
-        2: "warning",  # data not collected
-        3: "info",  # scheduled
-        4: "primary",  # in progress
-        5: "warning",  # partial
-        6: "success",  # complete
-        7: "danger",  # cancelled
-        8: "dark",  # resolved (changed from success to dark/black)
-        9: "info",  # entered
-        10: "danger",  # no show
-        11: "danger",  # supplemental
-        -1: "secondary",  # NA
-    }
-
-    return status_classes.get(status_code, "secondary")
+    return STATUS_CLASSES.get(status_code, "secondary")
 
 
 # API client for authenticated requests
@@ -111,3 +117,131 @@ async def call_api(
     if response.content:
         return response.json()
     return None
+
+
+class ServerTiming:
+    """
+    Collects the duration of named stages of a request and reports them in a
+    Server-Timing header, visible in the browser's network panel.
+
+    Example:
+        timing = ServerTiming()
+        async with timing.stage("remote"):
+            ...
+        timing.apply(response)
+    """
+
+    def __init__(self):
+        self.stages: List[Tuple[str, float]] = []
+
+    @asynccontextmanager
+    async def stage(self, name: str):
+        """Time the enclosed block as stage `name`. Stages may overlap."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, (time.perf_counter() - start) * 1000))
+
+    def header(self) -> str:
+        """The Server-Timing header value, e.g. "local;dur=1.2, remote;dur=80.5"."""
+        return ", ".join(f"{name};dur={duration:.1f}" for name, duration in self.stages)
+
+    def apply(self, response: Response) -> Response:
+        """Set the Server-Timing header on `response` and return it."""
+        if self.stages:
+            response.headers["Server-Timing"] = self.header()
+        return response
+
+
+class OrderRow:
+    """
+    One row of the orders table: an order with its worklist status.
+
+    Slotted, as a worklist page can hold tens of thousands of rows. `status`,
+    `note` and `priority` come from the worklist membership; the system status
+    fields are derived from the order's current_status.
+    """
+
+    __slots__ = ("order", "status", "note", "priority")
+
+    def __init__(self, order, status=None, note=None, priority=None):
+        self.order = order
+        self.status = status
+        self.note = note
+        self.priority = priority
+
+    @property
+    def system_status(self) -> Optional[int]:
+        return self.order.current_status
+
+    @property
+    def system_status_text(self) -> Optional[str]:
+        if self.order.current_status is None:
+            return None
+        return STATUS_DESCRIPTIONS.get(self.order.current_status, "unknown")
+
+    @property
+    def system_status_class(self) -> Optional[str]:
+        if self.order.current_status is None:
+            return None
+        return STATUS_CLASSES.get(self.order.current_status, "secondary")
+
+
+def build_order_rows(orders: Iterable, statuses: Dict[int, tuple]) -> List[OrderRow]:
+    """
+    Build the table rows for a page of orders.
+
+    Args:
+        orders: The ORDER rows.
+        statuses: (status, note, priority) by order ID. Orders without an entry
+            get empty statuses.
+
+    Returns:
+        List[OrderRow]: One row per order, in the order given.
+    """
+    empty = (None, None, None)
+    return [OrderRow(order, *statuses.get(order.order_id, empty)) for order in orders]
+
+
+def _newest_first_key(row: OrderRow):
+    return row.order.event_datetime or datetime.min
+
+
+def _patient_newest_first_key(row: OrderRow):
+    order = row.order
+    patient_id = order.patient_id
+    return (
+        patient_id is not None,
+        patient_id or 0,
+        order.event_datetime or datetime.min,
+        order.order_id,
+    )
+
+
+def sort_order_rows(rows: List[OrderRow]) -> List[OrderRow]:
+    """Sort rows newest first, in place, and return them."""
+    rows.sort(key=_newest_first_key, reverse=True)
+    return rows
+
+
+def group_order_rows(rows: List[OrderRow]) -> Dict[Optional[int], List[OrderRow]]:
+    """
+    Sort rows by patient, then newest first, and group them by patient ID.
+    This is the order the grouped worklist pages are fetched in.
+
+    A single sort orders both the groups and the rows within each group, so
+    the groups are filled in one pass. `rows` is sorted in place.
+
+    Returns:
+        dict: Rows by patient ID, in descending patient ID order.
+    """
+    rows.sort(key=_patient_newest_first_key, reverse=True)
+    grouped: Dict[Optional[int], List[OrderRow]] = {}
+    for row in rows:
+        patient_id = row.order.patient_id
+        group = grouped.get(patient_id)
+        if group is None:
+            group = grouped[patient_id] = []
+        group.append(row)
+    return grouped
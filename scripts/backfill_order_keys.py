@@ -0,0 +1,37 @@
+"""
+Backfill patient_id and event_datetime on existing OrderWorkList rows.
+
+Rows added before these columns existed have them empty. This looks up each
+such order in the ORDER table (or the local mirror when it is fresh), fills
+the columns in batches and then refreshes the stored worklist stats.
+
+Usage:
+    python scripts/backfill_order_keys.py [--batch-size 5000]
+"""
+
+import argparse
+import os
+import sys
+
+from sqlmodel import Session
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from restrack.api.core import local_engine
+from restrack.api.routers.orders import backfill_order_keys
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    print("Backfilling patient_id and event_datetime on worklist orders...")
+    with Session(local_engine) as session:
+        updated = backfill_order_keys(session, batch_size=args.batch_size)
+    print(f"Backfill complete: {updated} orders updated.")
+
+
+if __name__ == "__main__":
+    main()
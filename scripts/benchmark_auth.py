@@ -0,0 +1,106 @@
+"""
+Benchmark the authentication overhead of a browser request to the mounted API.
+
+Compares the previous flow, where the web middleware, the API middleware and
+the API dependency each decoded the token and the last two each looked the
+user up, with the shared per-request AuthContext.
+
+The test users live in a temporary SQLite file, not the application database.
+
+Usage:
+    python scripts/benchmark_auth.py [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from sqlmodel import Session, SQLModel, create_engine
+from starlette.requests import Request
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from restrack.api.auth import get_request_user
+from restrack.api.routers.users import get_user_by_username
+from restrack.auth import (
+    create_access_token,
+    decode_token,
+    get_auth_context,
+    get_token_from_request,
+    hash_password,
+)
+from restrack.models.worklist import User
+
+
+def make_request(token: str) -> Request:
+    """Build a fresh request carrying the token as the browser's cookie."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/worklists/",
+        "headers": [(b"cookie", f"access_token={token}".encode())],
+    }
+    return Request(scope)
+
+
+async def previous_flow(request: Request, session: Session):
+    """Three token decodes and two user queries, as before the shared context."""
+    for lookup in (False, True, True):
+        token = await get_token_from_request(request)
+        claims = decode_token(token)
+        if lookup:
+            user = get_user_by_username(claims.username, session)
+    return user
+
+
+async def context_flow(request: Request, session: Session):
+    """The same checks through the request's AuthContext."""
+    for _ in range(3):
+        await get_auth_context(request)
+    await get_request_user(request, session)
+    return await get_request_user(request, session)
+
+
+async def run(flow, token: str, session: Session, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        await flow(make_request(token), session)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'benchmark.db')}")
+        SQLModel.metadata.create_all(engine, tables=[User.__table__])
+        with Session(engine) as session:
+            session.add(
+                User(
+                    username="benchmark",
+                    email="benchmark@example.com",
+                    password=hash_password("benchmark"),
+                )
+            )
+            session.commit()
+
+            token = create_access_token(data={"sub": "benchmark"})
+            for name, flow in (
+                ("previous", previous_flow),
+                ("auth context", context_flow),
+            ):
+                elapsed = asyncio.run(run(flow, token, session, args.requests))
+                per_request = elapsed / args.requests * 1e6
+                print(f"{name:12} {elapsed:8.3f}s  {per_request:8.1f}us/request")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
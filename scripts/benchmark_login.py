@@ -0,0 +1,107 @@
+"""
+Benchmark password verification under concurrent logins.
+
+Runs a batch of concurrent logins on one event loop, first verifying inline
+as the login handlers used to, then on the password thread pool. Reports
+login throughput and the worst delay seen by a task ticking every 10ms on
+the same loop, i.e. how long other requests would have been held up.
+
+Logins are checked against users in a temporary SQLite file.
+
+Usage:
+    python scripts/benchmark_login.py [--logins 40] [--users 10] [--rounds 12]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from sqlmodel import Session, SQLModel, create_engine
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from restrack import auth
+from restrack.models.worklist import User
+
+
+async def login_inline(engine, username: str) -> bool:
+    with Session(engine) as session:
+        return auth.verify_password(username, "benchmark", session)
+
+
+async def login_pooled(engine, username: str) -> bool:
+    with Session(engine) as session:
+        return await auth.verify_password_async(username, "benchmark", session)
+
+
+async def run(login, engine, logins: int, users: int):
+    """Run the logins concurrently and return (elapsed, max loop delay)."""
+    max_delay = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal max_delay
+        while not done.is_set():
+            expected = time.perf_counter() + 0.01
+            await asyncio.sleep(0.01)
+            max_delay = max(max_delay, time.perf_counter() - expected)
+
+    ticking = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(login(engine, f"user{i % users}") for i in range(logins))
+    )
+    elapsed = time.perf_counter() - started
+    done.set()
+    await ticking
+    assert all(results), "a login failed"
+    return elapsed, max_delay
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=auth.BCRYPT_ROUNDS)
+    args = parser.parse_args()
+
+    auth.password_context.update(bcrypt__rounds=args.rounds)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'benchmark.db')}")
+        SQLModel.metadata.create_all(engine, tables=[User.__table__])
+        hashed_password = auth.hash_password("benchmark")
+        with Session(engine) as session:
+            for i in range(args.users):
+                session.add(
+                    User(
+                        username=f"user{i}",
+                        email=f"user{i}@example.com",
+                        password=hashed_password,
+                    )
+                )
+            session.commit()
+
+        print(
+            f"{args.logins} concurrent logins, bcrypt rounds {args.rounds}, "
+            f"{auth.PASSWORD_HASH_WORKERS} password threads"
+        )
+        for name, login in (("inline", login_inline), ("thread pool", login_pooled)):
+            elapsed, max_delay = asyncio.run(
+                run(login, engine, args.logins, args.users)
+            )
+            print(
+                f"{name:12} {args.logins / elapsed:8.1f} logins/s  "
+                f"max loop delay {max_delay * 1000:8.1f}ms"
+            )
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark shaping orders into orders table rows.
+
+Compares the previous shaping, a dict per order with a nested status dict,
+sorted and then grouped with itertools.groupby, with the slotted OrderRow
+rows grouped in a single pass. Reports the best time of several runs and the
+peak memory allocated while shaping, measured with tracemalloc.
+
+Usage:
+    python scripts/benchmark_order_rows.py [--orders 50000] [--patients 5000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta
+from itertools import groupby
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from restrack.models.cdm import ORDER
+from restrack.web.utils import (
+    build_order_rows,
+    get_status_class,
+    get_status_description,
+    group_order_rows,
+)
+
+
+def make_orders(orders: int, patients: int):
+    """Build ORDER rows and (order_id, status, note, priority) worklist statuses."""
+    base = datetime(2024, 1, 1)
+    rows = [
+        ORDER(
+            order_id=order_id,
+            visit_id=1,
+            event_id=order_id,
+            patient_id=random.randint(1, patients),
+            proc_id=1,
+            proc_name="procedure",
+            current_status=random.choice([1, 4, 6, None]),
+            event_datetime=base + timedelta(minutes=random.randint(0, 10**6)),
+        )
+        for order_id in range(1, orders + 1)
+    ]
+    statuses = [
+        (order_id, "reviewed", "note", "Routine")
+        for order_id in range(1, orders + 1, 3)
+    ]
+    return rows, statuses
+
+
+def previous_shape(orders, order_statuses):
+    """The previous shaping code of the worklist orders view."""
+    status_dict = {
+        status[0]: {"status": status[1], "note": status[2], "priority": status[3]}
+        for status in order_statuses
+    }
+    combined_orders = []
+    for order in orders:
+        system_status = None
+        system_status_text = None
+        system_status_class = None
+        if order.current_status is not None:
+            system_status = order.current_status
+            system_status_text = get_status_description(order.current_status)
+            system_status_class = get_status_class(order.current_status)
+        combined_orders.append(
+            {
+                "order": order,
+                "status": status_dict.get(
+                    order.order_id, {"status": None, "note": None}
+                ),
+                "system_status": system_status,
+                "system_status_text": system_status_text,
+                "system_status_class": system_status_class,
+            }
+        )
+    combined_orders.sort(
+        key=lambda x: (
+            x["order"].patient_id,
+            x["order"].event_datetime or datetime.min,
+        ),
+        reverse=True,
+    )
+    grouped_orders = {
+        patient_id: list(group)
+        for patient_id, group in groupby(
+            combined_orders, key=lambda x: x["order"].patient_id
+        )
+    }
+    return combined_orders, grouped_orders
+
+
+def row_shape(orders, order_statuses):
+    """The OrderRow shaping used by the worklist orders view."""
+    statuses = {
+        order_id: (status, note, priority)
+        for order_id, status, note, priority in order_statuses
+    }
+    rows = build_order_rows(orders, statuses)
+    return rows, group_order_rows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--orders", type=int, default=50000)
+    parser.add_argument("--patients", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    orders, statuses = make_orders(args.orders, args.patients)
+
+    for name, shape in (("previous", previous_shape), ("OrderRow", row_shape)):
+        elapsed = min(
+            timeit.repeat(
+                lambda: shape(list(orders), statuses), number=1, repeat=args.repeat
+            )
+        )
+
+        tracemalloc.start()
+        result = shape(list(orders), statuses)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+
+        print(f"{name:10} {elapsed * 1000:8.1f}ms  peak {peak / 2**20:7.1f}MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark per-row ORM updates against set-based bulk updates of OrderWorkList.
+
+The OrderWorkList rows are written to a temporary SQLite file.
+
+Usage:
+    python scripts/benchmark_order_updates.py [--orders 10000] [--worklists 2]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from sqlmodel import Session, SQLModel, create_engine, insert, select
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from restrack.api.bulk import bulk_update
+from restrack.models.worklist import OrderWorkList
+
+
+def seed(engine, orders: int, worklists: int):
+    """Create the table and put every order in every worklist."""
+    SQLModel.metadata.create_all(engine, tables=[OrderWorkList.__table__])
+    rows = [
+        {
+            "order_id": order_id,
+            "worklist_id": worklist_id,
+            "status": "",
+            "priority": "",
+            "user_note": "",
+        }
+        for worklist_id in range(1, worklists + 1)
+        for order_id in range(1, orders + 1)
+    ]
+    with Session(engine) as session:
+        for start in range(0, len(rows), 150):
+            session.exec(insert(OrderWorkList).values(rows[start : start + 150]))
+        session.commit()
+
+
+def update_per_row(engine, order_ids, status: str) -> int:
+    """The previous approach: one SELECT per order, then mutate ORM objects."""
+    updated = 0
+    with Session(engine) as session:
+        for order_id in order_ids:
+            statement = select(OrderWorkList).where(OrderWorkList.order_id == order_id)
+            for order in session.exec(statement).all():
+                order.status = status
+                updated += 1
+        session.commit()
+    return updated
+
+
+def update_bulk(engine, order_ids, status: str) -> int:
+    """The set-based approach: chunked UPDATE ... WHERE order_id IN (...)."""
+    with Session(engine) as session:
+        updated = bulk_update(
+            session, OrderWorkList, "order_id", order_ids, {"status": status}
+        )
+        session.commit()
+    return updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--orders", type=int, default=10000)
+    parser.add_argument("--worklists", type=int, default=2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'benchmark.db')}")
+        seed(engine, args.orders, args.worklists)
+        order_ids = list(range(1, args.orders + 1))
+
+        for name, run, status in (
+            ("per-row ORM", update_per_row, "reviewed"),
+            ("bulk UPDATE", update_bulk, "done"),
+        ):
+            started = time.perf_counter()
+            updated = run(engine, order_ids, status)
+            elapsed = time.perf_counter() - started
+            print(f"{name:12} {updated:>8} rows  {elapsed:8.3f}s")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
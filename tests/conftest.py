@@ -0,0 +1,179 @@
+"""
+Shared fixtures for the ResTrack tests.
+
+Both databases are throwaway SQLite files. The remote ORDER table lives in
+the "alan" schema, which SQLite provides as an attached database. Each test
+gets fresh tables loaded from tests/synthetic_data, plus ORDER rows for the
+orders the synthetic worklists reference.
+"""
+
+import csv
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+_tmp = tempfile.mkdtemp(prefix="restrack-tests-")
+os.environ["DB_RESTRACK"] = f"sqlite:///{_tmp}/restrack.db"
+os.environ["DB_CDM"] = f"sqlite:///{_tmp}/cdm.db"
+os.environ["ORDER_MIRROR_ENABLED"] = "false"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlmodel import Session, SQLModel  # noqa: E402
+
+from restrack.api.core import local_engine, remote_engine  # noqa: E402
+from restrack.api.routers.users import invalidate_cached_user  # noqa: E402
+from restrack.api.stats import refresh_worklist_stats  # noqa: E402
+from restrack.auth import create_access_token  # noqa: E402
+from restrack.web.app import app  # noqa: E402
+from restrack.models.cdm import ORDER  # noqa: E402
+from restrack.models.worklist import (  # noqa: E402
+    OrderWorkList,
+    User,
+    UserWorkList,
+    WorkList,
+)
+
+SYNTHETIC_DATA = Path(__file__).parent / "synthetic_data"
+
+
+@event.listens_for(local_engine, "connect")
+@event.listens_for(remote_engine, "connect")
+def _attach_cdm_schema(dbapi_connection, connection_record):
+    dbapi_connection.execute(f"ATTACH DATABASE '{_tmp}/alan.db' AS alan")
+
+
+def _read_csv(name: str) -> list:
+    with open(SYNTHETIC_DATA / name, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def make_order(order_id: int, patient_id: int, **values) -> ORDER:
+    """An ORDER row with an event_datetime derived from its ID."""
+    event_datetime = datetime(2024, 1, 1) + timedelta(hours=order_id)
+    return ORDER(
+        order_id=order_id,
+        visit_id=1,
+        event_id=order_id,
+        patient_id=patient_id,
+        proc_id=1,
+        proc_name=values.pop("proc_name", f"Procedure {order_id % 5}"),
+        current_status=values.pop("current_status", 1),
+        event_datetime=values.pop("event_datetime", event_datetime),
+        updated_at=event_datetime,
+        **values,
+    )
+
+
+@pytest.fixture
+def databases():
+    """Recreate both databases and load the synthetic data."""
+    for engine in (local_engine, remote_engine):
+        SQLModel.metadata.drop_all(engine)
+        SQLModel.metadata.create_all(engine)
+    invalidate_cached_user(*(row["username"] for row in _read_csv("user.csv")))
+
+    memberships = _read_csv("orderworklist.csv")
+    orders = {
+        int(row["order_id"]): make_order(
+            int(row["order_id"]), int(row["order_id"]) % 4 + 1
+        )
+        for row in memberships
+    }
+    with Session(remote_engine, expire_on_commit=False) as remote:
+        remote.add_all(orders.values())
+        remote.commit()
+
+    with Session(local_engine) as local:
+        for row in _read_csv("user.csv"):
+            local.add(
+                User(
+                    id=int(row["id"]),
+                    username=row["username"],
+                    email=row["email"],
+                    password=row["password"],
+                    must_change_password=False,
+                )
+            )
+        local.flush()
+        for row in _read_csv("worklist.csv"):
+            local.add(
+                WorkList(
+                    id=int(row["id"]),
+                    name=row["name"],
+                    description=row["description"],
+                    created_by=int(row["created_by"]),
+                )
+            )
+        local.flush()
+        for row in _read_csv("userworklist.csv"):
+            local.add(
+                UserWorkList(
+                    id=int(row["id"]),
+                    user_id=int(row["user_id"]),
+                    worklist_id=int(row["worklist_id"]),
+                    role=row["role"],
+                )
+            )
+        for row in memberships:
+            order = orders[int(row["order_id"])]
+            local.add(
+                OrderWorkList(
+                    id=int(row["id"]),
+                    order_id=order.order_id,
+                    worklist_id=int(row["worklist_id"]),
+                    patient_id=order.patient_id,
+                    event_datetime=order.event_datetime,
+                )
+            )
+        local.flush()
+        refresh_worklist_stats(
+            local, [int(row["id"]) for row in _read_csv("worklist.csv")]
+        )
+        local.commit()
+    yield
+
+
+@pytest.fixture
+def client(databases):
+    """A test client signed in as the synthetic admin user."""
+    with TestClient(app) as test_client:
+        test_client.cookies.set(
+            "access_token", create_access_token(data={"sub": "admin"})
+        )
+        yield test_client
+
+
+@pytest.fixture
+def count_statements():
+    """
+    Count the SQL statements run on each engine within a block.
+
+    Usage:
+        with count_statements() as counts:
+            ...
+        counts["local"], counts["remote"]
+    """
+
+    @contextmanager
+    def counting():
+        counts = {"local": 0, "remote": 0}
+        listeners = {}
+        for name, engine in (("local", local_engine), ("remote", remote_engine)):
+
+            def count(*args, name=name):
+                counts[name] += 1
+
+            listeners[engine] = count
+            event.listen(engine, "before_cursor_execute", count)
+        try:
+            yield counts
+        finally:
+            for engine, count in listeners.items():
+                event.remove(engine, "before_cursor_execute", count)
+
+    return counting
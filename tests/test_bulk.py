@@ -0,0 +1,47 @@
+"""
+Tests for the set-based bulk operations.
+"""
+
+from sqlmodel import Session, func, select
+
+from restrack.api import bulk
+from restrack.api.core import local_engine
+from restrack.models.worklist import OrderWorkList
+
+KEYS = ["worklist_id", "order_id"]
+
+
+def membership(order_id: int) -> dict:
+    return {"worklist_id": 1, "order_id": order_id, "status": "", "priority": ""}
+
+
+def test_insert_missing_retries_after_a_concurrent_insert(databases, monkeypatch):
+    """The lookup-then-insert path used on SQL Server survives another request
+    inserting one of the keys between its lookup and its INSERT."""
+    rows = [membership(order_id) for order_id in (700001, 700002, 700003)]
+    with Session(local_engine) as session:
+        real_exec = session.exec
+        raced = []
+
+        def exec_with_race(statement, *args, **kwargs):
+            result = real_exec(statement, *args, **kwargs)
+            if not raced and statement.is_select:
+                raced.append(True)
+                result = list(result)
+                with Session(local_engine) as other:
+                    other.add(OrderWorkList(**membership(700002)))
+                    other.commit()
+            return result
+
+        monkeypatch.setattr(session, "exec", exec_with_race)
+        assert bulk._insert_missing(session, OrderWorkList, rows, KEYS) == 2
+        session.commit()
+
+    with Session(local_engine) as session:
+        count = session.exec(
+            select(func.count()).where(
+                OrderWorkList.worklist_id == 1,
+                OrderWorkList.order_id.in_([700001, 700002, 700003]),
+            )
+        ).one()
+    assert raced and count == 3
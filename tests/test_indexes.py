@@ -0,0 +1,85 @@
+"""
+Index usage of the hot worklist queries.
+
+Applies migration 5e1f0c7a9d42, which indexes the worklist association
+tables, to a database without those indexes, and checks with EXPLAIN QUERY
+PLAN that the queries it was written for use them.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlmodel import SQLModel
+
+from restrack.api.routers.orders import order_memberships_statement
+from restrack.api.routers.worklists import user_worklists_statement
+from restrack.models.worklist import OrderWorkList, User, UserWorkList, WorkList
+
+ALEMBIC_DIR = Path(__file__).parent.parent / "alembic"
+INDEX_REVISION = "5e1f0c7a9d42"
+PREVIOUS_REVISION = "81002a25e3ae"
+
+# A user's worklists, as listed on every page of the web app
+USER_WORKLISTS = user_worklists_statement(1)
+# The worklist memberships of a page of orders, as in a patient search
+ORDER_MEMBERSHIPS = order_memberships_statement([8034, 8035, 8036])
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """A database at the revision before the indexes were added."""
+    url = f"sqlite:///{tmp_path}/restrack.db"
+    engine = create_engine(url)
+    SQLModel.metadata.create_all(
+        engine,
+        tables=[
+            User.__table__,
+            WorkList.__table__,
+            UserWorkList.__table__,
+            OrderWorkList.__table__,
+        ],
+    )
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_orderworklist_order_id"))
+        connection.execute(text("DROP INDEX ix_userworklist_user_id_worklist_id"))
+
+    # No config file, so alembic leaves the logging configuration alone
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    config.set_main_option("sqlalchemy.url", url)
+    command.stamp(config, PREVIOUS_REVISION)
+    engine.alembic_config = config
+    yield engine
+    engine.dispose()
+
+
+def query_plan(engine, statement) -> str:
+    compiled = statement.compile(
+        dialect=engine.dialect, compile_kwargs={"literal_binds": True}
+    )
+    with engine.connect() as connection:
+        rows = connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+@pytest.mark.parametrize(
+    "statement, table, index",
+    [
+        (USER_WORKLISTS, "userworklist", "ix_userworklist_user_id_worklist_id"),
+        (ORDER_MEMBERSHIPS, "orderworklist", "ix_orderworklist_order_id"),
+    ],
+)
+def test_migration_indexes_are_used(engine, statement, table, index):
+    assert index not in query_plan(engine, statement)
+
+    command.upgrade(engine.alembic_config, INDEX_REVISION)
+
+    # sqlite3 caches the statement prepared before the upgrade per connection
+    engine.dispose()
+    plan = query_plan(engine, statement)
+    assert re.search(rf"SEARCH {table} USING (COVERING )?INDEX {index}\b", plan)
+    assert f"SCAN {table}" not in plan
@@ -0,0 +1,72 @@
+"""
+Tests for the local ORDER mirror sync.
+"""
+
+from datetime import datetime, timedelta
+
+from sqlmodel import Session, select
+
+from restrack.api import mirror
+from restrack.api.core import local_engine, remote_engine
+from restrack.models.cdm import ORDER, ORDER_MIRROR, ORDER_MIRROR_STATE
+
+from conftest import make_order
+
+
+def mirrored_ids() -> set:
+    with Session(local_engine) as local:
+        return set(local.exec(select(ORDER_MIRROR.order_id)).all())
+
+
+def remote_ids() -> set:
+    with Session(remote_engine) as remote:
+        return set(remote.exec(select(ORDER.order_id)).all())
+
+
+def test_orders_without_timestamps_are_synced(databases):
+    mirror.sync_order_mirror()
+
+    with Session(remote_engine) as remote:
+        for order_id in (900001, 900002):
+            order = make_order(order_id, patient_id=1)
+            order.updated_at = order.last_edit_time = None
+            remote.add(order)
+        remote.commit()
+
+    # Both, plus the row at the watermark, which is always read again
+    assert mirror.sync_order_mirror()["rows"] == 3
+    assert mirrored_ids() == remote_ids()
+    assert mirror.sync_order_mirror()["rows"] == 1
+
+
+def test_orders_deleted_remotely_are_removed(databases, monkeypatch):
+    mirror.sync_order_mirror()
+    deleted = sorted(remote_ids())[::4]
+    with Session(remote_engine) as remote:
+        for order_id in deleted:
+            remote.delete(remote.get(ORDER, order_id))
+        remote.commit()
+
+    monkeypatch.setattr(mirror, "ORDER_MIRROR_BATCH_SIZE", 3)
+    monkeypatch.setattr(mirror, "ORDER_MIRROR_RECONCILE_INTERVAL", 0)
+    assert mirror.sync_order_mirror()["removed"] == len(deleted)
+    assert mirrored_ids() == remote_ids()
+
+
+def test_sync_is_skipped_while_another_worker_holds_the_lock(databases):
+    with Session(local_engine) as local:
+        assert mirror._acquire_lock(local, "other-worker")
+
+    assert mirror.sync_order_mirror() is None
+    assert mirrored_ids() == set()
+
+    # An expired lock is taken over
+    with Session(local_engine) as local:
+        state = local.get(ORDER_MIRROR_STATE, 1)
+        state.locked_until = datetime.now() - timedelta(seconds=1)
+        local.add(state)
+        local.commit()
+    assert mirror.sync_order_mirror()["rows"] == len(remote_ids())
+
+    with Session(local_engine) as local:
+        assert local.get(ORDER_MIRROR_STATE, 1).locked_by is None
@@ -0,0 +1,71 @@
+"""
+Statement-count regression tests for the order endpoints.
+
+Worklist statuses used to be looked up once per order, so a patient with
+hundreds of orders cost hundreds of statements. The number of statements
+must stay fixed however many orders are returned.
+"""
+
+from sqlmodel import Session
+
+from restrack.api.core import local_engine, remote_engine
+from restrack.models.worklist import OrderWorkList
+
+from conftest import make_order
+
+
+def add_patient_orders(patient_id: int, count: int, worklist_ids=(1, 2)):
+    """Give a patient `count` more orders, each in every worklist given."""
+    first_order_id = 100000 + patient_id * 1000
+    with (
+        Session(remote_engine, expire_on_commit=False) as remote,
+        Session(local_engine) as local,
+    ):
+        for order_id in range(first_order_id, first_order_id + count):
+            order = make_order(order_id, patient_id)
+            remote.add(order)
+            for worklist_id in worklist_ids:
+                local.add(
+                    OrderWorkList(
+                        order_id=order_id,
+                        worklist_id=worklist_id,
+                        patient_id=patient_id,
+                        event_datetime=order.event_datetime,
+                    )
+                )
+        remote.commit()
+        local.commit()
+
+
+def test_patient_search_statement_count_is_fixed(client, count_statements):
+    add_patient_orders(patient_id=7, count=3)
+    add_patient_orders(patient_id=8, count=150)
+    # Warm the per-request authentication caches
+    client.get("/api/v1/orders_for_patient/7")
+
+    counts = {}
+    for patient_id in (7, 8):
+        with count_statements() as counts[patient_id]:
+            response = client.get(f"/api/v1/orders_for_patient/{patient_id}?limit=200")
+        assert response.status_code == 200
+
+    orders, statuses, _ = response.json()
+    assert len(orders) == 150
+    # Every worklist membership of every order is returned
+    assert len(statuses) == 300
+    # A patient check and the page remotely, one status lookup locally
+    assert counts[7] == counts[8] == {"local": 1, "remote": 2}
+
+
+def test_worklist_orders_statement_count_is_fixed(client, count_statements):
+    client.get("/api/v1/worklist_orders/3")
+    with count_statements() as small:
+        response = client.get("/api/v1/worklist_orders/3")
+    assert len(response.json()[0]) == 11
+
+    add_patient_orders(patient_id=9, count=150, worklist_ids=(3,))
+    with count_statements() as large:
+        response = client.get("/api/v1/worklist_orders/3?limit=200")
+    assert len(response.json()[0]) == 161
+
+    assert small == large == {"local": 1, "remote": 1}
@@ -0,0 +1,59 @@
+"""
+Tests for keyset pagination of worklist orders.
+
+A page can span several remote chunks, each sorted by the database, which are
+merged and sorted again in Python. Paging through a worklist must return
+every order exactly once, in the same order whichever database sorted it.
+"""
+
+import pytest
+from sqlmodel import Session, select
+
+from restrack.api import remote
+from restrack.api.core import local_engine, remote_engine
+from restrack.models.cdm import ORDER
+from restrack.models.worklist import OrderWorkList
+
+PROC_NAMES = ["apple", "Banana", "APPLE", None, "banana", "Apple", "cherry"]
+
+
+def page_through(client, url: str) -> list:
+    """Follow the cursors from `url` and return every order fetched."""
+    orders = []
+    cursor = None
+    while True:
+        response = client.get(f"{url}&cursor={cursor}" if cursor else url)
+        assert response.status_code == 200
+        page, _, cursor = response.json()
+        orders.extend(page)
+        if not cursor:
+            return orders
+
+
+@pytest.mark.parametrize("sort", ["proc_name", "-proc_name"])
+def test_mixed_case_sort_spans_chunks(client, monkeypatch, sort):
+    monkeypatch.setattr(remote, "REMOTE_FETCH_CHUNK_SIZE", 4)
+    with Session(local_engine) as session:
+        order_ids = session.exec(
+            select(OrderWorkList.order_id).where(OrderWorkList.worklist_id == 3)
+        ).all()
+    with Session(remote_engine) as session:
+        for i, order_id in enumerate(sorted(order_ids)):
+            session.get(ORDER, order_id).proc_name = PROC_NAMES[i % len(PROC_NAMES)]
+        session.commit()
+
+    orders = page_through(client, f"/api/v1/worklist_orders/3?sort={sort}&limit=3")
+
+    descending = sort.startswith("-")
+    named = sorted(
+        (order for order in orders if order["proc_name"] is not None),
+        key=lambda order: (order["proc_name"].lower(), order["order_id"]),
+        reverse=descending,
+    )
+    unnamed = sorted(
+        (order for order in orders if order["proc_name"] is None),
+        key=lambda order: order["order_id"],
+        reverse=descending,
+    )
+    assert sorted(order["order_id"] for order in orders) == sorted(order_ids)
+    assert orders == named + unnamed
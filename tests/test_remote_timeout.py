@@ -0,0 +1,79 @@
+"""
+Tests for slow remote queries.
+
+A remote fetch that outlives REMOTE_FETCH_TIMEOUT fails its own request with
+a 504, and while it runs the event loop stays free for other requests.
+"""
+
+import logging
+import threading
+import time
+
+import pytest
+from sqlmodel import Session
+
+from restrack.api import remote
+
+
+@pytest.fixture
+def slow_remote(monkeypatch):
+    """
+    Make every remote chunk query block until released.
+
+    Yields:
+        tuple: (entered, release) events. `entered` is set once a query is
+            blocked; setting `release` lets the queries finish.
+    """
+    entered = threading.Event()
+    release = threading.Event()
+
+    class SlowSession(Session):
+        def exec(self, *args, **kwargs):
+            entered.set()
+            release.wait(5)
+            return super().exec(*args, **kwargs)
+
+    monkeypatch.setattr(remote, "Session", SlowSession)
+    yield entered, release
+    release.set()
+
+
+def test_slow_remote_query_times_out(client, slow_remote, monkeypatch, caplog):
+    monkeypatch.setattr(remote, "REMOTE_FETCH_TIMEOUT", 0.2)
+
+    started = time.monotonic()
+    with caplog.at_level(logging.ERROR):
+        response = client.get("/api/v1/worklist_orders/1")
+    elapsed = time.monotonic() - started
+
+    assert response.status_code == 504
+    assert response.json() == {"detail": "Remote database query timed out"}
+    assert elapsed < 2
+    assert any(
+        record.levelno == logging.ERROR and "timed out after 0.2s" in record.message
+        for record in caplog.records
+    )
+
+
+def test_slow_remote_query_does_not_block_other_requests(
+    client, slow_remote, monkeypatch
+):
+    monkeypatch.setattr(remote, "REMOTE_FETCH_TIMEOUT", 10)
+    entered, release = slow_remote
+
+    responses = {}
+    slow = threading.Thread(
+        target=lambda: responses.update(slow=client.get("/worklists/1/orders"))
+    )
+    slow.start()
+    assert entered.wait(5)
+
+    started = time.monotonic()
+    response = client.get("/worklists/selector/fast")
+    elapsed = time.monotonic() - started
+
+    release.set()
+    slow.join(5)
+    assert response.status_code == 200
+    assert elapsed < 1
+    assert responses["slow"].status_code == 200
@@ -0,0 +1,53 @@
+"""
+Tests for the worklist orders table of the web app.
+
+The default view groups orders by patient and loads further pages as the
+table is scrolled. Each patient must appear under one header, with all their
+orders together, however the pages fall.
+"""
+
+import html
+import re
+
+from sqlmodel import Session, select
+
+from restrack.api import pagination
+from restrack.api.core import remote_engine
+from restrack.models.cdm import ORDER
+
+
+def scroll_through(client, url: str) -> list:
+    """Load every page of the orders table, as infinite scroll would."""
+    pages = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        pages.append(response.text)
+        more = re.search(r'hx-get="([^"]+)" hx-trigger="revealed"', response.text)
+        url = html.unescape(more.group(1)) if more else None
+    return pages
+
+
+def test_grouped_pages_keep_patients_together(client, monkeypatch):
+    monkeypatch.setattr(pagination, "ORDERS_PAGE_SIZE", 3)
+
+    pages = scroll_through(client, "/worklists/3/orders")
+    table = "".join(pages)
+
+    headers = [int(id) for id in re.findall(r"Patient ID: (\d+)", table)]
+    order_ids = [int(id) for id in re.findall(r'order-checkbox" value="(\d+)"', table)]
+    with Session(remote_engine) as session:
+        patients = dict(
+            session.exec(
+                select(ORDER.order_id, ORDER.patient_id).where(
+                    ORDER.order_id.in_(order_ids)
+                )
+            ).all()
+        )
+    row_patients = [patients[order_id] for order_id in order_ids]
+
+    assert len(pages) == 4
+    assert len(order_ids) == len(set(order_ids)) == 11
+    # Highest patient ID first, each patient's orders together
+    assert row_patients == sorted(row_patients, reverse=True)
+    assert headers == list(dict.fromkeys(row_patients))